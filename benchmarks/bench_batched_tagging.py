@@ -0,0 +1,34 @@
+"""
+Compares tagging every line on its own with batched tagging, see `JapaneseFrequencyList.tag_batch_size`.
+
+tests/bigtext2.txt is made of short lines, like subtitles or chat logs, so per call overhead dominates.
+"""
+
+from common import TEXT_CORPORA, Measurement, best_time, per_second, read_corpus
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+
+TAG_BATCH_SIZES = (0, 1024, 8192, 65536)
+NUMBER = 10
+
+
+def bench_tag_batch_size(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Lines per second of `JapaneseFrequencyList.process_text` on tests/bigtext2.txt for several tag batch sizes.
+    """
+    text = read_corpus(TEXT_CORPORA["bigtext2"])
+    lines = text.count("\n") + 1
+    results = {}
+
+    for tag_batch_size in TAG_BATCH_SIZES:
+        freq_list = JapaneseFrequencyList(tag_batch_size=tag_batch_size)
+
+        def process() -> None:
+            freq_list.clear()
+            freq_list.process_text(text)
+
+        process()
+        results[str(tag_batch_size)] = per_second(
+            lines / best_time(process, repeat_count, NUMBER), "lines"
+        )
+
+    return results
@@ -0,0 +1,61 @@
+"""
+Compares threads feeding one list through `ConcurrentJapaneseFrequencyList` with a list guarded by a single lock.
+
+Four threads each process a quarter of the lines of the bundled text corpora, one `process_line` call at a time.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from common import TEXT_CORPORA, Measurement, best_time, per_second, read_corpus
+from jpfreq.concurrent_frequency_list import ConcurrentJapaneseFrequencyList
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+
+THREADS = 4
+
+
+def bench_threads(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Lines per second with `THREADS` threads feeding one list, locked per line or buffered.
+    """
+    lines = [
+        line
+        for file_path in TEXT_CORPORA.values()
+        for line in read_corpus(file_path).split("\n")
+    ]
+    shares = [lines[start::THREADS] for start in range(THREADS)]
+
+    locked_list = JapaneseFrequencyList()
+    lock = threading.Lock()
+
+    def process_locked(share: list[str]) -> None:
+        for line in share:
+            with lock:
+                locked_list.process_line(line)
+
+    concurrent_list = ConcurrentJapaneseFrequencyList()
+
+    def process_concurrent(share: list[str]) -> None:
+        for line in share:
+            concurrent_list.process_line(line)
+
+    results = {}
+    # The threads outlive each run, like the handler threads of a server, so their Taggers are reused
+    executor = ThreadPoolExecutor(max_workers=THREADS)
+
+    for name, freq_list, process in (
+        ("locked", locked_list, process_locked),
+        ("concurrent", concurrent_list, process_concurrent),
+    ):
+
+        def run() -> None:
+            freq_list.clear()
+            list(executor.map(process, shares))
+            freq_list.generate_text_info()
+
+        run()
+        results[name] = per_second(len(lines) / best_time(run, repeat_count), "lines")
+
+    executor.shutdown()
+
+    return results
@@ -0,0 +1,26 @@
+"""
+Export time of a list built from all bundled text corpora.
+"""
+
+from bench_queries import build_list
+from common import Measurement, best_time, seconds
+from jpfreq.exporters.json import JsonExporter
+
+NUMBER = 10
+
+
+def bench_json_export(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Time of `JsonExporter.export`, for the top 100 words and for every word.
+    """
+    freq_list = build_list()
+    exporter = JsonExporter()
+
+    return {
+        f"limit{limit}": seconds(
+            best_time(
+                lambda: exporter.export(freq_list, limit=limit), repeat_count, NUMBER
+            )
+        )
+        for limit in (100, -1)
+    }
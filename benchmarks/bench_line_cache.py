@@ -0,0 +1,52 @@
+"""
+Compares processing a repetitive corpus with and without the line cache, see `JapaneseFrequencyList.line_cache_size`.
+
+The corpus mimics chat logs: the lines of tests/bigtext2.txt mixed with short replies that repeat constantly.
+"""
+
+import random
+
+from common import TEXT_CORPORA, Measurement, best_time, per_second, read_corpus
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+
+REPLIES = ("はい", "そうですね", "ありがとうございます", "了解です", "よろしくお願いします")
+LINES = 5000
+REPLY_FRACTION = 0.7
+LINE_CACHE_SIZES = (0, 4096)
+
+
+def repetitive_corpus() -> str:
+    """
+    The same repetitive corpus on every run.
+    """
+    lines = read_corpus(TEXT_CORPORA["bigtext2"]).split("\n")
+    generator = random.Random(0)
+
+    return "\n".join(
+        generator.choice(REPLIES)
+        if generator.random() < REPLY_FRACTION
+        else generator.choice(lines)
+        for _ in range(LINES)
+    )
+
+
+def bench_line_cache_size(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Lines per second of `JapaneseFrequencyList.process_text` on a repetitive corpus for several line cache sizes.
+    """
+    text = repetitive_corpus()
+    results = {}
+
+    for line_cache_size in LINE_CACHE_SIZES:
+        freq_list = JapaneseFrequencyList(line_cache_size=line_cache_size)
+
+        def process() -> None:
+            freq_list.clear()
+            freq_list.process_text(text)
+
+        process()
+        results[str(line_cache_size)] = per_second(
+            LINES / best_time(process, repeat_count), "lines"
+        )
+
+    return results
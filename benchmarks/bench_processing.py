@@ -0,0 +1,115 @@
+"""
+Ingestion throughput and peak memory on the bundled text corpora.
+"""
+
+import tracemalloc
+
+from common import (
+    HTML_CORPORA,
+    TEXT_CORPORA,
+    Measurement,
+    best_time,
+    per_second,
+    read_corpus,
+    size,
+)
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+
+
+def count_tokens(file_path: str, html: bool = False) -> int:
+    """
+    The number of tokens the Tagger produces for a corpus, valid or not.
+    """
+    freq_list = JapaneseFrequencyList(collect_stats=True)
+
+    if html:
+        freq_list.process_html_file(file_path)
+    else:
+        freq_list.process_file(file_path)
+
+    return freq_list.stats.tokens
+
+
+def bench_process_file(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Tokens per second of `JapaneseFrequencyList.process_file`.
+    """
+    freq_list = JapaneseFrequencyList()
+    results = {}
+
+    for name, file_path in TEXT_CORPORA.items():
+
+        def process() -> None:
+            freq_list.clear()
+            freq_list.process_file(file_path)
+
+        process()
+        tokens = count_tokens(file_path)
+        results[name] = per_second(tokens / best_time(process, repeat_count), "tokens")
+
+    return results
+
+
+def bench_process_text(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Tokens per second of `JapaneseFrequencyList.process_text`, with the text already in memory.
+    """
+    freq_list = JapaneseFrequencyList()
+    results = {}
+
+    for name, file_path in TEXT_CORPORA.items():
+        text = read_corpus(file_path)
+
+        def process() -> None:
+            freq_list.clear()
+            freq_list.process_text(text)
+
+        process()
+        tokens = count_tokens(file_path)
+        results[name] = per_second(tokens / best_time(process, repeat_count), "tokens")
+
+    return results
+
+
+def bench_process_html_file(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Tokens per second of `JapaneseFrequencyList.process_html_file`, including parsing the HTML.
+    """
+    freq_list = JapaneseFrequencyList()
+    results = {}
+
+    for name, file_path in HTML_CORPORA.items():
+
+        def process() -> None:
+            freq_list.clear()
+            freq_list.process_html_file(file_path)
+
+        process()
+        tokens = count_tokens(file_path, html=True)
+        results[name] = per_second(tokens / best_time(process, repeat_count), "tokens")
+
+    return results
+
+
+def bench_peak_memory(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Peak Python memory allocated while a new list processes a corpus.
+
+    Memory allocated by MeCab itself isn't traced, so this measures the frequency list and the Words it creates.
+    """
+    freq_list = JapaneseFrequencyList()
+    results = {}
+
+    for name, file_path in TEXT_CORPORA.items():
+        freq_list.clear()
+        tracemalloc.start()
+
+        try:
+            freq_list.process_file(file_path)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        results[name] = size(peak)
+
+    return results
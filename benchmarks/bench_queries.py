@@ -0,0 +1,50 @@
+"""
+Query latency on a list built from all bundled text corpora.
+"""
+
+from common import TEXT_CORPORA, Measurement, best_time, seconds
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+
+NUMBER = 100
+
+
+def build_list() -> JapaneseFrequencyList:
+    """
+    A frequency list of every bundled text corpus.
+    """
+    freq_list = JapaneseFrequencyList()
+    freq_list.process_files(list(TEXT_CORPORA.values()))
+
+    return freq_list
+
+
+def bench_get_most_frequent(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Latency of `JapaneseFrequencyList.get_most_frequent` for common limits and ranges.
+    """
+    freq_list = build_list()
+    queries = {
+        "top100": {"limit": 100},
+        "all": {"limit": -1},
+        "range": {"limit": -1, "minimum": 2, "maximum": 10},
+    }
+
+    return {
+        name: seconds(
+            best_time(
+                lambda: freq_list.get_most_frequent(**query), repeat_count, NUMBER
+            )
+        )
+        for name, query in queries.items()
+    }
+
+
+def bench_generate_text_info(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Latency of `JapaneseFrequencyList.generate_text_info`.
+    """
+    freq_list = build_list()
+
+    return {
+        "all": seconds(best_time(freq_list.generate_text_info, repeat_count, NUMBER))
+    }
@@ -0,0 +1,53 @@
+"""
+Startup cost: importing the package, creating the Tagger and creating frequency lists.
+"""
+
+import subprocess
+import sys
+
+from common import Measurement, best_time, seconds
+from fugashi import Tagger
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+
+IMPORTED_MODULES = ("jpfreq.main", "jpfreq.jp_frequency_list")
+
+
+def bench_import(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Time to start a new interpreter and import a module, next to starting one that imports nothing.
+
+    This is what a short-lived command line job or a freshly spawned worker pays before doing any work.
+    """
+
+    def start(code: str) -> None:
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    results = {"interpreter": seconds(best_time(lambda: start("pass"), repeat_count))}
+
+    for module in IMPORTED_MODULES:
+        results[module] = seconds(
+            best_time(lambda: start(f"import {module}"), repeat_count)
+        )
+
+    return results
+
+
+def bench_tagger(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Time to create a Tagger, which loads the MeCab dictionary.
+    """
+    return {"create": seconds(best_time(lambda: Tagger("-Owakati"), repeat_count))}
+
+
+def bench_frequency_list(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Time to create a JapaneseFrequencyList, which defers creating its Tagger, and to tag its first line.
+    """
+
+    def create_and_tag() -> None:
+        JapaneseFrequencyList().process_line("日本")
+
+    return {
+        "create": seconds(best_time(JapaneseFrequencyList, repeat_count)),
+        "create_and_tag": seconds(best_time(create_and_tag, repeat_count)),
+    }
@@ -0,0 +1,66 @@
+"""
+Measures a sliding window over the lines of the bundled text corpora, see `WindowedJapaneseFrequencyList`.
+
+Every line is added as a document, and once the window is full each new document expires the oldest one.
+"""
+
+from common import TEXT_CORPORA, Measurement, best_time, per_second, read_corpus
+from jpfreq.windowed_frequency_list import WindowedJapaneseFrequencyList
+
+WINDOW_SIZES = (50, 500)
+
+
+def documents() -> list[str]:
+    """
+    The non-empty lines of the bundled text corpora.
+    """
+    return [
+        line
+        for file_path in TEXT_CORPORA.values()
+        for line in read_corpus(file_path).split("\n")
+        if line
+    ]
+
+
+def bench_add_document(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Documents per second of `add_document` for several window sizes, including the expiry of old documents.
+    """
+    lines = documents()
+    results = {}
+
+    for window_size in WINDOW_SIZES:
+        freq_list = WindowedJapaneseFrequencyList(max_documents=window_size)
+
+        def process() -> None:
+            freq_list.clear()
+
+            for line in lines:
+                freq_list.add_document(line, timestamp=0)
+
+        process()
+        results[str(window_size)] = per_second(
+            len(lines) / best_time(process, repeat_count), "documents"
+        )
+
+    return results
+
+
+def bench_query(repeat_count: int) -> dict[str, Measurement]:
+    """
+    Queries per second of `get_most_frequent` and `generate_text_info` on a full window.
+    """
+    freq_list = WindowedJapaneseFrequencyList(max_documents=WINDOW_SIZES[-1])
+
+    for line in documents():
+        freq_list.add_document(line, timestamp=0)
+
+    def query() -> None:
+        freq_list.get_most_frequent(10)
+        freq_list.generate_text_info()
+
+    return {
+        "top10_and_text_info": per_second(
+            1 / best_time(query, repeat_count, 100), "queries"
+        )
+    }
@@ -0,0 +1,96 @@
+"""
+Helpers shared by the benchmarks, see `run.py`.
+"""
+
+from os.path import abspath, dirname, join
+from timeit import repeat
+from typing import Callable, NamedTuple
+
+CORPUS_DIRECTORY = join(dirname(dirname(abspath(__file__))), "tests")
+
+TEXT_CORPORA = {
+    "bigtext1": join(CORPUS_DIRECTORY, "bigtext1.txt"),
+    "bigtext2": join(CORPUS_DIRECTORY, "bigtext2.txt"),
+}
+"""The bundled plain text corpora, by name."""
+
+HTML_CORPORA = {
+    "bigsite1": join(CORPUS_DIRECTORY, "bigsite1.html"),
+}
+"""The bundled HTML corpora, by name."""
+
+DEFAULT_REPEAT = 5
+"""The default number of times each timing is repeated, keeping the best."""
+
+
+class Measurement(NamedTuple):
+    """
+    The result of a single benchmark.
+    """
+
+    value: float
+    """The measured value."""
+    unit: str
+    """The unit of the value, e.g. "s" or "tokens/s"."""
+    higher_is_better: bool
+    """Whether a higher value is an improvement."""
+
+
+def read_corpus(file_path: str) -> str:
+    """
+    Reads a bundled corpus.
+    Parameters
+    ----------
+    file_path : str
+        The path of the corpus.
+
+    Returns
+    -------
+    str
+        The text of the corpus.
+    """
+    with open(file_path, "r", encoding="utf-8") as fs:
+        return fs.read()
+
+
+def best_time(
+    function: Callable[[], object], repeat_count: int, number: int = 1
+) -> float:
+    """
+    Times a function, keeping the best of several repeats to filter out noise.
+    Parameters
+    ----------
+    function : Callable[[], object]
+        The function to time.
+    repeat_count : int
+        The number of times to repeat the timing.
+    number : int
+        The number of calls in each timing.
+
+    Returns
+    -------
+    float
+        The best time of a single call, in seconds.
+    """
+    return min(repeat(function, number=number, repeat=repeat_count)) / number
+
+
+def seconds(value: float) -> Measurement:
+    """
+    A duration, where lower is better.
+    """
+    return Measurement(value, "s", False)
+
+
+def per_second(value: float, unit: str) -> Measurement:
+    """
+    A throughput, where higher is better.
+    """
+    return Measurement(value, f"{unit}/s", True)
+
+
+def size(value: float) -> Measurement:
+    """
+    A size in bytes, where lower is better.
+    """
+    return Measurement(value, "B", False)
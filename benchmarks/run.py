@@ -0,0 +1,199 @@
+"""
+Runs the benchmark suite, writes the results as JSON and compares them with a stored baseline.
+
+Every `bench_*` function in the `bench_*.py` modules of this directory takes the number of repeats and returns
+a dictionary of named `common.Measurement`s. Run it from the repository root after installing the package:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline results.json --threshold 0.1
+
+Comparing with a baseline exits with status 1 if any measurement got worse by more than the threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from glob import glob
+from importlib import import_module
+from os.path import basename, dirname, abspath, join, splitext
+
+from common import DEFAULT_REPEAT, Measurement
+
+BENCHMARK_DIRECTORY = dirname(abspath(__file__))
+
+DEFAULT_THRESHOLD = 0.1
+"""The default fraction a measurement may get worse by before it is flagged as a regression."""
+
+
+def discover(name_filter: str = "") -> dict:
+    """
+    Finds the benchmark functions.
+    Parameters
+    ----------
+    name_filter : str
+        Only benchmarks whose name contains this are returned.
+
+    Returns
+    -------
+    dict
+        The benchmark functions, by name, e.g. "processing.process_file".
+    """
+    benchmarks = {}
+
+    for file_path in sorted(glob(join(BENCHMARK_DIRECTORY, "bench_*.py"))):
+        module_name = splitext(basename(file_path))[0]
+        module = import_module(module_name)
+
+        for attribute in dir(module):
+            function = getattr(module, attribute)
+
+            if not attribute.startswith("bench_") or not callable(function):
+                continue
+
+            name = f"{module_name[len('bench_'):]}.{attribute[len('bench_'):]}"
+
+            if name_filter in name:
+                benchmarks[name] = function
+
+    return benchmarks
+
+
+def run(benchmarks: dict, repeat_count: int) -> dict[str, Measurement]:
+    """
+    Runs benchmark functions, printing each result as it is measured.
+    Parameters
+    ----------
+    benchmarks : dict
+        The benchmark functions, by name.
+    repeat_count : int
+        The number of times each timing is repeated.
+
+    Returns
+    -------
+    dict[str, Measurement]
+        The measurements, by name, e.g. "processing.process_file[bigtext1]".
+    """
+    results = {}
+
+    for name, function in benchmarks.items():
+        for key, measurement in function(repeat_count).items():
+            result_name = f"{name}[{key}]"
+            results[result_name] = measurement
+            print(f"{result_name:<50} {measurement.value:>14.6g} {measurement.unit}")
+
+    return results
+
+
+def to_json(results: dict[str, Measurement]) -> dict:
+    """
+    Converts measurements to a JSON document describing the environment they were measured in.
+    Parameters
+    ----------
+    results : dict[str, Measurement]
+        The measurements, by name.
+
+    Returns
+    -------
+    dict
+        The document.
+    """
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {
+            name: measurement._asdict() for name, measurement in results.items()
+        },
+    }
+
+
+def compare(
+    results: dict[str, Measurement], baseline: dict, threshold: float
+) -> list[str]:
+    """
+    Compares measurements with a baseline, printing the change of each.
+    Parameters
+    ----------
+    results : dict[str, Measurement]
+        The new measurements, by name.
+    baseline : dict
+        A document written by `to_json`.
+    threshold : float
+        The fraction a measurement may get worse by before it is a regression.
+
+    Returns
+    -------
+    list[str]
+        The names of the measurements that regressed.
+    """
+    regressions = []
+
+    for name, measurement in results.items():
+        old = baseline["results"].get(name)
+
+        if old is None or not old["value"]:
+            print(f"{name:<50} {'new':>10}")
+            continue
+
+        change = measurement.value / old["value"] - 1
+
+        if not measurement.higher_is_better:
+            change = -change
+
+        regressed = change < -threshold
+
+        if regressed:
+            regressions.append(name)
+
+        print(f"{name:<50} {change:>+10.1%}{'  REGRESSION' if regressed else ''}")
+
+    return regressions
+
+
+def main(arguments: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare with results written by --output")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="the fraction a result may get worse by before it is flagged",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="the number of times each timing is repeated, keeping the best",
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks whose name contains this"
+    )
+    args = parser.parse_args(arguments)
+
+    results = run(discover(args.filter), args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fs:
+            json.dump(to_json(results), fs, indent=4)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as fs:
+        baseline = json.load(fs)
+
+    print(f"\nCompared with {args.baseline}:")
+    regressions = compare(results, baseline, args.threshold)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+.. include:: ../../documentation/cache.md
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics about the usage of a cache.
+    """
+
+    hits: int
+    """The number of lookups that found a value."""
+    misses: int
+    """The number of lookups that didn't find a value."""
+    maxsize: int
+    """The maximum number of entries the cache holds."""
+    currsize: int
+    """The number of entries the cache currently holds."""
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of lookups that found a value.
+        Returns
+        -------
+        float
+            The hit rate between 0 and 1. 0 if there have been no lookups.
+        """
+        lookups = self.hits + self.misses
+
+        if lookups == 0:
+            return 0
+
+        return self.hits / lookups
+
+
+class LRUCache:
+    """
+    A bounded cache that evicts the least recently used entry when full.
+    """
+
+    maxsize: int
+    _data: OrderedDict
+    _hits: int
+    _misses: int
+
+    def __init__(self, maxsize: int):
+        """
+        Creates an empty LRUCache.
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries to hold.
+        """
+        if maxsize < 1:
+            raise ValueError(f"LRUCache: maxsize must be at least 1, not {maxsize}")
+
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """
+        The number of entries in the cache.
+        Returns
+        -------
+        int
+            The number of entries in the cache.
+        """
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Whether the cache holds a value for the key. Doesn't count as a lookup.
+        Parameters
+        ----------
+        key : Hashable
+            The key to check for.
+
+        Returns
+        -------
+        bool
+            Whether the cache holds a value for the key.
+        """
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Looks up a value, marking it as the most recently used.
+        Parameters
+        ----------
+        key : Hashable
+            The key to look up.
+        default : Any
+            The value returned if the key isn't in the cache.
+
+        Returns
+        -------
+        Any
+            The cached value, or `default`.
+        """
+        value = self._data.get(key, _MISSING)
+
+        if value is _MISSING:
+            self._misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self._hits += 1
+
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entry if the cache is full.
+        Parameters
+        ----------
+        key : Hashable
+            The key to store the value under.
+        value : Any
+            The value to store.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all entries and resets the statistics.
+        """
+        self._data.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns statistics about the usage of the cache.
+        Returns
+        -------
+        CacheInfo
+            The hits, misses, maximum size and current size of the cache.
+        """
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data))
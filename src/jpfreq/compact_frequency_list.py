@@ -0,0 +1,858 @@
+"""
+.. include:: ../../documentation/compact_frequency_list.md
+"""
+
+from array import array
+from heapq import nlargest
+from operator import countOf, sub
+from os import PathLike
+from os.path import isfile as file_exists
+from typing import Mapping, Sequence
+
+from .jp_frequency_list import JapaneseFrequencyList
+from .kanji import Kanji
+from .snapshot import (
+    SnapshotColumns,
+    SnapshotCounts,
+    read_snapshot,
+    read_snapshot_columns,
+    read_type_sets,
+)
+from .string_pool import StringPool
+from .util import in_range
+from .word import Word, WordType, WordTypes, intern_word_types
+from .word_slot import WordSlot
+
+_NONE = -1
+
+
+def _signed(typecode: str, values: array) -> array:
+    """
+    Copies an array of unsigned integers read from a snapshot into a signed array of the same item size.
+    Parameters
+    ----------
+    typecode : str
+        The typecode of the signed array.
+    values : array
+        The unsigned values, all small enough for the signed array.
+
+    Returns
+    -------
+    array
+        The signed array.
+    """
+    signed = array(typecode)
+    signed.frombytes(values.tobytes())
+
+    return signed
+
+
+class CompactJapaneseFrequencyList(JapaneseFrequencyList):
+    """
+    A JapaneseFrequencyList that stores its counts in integer columns rather than as Word and WordSlot objects.
+
+    Strings are interned to ids in a `jpfreq.string_pool.StringPool`, word types to ids of shared type sets,
+    and the words of each word slot are chained together through the word columns. Word slots and kanji are
+    created when they are accessed, so modifying them doesn't change the frequency list.
+    Lists without surface lookups use several times less memory than a JapaneseFrequencyList, at the cost
+    of slower counting and of `get_most_frequent` scanning every word slot.
+
+    Words and word slots whose frequency is brought back to 0 by `remove_word` stay in the columns as tombstones,
+    which every query skips, and are reused if they are counted again.
+    """
+
+    _strings: StringPool
+    _string_slots: array
+    _surface_slots: array | None
+    _slot_strings: array
+    _slot_frequencies: array
+    _slot_first_words: array
+    _word_surfaces: array
+    _word_types: array
+    _word_frequencies: array
+    _word_next: array
+    _type_sets: list[WordTypes]
+    _type_set_ids: dict[WordTypes, int]
+    _type_set_cache: dict[int, tuple[WordTypes, int]]
+    _kanji_frequencies: dict[str, int]
+    _slots_used_once: int
+    _empty_slots: int
+    _shared_surfaces: set[int]
+
+    def __init__(self, *args, **kwargs):
+        """
+        Creates an empty CompactJapaneseFrequencyList.
+        Takes the same arguments as `jpfreq.jp_frequency_list.JapaneseFrequencyList`.
+        """
+        self._reset_columns(compare_surface=False)
+        super().__init__(*args, **kwargs)
+
+    def _reset_columns(self, compare_surface: bool) -> None:
+        """
+        Replaces all the columns with empty ones.
+        Parameters
+        ----------
+        compare_surface : bool
+            Whether to keep a surface index.
+        """
+        self._strings = StringPool()
+        self._string_slots = array("i")
+        self._surface_slots = array("i") if compare_surface else None
+        self._slot_strings = array("i")
+        self._slot_frequencies = array("q")
+        self._slot_first_words = array("i")
+        self._word_surfaces = array("i")
+        self._word_types = array("i")
+        self._word_frequencies = array("q")
+        self._word_next = array("i")
+        self._type_sets = []
+        self._type_set_ids = {}
+        self._type_set_cache = {}
+        self._kanji_frequencies = {}
+        self._slots_used_once = 0
+        self._empty_slots = 0
+        self._shared_surfaces = set()
+
+    def __len__(self) -> int:
+        """
+        The number of unique words in the frequency list.
+        Returns
+        -------
+        int
+            The number of unique words in the frequency list.
+        """
+        return len(self._slot_frequencies) - self._empty_slots
+
+    def __contains__(self, word: str) -> bool:
+        """
+        Whether the representation of a word is in the frequency list.
+
+        This will compare against surfaces only if `compare_surface` is True.
+        Parameters
+        ----------
+        word : str
+            The word to check for.
+
+        Returns
+        -------
+        bool
+            Whether the word is in the frequency list.
+        """
+        return self._find_slot(word) != _NONE
+
+    def __getitem__(self, word: str) -> WordSlot:
+        """
+        Returns a new WordSlot containing the counts of the specified word, searching by representation.
+
+        If `compare_surface` is True, surfaces are searched too when no representation matches.
+        A surface shared by several representations returns the slot of the first one counted.
+        Parameters
+        ----------
+        word : str
+            The representation of the word.
+
+        Returns
+        -------
+        WordSlot
+            The word slot of the word.
+        """
+        slot_id = self._find_slot(word)
+
+        if slot_id == _NONE:
+            raise KeyError(f"Word '{word}' not found in frequency list")
+
+        return self._word_slot(slot_id)
+
+    @property
+    def wordslots(self) -> list[WordSlot]:
+        """
+        Returns a list of all the wordslots, created from the columns.
+        Returns
+        -------
+        list[WordSlot]
+            A list of all the wordslots.
+        """
+        return list(map(self._word_slot, self._counted_slots()))
+
+    @property
+    def compare_surface(self) -> bool:
+        """
+        Whether lookups also match the surfaces of words, not only their representations.
+
+        When enabled, the first word slot counted with each surface is kept in a column indexed by string id.
+        Returns
+        -------
+        bool
+            Whether lookups also match surfaces.
+        """
+        return self._surface_slots is not None
+
+    @compare_surface.setter
+    def compare_surface(self, compare_surface: bool) -> None:
+        """
+        Enables or disables matching surfaces in lookups, building or dropping the surface index.
+        Parameters
+        ----------
+        compare_surface : bool
+            Whether lookups should also match surfaces.
+        """
+        if not compare_surface:
+            self._surface_slots = None
+            return
+
+        if self._surface_slots is not None:
+            return
+
+        self._surface_slots = array("i", [_NONE]) * len(self._strings)
+        self._shared_surfaces = set()
+
+        # Slot ids are in the order the slots were first counted, so the first slot seen for a surface wins
+        for slot_id, word_id in enumerate(self._slot_first_words):
+            while word_id != _NONE:
+                if self._word_frequencies[word_id]:
+                    self._index_surface(self._word_surfaces[word_id], slot_id)
+
+                word_id = self._word_next[word_id]
+
+    @property
+    def unique_words(self) -> int:
+        """
+        Returns the number of unique words.
+        Returns
+        -------
+        int
+            The number of unique words.
+        """
+        return len(self._slot_frequencies) - self._empty_slots
+
+    @property
+    def unique_words_used_once(self) -> int:
+        """
+        Returns the number of unique words used once.
+        Returns
+        -------
+        int
+            The number of unique words used once.
+        """
+        return self._slots_used_once
+
+    @property
+    def unique_kanji(self) -> int:
+        """
+        Returns the number of unique kanji.
+        Returns
+        -------
+        int
+            The number of unique kanji.
+        """
+        return len(self._kanji_frequencies)
+
+    def clear(self) -> None:
+        """
+        Clears the frequency list of all words and kanji, reverting it to its initial state.
+        """
+        self._word_count = 0
+        self._kanji_used_once = 0
+        self._reset_columns(self.compare_surface)
+
+    @classmethod
+    def load(
+        cls, file_path: str | PathLike, **kwargs
+    ) -> "CompactJapaneseFrequencyList":
+        """
+        Loads a frequency list from a snapshot created by `save`.
+
+        The columns are filled straight from the sections of the snapshot, without creating a Word per entry,
+        and strings are only hashed on the first lookup by string.
+        Parameters
+        ----------
+        file_path : str | PathLike
+            The path of the snapshot to load.
+        **kwargs
+            Passed to the constructor of the frequency list, e.g. `compare_surface`.
+
+        Returns
+        -------
+        CompactJapaneseFrequencyList
+            The loaded frequency list.
+        """
+        if not file_exists(file_path):
+            raise FileExistsError(f"load: File path passed doesn't exist ({file_path})")
+
+        with open(file_path, "rb") as fs:
+            data = fs.read()
+
+        freq_list = cls(**kwargs)
+
+        if freq_list.word_count or freq_list.unique_kanji:
+            # The constructor counted some text, so the snapshot is added to it
+            freq_list._absorb(*read_snapshot(data))
+        else:
+            freq_list._load_columns(read_snapshot_columns(data))
+
+        return freq_list
+
+    def get_most_frequent(
+        self, limit: int = 100, minimum: int = -1, maximum: int = -1
+    ) -> list[WordSlot]:
+        """
+        Returns a list of the most frequent words in the text with the specified limit.
+        If limit is -1, then all words are returned.
+
+        This scans the frequency column rather than keeping word slots ordered by frequency.
+        Parameters
+        ----------
+        limit : int
+            The number of words to return.
+        minimum : int
+            The minimum frequency of the words to return (inclusive). -1 means no minimum.
+        maximum : int
+            The maximum frequency of the words to return (inclusive). -1 means no maximum.
+        Returns
+        -------
+        list[WordSlot]
+            A list of the most frequent words in the text with the specified limit, sorted by frequency.
+            Words with the same frequency are in the order they were first counted.
+        """
+        slot_ids = self._counted_slots()
+
+        if minimum != -1 or maximum != -1:
+            slot_ids = [
+                slot_id
+                for slot_id, frequency in enumerate(self._slot_frequencies)
+                if frequency and in_range(frequency, minimum, maximum)
+            ]
+
+        frequency_of = self._slot_frequencies.__getitem__
+
+        if limit == -1:
+            slot_ids = sorted(slot_ids, key=frequency_of, reverse=True)
+        else:
+            slot_ids = nlargest(limit, slot_ids, key=frequency_of)
+
+        return list(map(self._word_slot, slot_ids))
+
+    def add_kanji(self, kanji: Kanji) -> None:
+        """
+        Adds a kanji to the frequency list.
+        Parameters
+        ----------
+        kanji : Kanji
+            The kanji to add.
+        """
+        frequency = self._kanji_frequencies.get(kanji.representation)
+
+        if frequency is not None:
+            self._kanji_frequencies[kanji.representation] = frequency + 1
+            self._count_kanji_used_once(frequency, frequency + 1)
+            return
+
+        self._kanji_frequencies[kanji.representation] = kanji.frequency
+        self._count_kanji_used_once(0, kanji.frequency)
+
+    def add_kanji_counts(self, kanji_counts: Mapping[str, int]) -> None:
+        """
+        Adds several occurrences of kanji to the frequency list at once.
+        Parameters
+        ----------
+        kanji_counts : Mapping[str, int]
+            The number of occurrences of each kanji character, see `jpfreq.kanji.count_kanji_in_string`.
+        """
+        for character, count in kanji_counts.items():
+            frequency = self._kanji_frequencies.get(character, 0)
+            self._kanji_frequencies[character] = frequency + count
+            self._count_kanji_used_once(frequency, frequency + count)
+
+    def remove_kanji_counts(self, kanji_counts: Mapping[str, int]) -> None:
+        """
+        Removes several occurrences of kanji from the frequency list at once, the reverse of `add_kanji_counts`.
+        Kanji whose frequency reaches 0 are removed.
+        Parameters
+        ----------
+        kanji_counts : Mapping[str, int]
+            The number of occurrences of each kanji character to remove.
+        """
+        for character, count in kanji_counts.items():
+            frequency = self._kanji_frequencies.get(character, 0)
+
+            if frequency < count:
+                raise ValueError(
+                    f"remove_kanji_counts: can't remove {count} of '{character}', only {frequency} counted"
+                )
+
+            self._count_kanji_used_once(frequency, frequency - count)
+
+            if frequency == count:
+                del self._kanji_frequencies[character]
+            else:
+                self._kanji_frequencies[character] = frequency - count
+
+    def add_word(self, word: Word) -> None:
+        """
+        Adds a word to the frequency list.
+
+        If the word is already in the list, then its frequency is increased by the frequency of the word, usually 1.
+        Otherwise, the word is added to the list with the frequency of the word.
+
+        Note: This method assumes the word is valid.
+
+        Parameters
+        ----------
+        word : Word
+            The word to add.
+        """
+        self._word_count += word.frequency
+        self._add(word.representation, word.surface, word.types, word.frequency)
+
+    def remove_word(self, word: Word) -> None:
+        """
+        Removes occurrences of a word from the frequency list, the reverse of `add_word`.
+
+        The frequency of the word's surface is decreased by the frequency of the word, usually 1.
+        Surfaces and word slots whose frequency reaches 0 are kept as tombstones, which queries skip
+        and counting the word again reuses.
+        Parameters
+        ----------
+        word : Word
+            The word to remove.
+        """
+        representation_id = self._strings.get(word.representation)
+        slot_id = (
+            _NONE
+            if representation_id == _NONE
+            else self._string_slots[representation_id]
+        )
+
+        if slot_id == _NONE or not self._slot_frequencies[slot_id]:
+            raise KeyError(f"Word '{word.representation}' not found in frequency list")
+
+        surface_id = self._strings.get(word.surface)
+        word_id = self._slot_first_words[slot_id]
+
+        while word_id != _NONE and self._word_surfaces[word_id] != surface_id:
+            word_id = self._word_next[word_id]
+
+        frequency = word.frequency
+        word_frequency = 0 if word_id == _NONE else self._word_frequencies[word_id]
+
+        if word_frequency < frequency:
+            raise ValueError(
+                f"CompactJapaneseFrequencyList: can't remove {frequency} of '{word.surface}', "
+                f"only {word_frequency} counted"
+            )
+
+        self._word_count -= frequency
+        self._word_frequencies[word_id] = word_frequency - frequency
+
+        old_frequency = self._slot_frequencies[slot_id]
+        self._slot_frequencies[slot_id] = old_frequency - frequency
+        self._count_slot_frequency(old_frequency, old_frequency - frequency)
+
+        if word_frequency == frequency and self._surface_slots is not None:
+            self._unindex_surface(surface_id, slot_id)
+
+    def _add(
+        self,
+        representation: str,
+        surface: str,
+        types: Sequence[WordType],
+        frequency: int,
+    ) -> None:
+        """
+        Adds occurrences of a word to the columns.
+        Parameters
+        ----------
+        representation : str
+            The representation of the word.
+        surface : str
+            The surface of the word.
+        types : Sequence[WordType]
+            The types of the word. Only used if the surface is new to the word slot.
+        frequency : int
+            The number of occurrences to add.
+        """
+        representation_id = self._intern(representation)
+
+        if surface == representation:
+            surface_id = representation_id
+        else:
+            surface_id = self._intern(surface)
+
+        slot_id = self._string_slots[representation_id]
+
+        if slot_id == _NONE:
+            slot_id = self._string_slots[representation_id] = len(
+                self._slot_frequencies
+            )
+            self._slot_strings.append(representation_id)
+            self._slot_frequencies.append(0)
+            self._slot_first_words.append(_NONE)
+            self._empty_slots += 1
+
+        previous_id = _NONE
+        word_id = self._slot_first_words[slot_id]
+
+        while word_id != _NONE and self._word_surfaces[word_id] != surface_id:
+            previous_id = word_id
+            word_id = self._word_next[word_id]
+
+        if word_id == _NONE:
+            word_id = len(self._word_surfaces)
+            self._word_surfaces.append(surface_id)
+            self._word_types.append(self._type_set_id(types))
+            self._word_frequencies.append(0)
+            self._word_next.append(_NONE)
+
+            if previous_id == _NONE:
+                self._slot_first_words[slot_id] = word_id
+            else:
+                self._word_next[previous_id] = word_id
+        elif not self._word_frequencies[word_id]:
+            # A tombstone of a removed surface is counted again with the types of the new word
+            self._word_types[word_id] = self._type_set_id(types)
+
+        if not self._word_frequencies[word_id] and self._surface_slots is not None:
+            self._index_surface(surface_id, slot_id)
+
+        self._word_frequencies[word_id] += frequency
+
+        old_frequency = self._slot_frequencies[slot_id]
+        self._slot_frequencies[slot_id] = old_frequency + frequency
+        self._count_slot_frequency(old_frequency, old_frequency + frequency)
+
+    def _count_slot_frequency(self, old_frequency: int, new_frequency: int) -> None:
+        """
+        Keeps the number of word slots used once and of empty word slots up to date after a frequency changed.
+        Parameters
+        ----------
+        old_frequency : int
+            The frequency of the word slot before it changed.
+        new_frequency : int
+            The frequency of the word slot after it changed.
+        """
+        self._slots_used_once += (new_frequency == 1) - (old_frequency == 1)
+        self._empty_slots += (new_frequency == 0) - (old_frequency == 0)
+
+    def _intern(self, string: str) -> int:
+        """
+        Gets the id of a string, adding it to the string pool and growing the columns indexed by string id if new.
+        Parameters
+        ----------
+        string : str
+            The string to intern.
+
+        Returns
+        -------
+        int
+            The id of the string.
+        """
+        string_id = self._strings.add(string)
+
+        if string_id == len(self._string_slots):
+            self._string_slots.append(_NONE)
+
+            if self._surface_slots is not None:
+                self._surface_slots.append(_NONE)
+
+        return string_id
+
+    def _index_surface(self, surface_id: int, slot_id: int) -> None:
+        """
+        Adds a surface to the surface index, keeping the word slot counted first if the surface is shared.
+        Parameters
+        ----------
+        surface_id : int
+            The string id of the surface.
+        slot_id : int
+            The id of the word slot with the surface.
+        """
+        indexed_id = self._surface_slots[surface_id]
+
+        if indexed_id == _NONE:
+            self._surface_slots[surface_id] = slot_id
+            return
+
+        if indexed_id == slot_id:
+            return
+
+        self._shared_surfaces.add(surface_id)
+
+        if slot_id < indexed_id:
+            self._surface_slots[surface_id] = slot_id
+
+    def _unindex_surface(self, surface_id: int, slot_id: int) -> None:
+        """
+        Removes a surface a word slot no longer has from the surface index.
+
+        If the surface was indexed to that word slot and other word slots share it,
+        it is indexed to the one of them that was counted first instead.
+        Parameters
+        ----------
+        surface_id : int
+            The string id of the surface that was removed.
+        slot_id : int
+            The id of the word slot it was removed from.
+        """
+        if self._surface_slots[surface_id] != slot_id:
+            return
+
+        self._surface_slots[surface_id] = _NONE
+
+        if surface_id not in self._shared_surfaces:
+            return
+
+        # Shared surfaces are rare, so they are looked for by scanning rather than kept in a second index
+        sharing = [
+            other_id
+            for other_id in self._counted_slots()
+            if self._find_word(other_id, surface_id) != _NONE
+        ]
+
+        if len(sharing) < 2:
+            self._shared_surfaces.discard(surface_id)
+
+        if sharing:
+            self._surface_slots[surface_id] = sharing[0]
+
+    def _find_word(self, slot_id: int, surface_id: int) -> int:
+        """
+        Finds the id of the counted word of a word slot with a surface.
+        Parameters
+        ----------
+        slot_id : int
+            The id of the word slot.
+        surface_id : int
+            The string id of the surface.
+
+        Returns
+        -------
+        int
+            The id of the word, or -1 if the word slot has no counted word with the surface.
+        """
+        word_id = self._slot_first_words[slot_id]
+
+        while word_id != _NONE:
+            if (
+                self._word_surfaces[word_id] == surface_id
+                and self._word_frequencies[word_id]
+            ):
+                return word_id
+
+            word_id = self._word_next[word_id]
+
+        return _NONE
+
+    def _counted_slots(self) -> Sequence[int]:
+        """
+        The ids of the word slots that aren't tombstones, in the order they were first counted.
+        Returns
+        -------
+        Sequence[int]
+            The ids of the word slots.
+        """
+        if not self._empty_slots:
+            return range(len(self._slot_frequencies))
+
+        return [
+            slot_id
+            for slot_id, frequency in enumerate(self._slot_frequencies)
+            if frequency
+        ]
+
+    def _type_set_id(self, types: Sequence[WordType]) -> int:
+        """
+        Gets the id of a set of word types, adding it if it is new.
+
+        Parsed words share interned `jpfreq.word.WordTypes`, so these are looked up by identity first.
+        Parameters
+        ----------
+        types : Sequence[WordType]
+            The word types.
+
+        Returns
+        -------
+        int
+            The id of the type set.
+        """
+        cached = self._type_set_cache.get(id(types))
+
+        if cached is not None and cached[0] is types:
+            return cached[1]
+
+        interned = intern_word_types(types)
+        type_set_id = self._type_set_ids.get(interned)
+
+        if type_set_id is None:
+            type_set_id = self._type_set_ids[interned] = len(self._type_sets)
+            self._type_sets.append(interned)
+
+        if isinstance(types, WordTypes):
+            self._type_set_cache[id(types)] = (types, type_set_id)
+
+        return type_set_id
+
+    def _find_slot(self, word: str) -> int:
+        """
+        Finds the id of the word slot of a representation, or of a surface if `compare_surface` is True.
+        Parameters
+        ----------
+        word : str
+            The word to find.
+
+        Returns
+        -------
+        int
+            The id of the word slot, or -1 if the word isn't in the frequency list.
+        """
+        string_id = self._strings.get(word)
+
+        if string_id == _NONE:
+            return _NONE
+
+        slot_id = self._string_slots[string_id]
+
+        if slot_id != _NONE and not self._slot_frequencies[slot_id]:
+            slot_id = _NONE
+
+        if slot_id == _NONE and self._surface_slots is not None:
+            slot_id = self._surface_slots[string_id]
+
+        return slot_id
+
+    def _word_slot(self, slot_id: int) -> WordSlot:
+        """
+        Creates the word slot with the given id from the columns.
+        Parameters
+        ----------
+        slot_id : int
+            The id of the word slot.
+
+        Returns
+        -------
+        WordSlot
+            The word slot.
+        """
+        representation = self._strings[self._slot_strings[slot_id]]
+        words = {}
+        word_id = self._slot_first_words[slot_id]
+
+        while word_id != _NONE:
+            if self._word_frequencies[word_id]:
+                surface = self._strings[self._word_surfaces[word_id]]
+                words[surface] = Word(
+                    representation,
+                    surface,
+                    self._type_sets[self._word_types[word_id]],
+                    self._word_frequencies[word_id],
+                )
+
+            word_id = self._word_next[word_id]
+
+        return WordSlot._from_surfaces(words, self._slot_frequencies[slot_id])
+
+    def _counts(self) -> SnapshotCounts:
+        """
+        The counts of the frequency list, created as word slots and kanji.
+        Returns
+        -------
+        SnapshotCounts
+            The word slots, kanji and word count of the frequency list.
+        """
+        unique_words = {
+            self._strings[self._slot_strings[slot_id]]: self._word_slot(slot_id)
+            for slot_id in self._counted_slots()
+        }
+        unique_kanji = {
+            character: Kanji(character, frequency)
+            for character, frequency in self._kanji_frequencies.items()
+        }
+
+        return unique_words, unique_kanji, self._word_count
+
+    def _absorb(
+        self,
+        unique_words: dict[str, WordSlot],
+        unique_kanji: dict[str, Kanji],
+        word_count: int,
+        copy: bool = False,
+    ) -> None:
+        """
+        Adds partial counts to the columns.
+        Parameters
+        ----------
+        unique_words : dict[str, WordSlot]
+            The word slots to add.
+        unique_kanji : dict[str, Kanji]
+            The kanji to add.
+        word_count : int
+            The number of words the partial counts were built from.
+        copy : bool
+            Unused, the passed objects are never stored.
+        """
+        self._word_count += word_count
+
+        for representation, word_slot in unique_words.items():
+            for word in word_slot.words:
+                self._add(representation, word.surface, word.types, word.frequency)
+
+        self.add_kanji_counts(
+            {character: kanji.frequency for character, kanji in unique_kanji.items()}
+        )
+
+    def _load_columns(self, columns: SnapshotColumns) -> None:
+        """
+        Replaces the columns of an empty frequency list with those of a snapshot.
+        Parameters
+        ----------
+        columns : SnapshotColumns
+            The columns of the snapshot, see `jpfreq.snapshot.read_snapshot_columns`.
+        """
+        compare_surface = self.compare_surface
+        string_offsets = columns.string_offsets
+        word_count = len(columns.word_surfaces)
+
+        # The strings are stored null terminated, so each offset moves back by the number of strings before it
+        self._strings = StringPool._from_encoded(
+            bytes(columns.string_blob[: string_offsets[-1]]).replace(b"\0", b""),
+            array("q", map(sub, string_offsets, range(len(string_offsets)))),
+        )
+        self._string_slots = array("i", [_NONE]) * columns.string_count
+
+        for slot_id, representation_id in enumerate(columns.slot_representations):
+            self._string_slots[representation_id] = slot_id
+
+        self._surface_slots = None
+        self._slot_strings = _signed("i", columns.slot_representations)
+        self._slot_frequencies = _signed("q", columns.slot_frequencies)
+        self._slot_first_words = _signed("i", columns.slot_starts[:-1])
+        self._word_surfaces = _signed("i", columns.word_surfaces)
+        self._word_types = _signed("i", columns.word_types)
+        self._word_frequencies = _signed("q", columns.word_frequencies)
+        # The words of a slot are stored one after another, so each links to the next until the end of its slot
+        self._word_next = array("i", range(1, word_count + 1))
+
+        for end in columns.slot_starts[1:]:
+            self._word_next[end - 1] = _NONE
+
+        self._type_sets = read_type_sets(
+            self._strings.__getitem__, columns.type_offsets, columns.type_values
+        )
+        self._type_set_ids = {
+            type_set: type_set_id
+            for type_set_id, type_set in enumerate(self._type_sets)
+        }
+        self._type_set_cache = {}
+        self._slots_used_once = countOf(self._slot_frequencies, 1)
+        self._empty_slots = 0
+        self._shared_surfaces = set()
+        self._kanji_frequencies = dict(
+            zip(
+                map(self._strings.__getitem__, columns.kanji_characters),
+                columns.kanji_frequencies,
+            )
+        )
+        self._kanji_used_once = countOf(columns.kanji_frequencies, 1)
+        self._word_count = columns.word_count
+
+        if compare_surface:
+            self.compare_surface = True
@@ -0,0 +1,385 @@
+"""
+.. include:: ../../documentation/concurrent_frequency_list.md
+"""
+
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from os import PathLike
+from typing import Iterable, Iterator, Mapping
+
+from .jp_frequency_list import JapaneseFrequencyList, _batched
+from .kanji import Kanji
+from .text_info import TextInfo
+from .word import Word, WordType
+from .word_slot import WordSlot
+
+DEFAULT_FLUSH_SIZE = 256
+"""The default number of lines a thread buffers before adding its counts to the shared list."""
+
+
+@dataclass
+class _ThreadBuffer:
+    """
+    The partial counts of a single thread, waiting to be flushed into a ConcurrentJapaneseFrequencyList.
+    """
+
+    freq_list: JapaneseFrequencyList
+    """The private frequency list the thread tags with, holding its caches. Only used by the thread, without lock."""
+    thread: threading.Thread
+    """The thread that owns the buffer."""
+    handed_over: JapaneseFrequencyList = field(default_factory=JapaneseFrequencyList)
+    """The counts of the lines tagged since the last flush, waiting to be flushed."""
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    """Held while counts are handed over or flushed."""
+    pending: int = 0
+    """The number of lines handed over since the last flush."""
+    retired: bool = False
+    """Whether the buffer was replaced after a settings change, so it must be flushed after every write."""
+
+
+class ConcurrentJapaneseFrequencyList(JapaneseFrequencyList):
+    """
+    A JapaneseFrequencyList that several threads can feed and query at once, e.g. the handlers of a web server.
+
+    Each thread tags its lines with its own Tagger from `jpfreq.tagger_pool.DEFAULT_TAGGER_POOL` without holding
+    any lock, then adds their counts to its own buffer under a lock that is only held while they are added.
+    Every `flush_size` lines the buffered counts are added to the shared list in bulk under a single lock, so threads
+    only contend once per batch. Reading the list flushes every buffer first, so the counts of every line processed
+    before the read are included.
+
+    Totals are the same as processing the lines in one thread, but words with the same frequency may be ordered
+    differently, as the order lines are counted in depends on the threads. Word slots returned by queries keep
+    changing while other threads add to the list; use `copy` for a consistent snapshot.
+    """
+
+    _lock: threading.RLock
+    _local: threading.local
+    _buffers: list[_ThreadBuffer]
+    flush_size: int
+
+    def __init__(self, *args, flush_size: int = DEFAULT_FLUSH_SIZE, **kwargs):
+        """
+        Creates an empty ConcurrentJapaneseFrequencyList.
+        Takes the same arguments as `jpfreq.jp_frequency_list.JapaneseFrequencyList`, except that
+        `tagger_instance` and `collect_stats` are not supported, as a Tagger can't be shared between threads.
+        Parameters
+        ----------
+        flush_size : int
+            The number of lines a thread buffers before adding its counts to the list.
+        """
+        if flush_size < 1:
+            raise ValueError(
+                f"ConcurrentJapaneseFrequencyList: flush_size must be at least 1, not {flush_size}"
+            )
+
+        self.flush_size = flush_size
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._buffers = []
+
+        super().__init__(*args, **kwargs)
+
+        if self._tagger is not None:
+            raise ValueError(
+                "ConcurrentJapaneseFrequencyList: tagger_instance isn't supported, each thread uses its own Tagger"
+            )
+
+        if self._stats is not None:
+            raise ValueError(
+                "ConcurrentJapaneseFrequencyList: collect_stats isn't supported"
+            )
+
+    def __len__(self) -> int:
+        with self._synchronised():
+            return super().__len__()
+
+    def __contains__(self, word: str) -> bool:
+        with self._synchronised():
+            return super().__contains__(word)
+
+    def __getitem__(self, word: str) -> WordSlot:
+        with self._synchronised():
+            return super().__getitem__(word)
+
+    @property
+    def wordslots(self) -> list[WordSlot]:
+        with self._synchronised():
+            return super().wordslots
+
+    @JapaneseFrequencyList.compare_surface.setter
+    def compare_surface(self, compare_surface: bool) -> None:
+        with self._lock:
+            JapaneseFrequencyList.compare_surface.fset(self, compare_surface)
+
+    @JapaneseFrequencyList.excluded_word_types.setter
+    def excluded_word_types(self, excluded_word_types: list[WordType]) -> None:
+        """
+        Sets the word types to exclude. Lines buffered before the change are counted with the old types.
+        Parameters
+        ----------
+        excluded_word_types : list[WordType]
+            The word types to exclude.
+        """
+        with self._lock:
+            # Buffers are retired before they are flushed, so a thread still writing to one flushes it itself
+            for buffer in self._buffers:
+                buffer.retired = True
+
+            self._flush_buffers()
+            self._buffers = []
+            self._local = threading.local()
+            JapaneseFrequencyList.excluded_word_types.fset(self, excluded_word_types)
+
+    @JapaneseFrequencyList.collect_stats.setter
+    def collect_stats(self, collect_stats: bool) -> None:
+        if collect_stats:
+            raise ValueError(
+                "ConcurrentJapaneseFrequencyList: collect_stats isn't supported"
+            )
+
+        JapaneseFrequencyList.collect_stats.fset(self, collect_stats)
+
+    @property
+    def word_count(self) -> int:
+        with self._synchronised():
+            return super().word_count
+
+    @property
+    def unique_words(self) -> int:
+        with self._synchronised():
+            return super().unique_words
+
+    @property
+    def unique_words_used_once(self) -> int:
+        with self._synchronised():
+            return super().unique_words_used_once
+
+    @property
+    def unique_words_all(self) -> tuple[int, int, float]:
+        with self._synchronised():
+            return super().unique_words_all
+
+    @property
+    def unique_kanji(self) -> int:
+        with self._synchronised():
+            return super().unique_kanji
+
+    @property
+    def unique_kanji_used_once(self) -> int:
+        with self._synchronised():
+            return super().unique_kanji_used_once
+
+    @property
+    def unique_kanji_all(self) -> tuple[int, int, float]:
+        with self._synchronised():
+            return super().unique_kanji_all
+
+    def clear(self) -> None:
+        """
+        Clears the frequency list of all words and kanji, including the lines buffered by every thread.
+        """
+        with self._synchronised():
+            super().clear()
+
+    def copy(self) -> "ConcurrentJapaneseFrequencyList":
+        """
+        Creates a copy of the frequency list with the counts of every line processed so far.
+        Returns
+        -------
+        ConcurrentJapaneseFrequencyList
+            The copied frequency list.
+        """
+        with self._synchronised():
+            copied = super().copy()
+
+        copied.flush_size = self.flush_size
+
+        return copied
+
+    def merge(self, other: JapaneseFrequencyList) -> None:
+        """
+        Adds the words, kanji and word count of another frequency list to this one.
+
+        If `other` is a ConcurrentJapaneseFrequencyList, a snapshot of it is merged, so it may keep being written to.
+        Parameters
+        ----------
+        other : JapaneseFrequencyList
+            The frequency list to merge into this one.
+        """
+        if isinstance(other, ConcurrentJapaneseFrequencyList):
+            other = other.copy()
+
+        super().merge(other)
+
+    def save(self, file_path: str | PathLike) -> None:
+        with self._synchronised():
+            super().save(file_path)
+
+    def get_most_frequent(
+        self, limit: int = 100, minimum: int = -1, maximum: int = -1
+    ) -> list[WordSlot]:
+        with self._synchronised():
+            return super().get_most_frequent(limit, minimum, maximum)
+
+    def generate_text_info(self) -> TextInfo:
+        with self._synchronised():
+            return super().generate_text_info()
+
+    def add_kanji(self, kanji: Kanji) -> None:
+        with self._lock:
+            super().add_kanji(kanji)
+
+    def add_kanji_counts(self, kanji_counts: Mapping[str, int]) -> None:
+        with self._lock:
+            super().add_kanji_counts(kanji_counts)
+
+    def add_word(self, word: Word) -> None:
+        with self._lock:
+            super().add_word(word)
+
+    def remove_kanji_counts(self, kanji_counts: Mapping[str, int]) -> None:
+        """
+        Removes several occurrences of kanji from the frequency list, including those of buffered lines.
+        Parameters
+        ----------
+        kanji_counts : Mapping[str, int]
+            The number of occurrences of each kanji character to remove.
+        """
+        with self._synchronised():
+            super().remove_kanji_counts(kanji_counts)
+
+    def remove_word(self, word: Word) -> None:
+        """
+        Removes occurrences of a word from the frequency list, including those of buffered lines.
+        Parameters
+        ----------
+        word : Word
+            The word to remove.
+        """
+        with self._synchronised():
+            super().remove_word(word)
+
+    def process_line(self, line_to_process: str) -> None:
+        """
+        Parses a line into the buffer of the current thread, flushing it once it holds `flush_size` lines.
+
+        The line is tagged without holding any lock, and only adding its counts to the buffer is locked.
+        Parameters
+        ----------
+        line_to_process : str
+            The line to process.
+        """
+        buffer = self._buffer()
+        words, kanji_counts = buffer.freq_list._tag_line(line_to_process)
+
+        with buffer.lock:
+            buffer.handed_over._add_tagged_line(words, kanji_counts)
+            buffer.pending += 1
+            flush = buffer.retired or buffer.pending >= self.flush_size
+
+        if flush:
+            self._flush_buffer(buffer)
+
+    def process_lines(self, lines_to_process: Iterable[str]) -> None:
+        """
+        Parses several lines in order into the buffer of the current thread, flushing it every `flush_size` lines.
+
+        Lines are tagged in batches of `flush_size` without holding any lock, so `tag_batch_size` only joins lines
+        within a batch. Only adding the counts of each batch to the buffer is locked.
+        Parameters
+        ----------
+        lines_to_process : Iterable[str]
+            The lines to process.
+        """
+        for lines in _batched(lines_to_process, self.flush_size):
+            buffer = self._buffer()
+            buffer.freq_list.process_lines(lines)
+            counts = buffer.freq_list._take_counts()
+
+            with buffer.lock:
+                buffer.handed_over._absorb(*counts)
+                buffer.pending += len(lines)
+                flush = buffer.retired or buffer.pending >= self.flush_size
+
+            if flush:
+                self._flush_buffer(buffer)
+
+    def flush(self) -> None:
+        """
+        Adds the lines buffered by every thread to the list.
+
+        Queries flush on their own, so this is only needed to bound how many lines are buffered.
+        """
+        with self._lock:
+            self._flush_buffers()
+
+    def _absorb(
+        self,
+        unique_words: dict[str, WordSlot],
+        unique_kanji: dict[str, Kanji],
+        word_count: int,
+        copy: bool = False,
+    ) -> None:
+        with self._lock:
+            super()._absorb(unique_words, unique_kanji, word_count, copy)
+
+    @contextmanager
+    def _synchronised(self) -> Iterator[None]:
+        """
+        Flushes every buffer and holds the lock of the list, so it can be read or changed as a whole.
+        """
+        with self._lock:
+            self._flush_buffers()
+            yield
+
+    def _buffer(self) -> _ThreadBuffer:
+        """
+        The buffer of the current thread, creating it on first use.
+        Returns
+        -------
+        _ThreadBuffer
+            The buffer of the current thread.
+        """
+        buffer = getattr(self._local, "buffer", None)
+
+        if buffer is None:
+            with self._lock:
+                buffer = self._local.buffer = _ThreadBuffer(
+                    JapaneseFrequencyList(**self._worker_settings()),
+                    threading.current_thread(),
+                )
+                self._buffers.append(buffer)
+
+        buffer.freq_list.tag_batch_size = self.tag_batch_size
+
+        return buffer
+
+    def _flush_buffer(self, buffer: _ThreadBuffer) -> None:
+        """
+        Adds the counts of a buffer to the list, emptying it.
+
+        The lock of the list is always taken before the lock of a buffer, so threads can't deadlock.
+        Parameters
+        ----------
+        buffer : _ThreadBuffer
+            The buffer to flush.
+        """
+        with self._lock:
+            with buffer.lock:
+                if not buffer.pending:
+                    return
+
+                counts = buffer.handed_over._take_counts()
+                buffer.pending = 0
+
+            super()._absorb(*counts)
+
+    def _flush_buffers(self) -> None:
+        """
+        Flushes every buffer and forgets those of threads that have finished. The lock of the list must be held.
+        """
+        for buffer in self._buffers:
+            self._flush_buffer(buffer)
+
+        self._buffers = [buffer for buffer in self._buffers if buffer.thread.is_alive()]
@@ -0,0 +1,96 @@
+"""
+.. include:: ../../../documentation/exporters/csv.md
+"""
+
+import csv
+from io import StringIO
+from typing import Iterator
+from ..jp_frequency_list import JapaneseFrequencyList
+from .iexporter import IExporter
+
+COLUMNS = ("representation", "surface", "frequency", "types")
+"""The header row of the export."""
+
+
+class CsvExporter(IExporter):
+    delimiter: str = ","
+
+    def export(
+        self,
+        frequency_list: JapaneseFrequencyList,
+        limit: int = 100,
+        combine: bool = False,
+    ) -> str:
+        """
+        Exports the frequency list to CSV, with a header row followed by one row per word.
+        Parameters
+        ----------
+        frequency_list : JapaneseFrequencyList
+            The frequency list to export
+        limit : int
+            The MAX number of words to export
+        combine : bool
+            Whether to combine the word slots into a single row each or not
+
+        Returns
+        -------
+        str
+            The CSV string
+        """
+        return "".join(self.export_lazy(frequency_list, limit=limit, combine=combine))
+
+    def export_lazy(
+        self,
+        frequency_list: JapaneseFrequencyList,
+        limit: int = 100,
+        combine: bool = False,
+    ) -> Iterator[str]:
+        """
+        Exports the frequency list to CSV one word slot at a time.
+
+        Rows are ordered by word slot frequency. Types are joined with commas within their field.
+        Parameters
+        ----------
+        frequency_list : JapaneseFrequencyList
+            The frequency list to export
+        limit : int
+            The MAX number of words to export
+        combine : bool
+            Whether to combine the word slots into a single row each or not
+
+        Returns
+        -------
+        Iterator[str]
+            The rows of the CSV string, each ending in a newline
+        """
+        buffer = StringIO()
+        writer = csv.writer(buffer, delimiter=self.delimiter, lineterminator="\n")
+
+        writer.writerow(COLUMNS)
+
+        for slot in frequency_list.get_most_frequent(limit=limit):
+            if combine:
+                words = [slot.to_dict(combine=True)]
+            else:
+                words = [word.to_dict() for word in slot.words]
+
+            writer.writerows(
+                (
+                    word["representation"],
+                    word["surface"],
+                    word["frequency"],
+                    ",".join(word["types"]),
+                )
+                for word in words
+            )
+
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+
+class TsvExporter(CsvExporter):
+    delimiter: str = "\t"
@@ -3,10 +3,54 @@
 """
 
 import abc
-from typing import Generator
+import bz2
+import gzip
+import lzma
+from os import PathLike
+from os.path import splitext
+from typing import Generator, TextIO
 
 from ..jp_frequency_list import JapaneseFrequencyList
 
+COMPRESSION_OPENERS = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+"""The functions used to open compressed export files, keyed on compression name."""
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+"""The compression inferred from each file suffix."""
+
+
+def open_export_file(
+    file_path: str | PathLike, compression: str | None = "infer"
+) -> TextIO:
+    """
+    Opens a file to write an export to, compressing it if requested.
+    Parameters
+    ----------
+    file_path : str | PathLike
+        The path of the file.
+    compression : str | None
+        "gzip", "bz2", "xz", None for no compression, or "infer" to choose by the suffix of `file_path`.
+
+    Returns
+    -------
+    TextIO
+        The UTF-8 text file, written without newline translation.
+    """
+    if compression == "infer":
+        compression = COMPRESSION_SUFFIXES.get(splitext(file_path)[1].lower())
+
+    if compression is None:
+        return open(file_path, "w", encoding="utf-8", newline="")
+
+    if compression not in COMPRESSION_OPENERS:
+        raise ValueError(
+            f"open_export_file: Unknown compression '{compression}', expected one of {list(COMPRESSION_OPENERS)}"
+        )
+
+    return COMPRESSION_OPENERS[compression](
+        file_path, "wt", encoding="utf-8", newline=""
+    )
+
 
 class IExporter(metaclass=abc.ABCMeta):
     @abc.abstractmethod
@@ -26,3 +70,52 @@ class IExporter(metaclass=abc.ABCMeta):
         combine: bool = True,
     ) -> Generator[str, None, None]:
         raise NotImplementedError
+
+    def export_to(
+        self,
+        fp: TextIO,
+        frequency_list: JapaneseFrequencyList,
+        limit: int = 100,
+        combine: bool = False,
+    ) -> None:
+        """
+        Writes the export to a file object as it is generated, see `export_lazy`.
+        Parameters
+        ----------
+        fp : TextIO
+            The file object to write to.
+        frequency_list : JapaneseFrequencyList
+            The frequency list to export
+        limit : int
+            The MAX number of words to export
+        combine : bool
+            Whether to combine the word slots or not
+        """
+        for chunk in self.export_lazy(frequency_list, limit=limit, combine=combine):
+            fp.write(chunk)
+
+    def export_to_file(
+        self,
+        file_path: str | PathLike,
+        frequency_list: JapaneseFrequencyList,
+        limit: int = 100,
+        combine: bool = False,
+        compression: str | None = "infer",
+    ) -> None:
+        """
+        Streams the export to a file, optionally compressed, see `export_to` and `open_export_file`.
+        Parameters
+        ----------
+        file_path : str | PathLike
+            The path of the file to write.
+        frequency_list : JapaneseFrequencyList
+            The frequency list to export
+        limit : int
+            The MAX number of words to export
+        combine : bool
+            Whether to combine the word slots or not
+        compression : str | None
+            "gzip", "bz2", "xz", None for no compression, or "infer" to choose by the suffix of `file_path`.
+        """
+        with open_export_file(file_path, compression) as fp:
+            self.export_to(fp, frequency_list, limit=limit, combine=combine)
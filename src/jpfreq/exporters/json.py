@@ -4,10 +4,12 @@
 
 from json import dumps
 from collections import OrderedDict
-from typing import Iterable
+from typing import Iterator
 from ..jp_frequency_list import JapaneseFrequencyList
 from .iexporter import IExporter
 
+_INDENT = " " * 4
+
 
 class JsonExporter(IExporter):
     def __init__(self):
@@ -80,5 +82,61 @@ class JsonExporter(IExporter):
         frequency_list: JapaneseFrequencyList,
         limit: int = 100,
         combine: bool = False,
-    ) -> Iterable[str]:
-        return super().export_lazy(frequency_list, limit)
+    ) -> Iterator[str]:
+        """
+        Exports the frequency list to JSON one word slot at a time.
+
+        Joining the chunks gives exactly the string returned by `export`, but only one word slot is
+        converted at a time, so memory use doesn't grow with the number of word slots exported.
+        Parameters
+        ----------
+        frequency_list : JapaneseFrequencyList
+            The frequency list to export
+        limit : int
+            The MAX number of words to export
+        combine : bool
+            Whether to combine the word slots or not
+
+        Returns
+        -------
+        Iterator[str]
+            The chunks of the JSON string
+        """
+        text_info = _dumps_indented(
+            frequency_list.generate_text_info().to_dict(), _INDENT
+        )
+        yield f'{{\n{_INDENT}"text_info": {text_info},\n{_INDENT}"word_slots": ['
+
+        empty = True
+
+        for slot in frequency_list.get_most_frequent(limit=limit):
+            separator = "\n" if empty else ",\n"
+            empty = False
+
+            yield separator + _INDENT * 2 + _dumps_indented(
+                slot.to_dict(combine=combine), _INDENT * 2
+            )
+
+        if empty:
+            yield "]\n}"
+        else:
+            yield f"\n{_INDENT}]\n}}"
+
+
+def _dumps_indented(value: dict, indent: str) -> str:
+    """
+    Converts a value to JSON as `json.dumps` would when it is nested at the given indent.
+    Parameters
+    ----------
+    value : dict
+        The value to convert
+    indent : str
+        The indent of the line the value starts on
+
+    Returns
+    -------
+    str
+        The JSON string
+    """
+    # Newlines inside JSON strings are escaped, so every newline is between tokens
+    return dumps(value, ensure_ascii=False, indent=4).replace("\n", "\n" + indent)
@@ -0,0 +1,61 @@
+"""
+.. include:: ../../../documentation/exporters/ndjson.md
+"""
+
+from json import dumps
+from typing import Iterator
+from ..jp_frequency_list import JapaneseFrequencyList
+from .iexporter import IExporter
+
+
+class NdjsonExporter(IExporter):
+    def export(
+        self,
+        frequency_list: JapaneseFrequencyList,
+        limit: int = 100,
+        combine: bool = False,
+    ) -> str:
+        """
+        Exports the frequency list to newline delimited JSON, one word slot per line.
+        Parameters
+        ----------
+        frequency_list : JapaneseFrequencyList
+            The frequency list to export
+        limit : int
+            The MAX number of words to export
+        combine : bool
+            Whether to combine the word slots or not
+
+        Returns
+        -------
+        str
+            The NDJSON string
+        """
+        return "".join(self.export_lazy(frequency_list, limit=limit, combine=combine))
+
+    def export_lazy(
+        self,
+        frequency_list: JapaneseFrequencyList,
+        limit: int = 100,
+        combine: bool = False,
+    ) -> Iterator[str]:
+        """
+        Exports the frequency list to newline delimited JSON one line at a time.
+        Parameters
+        ----------
+        frequency_list : JapaneseFrequencyList
+            The frequency list to export
+        limit : int
+            The MAX number of words to export
+        combine : bool
+            Whether to combine the word slots or not
+
+        Returns
+        -------
+        Iterator[str]
+            The lines of the NDJSON string, each ending in a newline
+        """
+        for slot in frequency_list.get_most_frequent(limit=limit):
+            yield dumps(
+                slot.to_dict(combine=combine), ensure_ascii=False, separators=(",", ":")
+            ) + "\n"
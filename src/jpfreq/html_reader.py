@@ -0,0 +1,180 @@
+"""
+.. include:: ../../documentation/html_reader.md
+"""
+
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, TextIO
+
+from .reader import DEFAULT_MAX_CHUNK_SIZE, DEFAULT_READ_SIZE, SentenceChunker
+
+SKIPPED_TAGS = frozenset(("script", "style", "template"))
+"""Tags whose content is never shown, so it isn't counted."""
+
+BLOCK_TAGS = frozenset(
+    (
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "br",
+        "caption",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "li",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "td",
+        "th",
+        "title",
+        "tr",
+        "ul",
+    )
+)
+"""Tags that start and end a line, so text on either side of them is never joined."""
+
+
+class VisibleTextParser(HTMLParser):
+    """
+    An incremental HTML parser that keeps only the text a browser would show.
+
+    Feed it HTML in pieces of any size and take the text found so far with `take_text`.
+    The content of `SKIPPED_TAGS` is dropped, `BLOCK_TAGS` become newlines and character references are decoded.
+    """
+
+    _pieces: list[str]
+    _skipped_depth: int
+
+    def __init__(self):
+        """
+        Creates a VisibleTextParser.
+        """
+        super().__init__(convert_charrefs=True)
+        self._pieces = []
+        self._skipped_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skipped_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._pieces.append("\n")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS:
+            self._skipped_depth = max(self._skipped_depth - 1, 0)
+        elif tag in BLOCK_TAGS:
+            self._pieces.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skipped_depth:
+            self._pieces.append(data)
+
+    def take_text(self) -> str:
+        """
+        Returns the visible text parsed since the last call.
+        Returns
+        -------
+        str
+            The visible text, with newlines around block elements.
+        """
+        text = "".join(self._pieces)
+        self._pieces.clear()
+
+        return text
+
+
+def _iter_html_chunks(html_blocks: Iterable[str], max_chunk_size: int) -> Iterator[str]:
+    """
+    Splits the visible text of HTML into chunks as the HTML is parsed.
+    Parameters
+    ----------
+    html_blocks : Iterable[str]
+        The HTML, in blocks of any size.
+    max_chunk_size : int
+        The maximum number of characters in a chunk.
+
+    Returns
+    -------
+    Iterator[str]
+        The chunks, without newline characters. Empty chunks are skipped.
+    """
+    chunker = SentenceChunker(max_chunk_size)
+    parser = VisibleTextParser()
+
+    for block in html_blocks:
+        parser.feed(block)
+        yield from chunker.feed(parser.take_text())
+
+    parser.close()
+    yield from chunker.feed(parser.take_text())
+    yield from chunker.flush()
+
+
+def iter_html_text_chunks(
+    html: str,
+    max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
+    read_size: int = DEFAULT_READ_SIZE,
+) -> Iterator[str]:
+    """
+    Lazily splits the visible text of an HTML string into chunks, parsing it `read_size` characters at a time.
+    Parameters
+    ----------
+    html : str
+        The HTML to split.
+    max_chunk_size : int
+        The maximum number of characters in a chunk.
+    read_size : int
+        The number of characters parsed at a time.
+
+    Returns
+    -------
+    Iterator[str]
+        The chunks, without newline characters. Empty chunks are skipped.
+    """
+    return _iter_html_chunks(
+        (html[start : start + read_size] for start in range(0, len(html), read_size)),
+        max_chunk_size,
+    )
+
+
+def iter_html_file_chunks(
+    file: TextIO,
+    max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
+    read_size: int = DEFAULT_READ_SIZE,
+) -> Iterator[str]:
+    """
+    Lazily splits the visible text of an open HTML file into chunks, reading it `read_size` characters at a time.
+    Parameters
+    ----------
+    file : TextIO
+        The file to read from.
+    max_chunk_size : int
+        The maximum number of characters in a chunk.
+    read_size : int
+        The number of characters read at a time.
+
+    Returns
+    -------
+    Iterator[str]
+        The chunks, without newline characters. Empty chunks are skipped.
+    """
+    return _iter_html_chunks(iter(lambda: file.read(read_size), ""), max_chunk_size)
@@ -2,15 +2,47 @@
 .. include:: ../../documentation/jp_frequency_list.md
 """
 
-from fugashi import Tagger
-from typing import Callable
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+import threading
+from os import PathLike, cpu_count
 from os.path import isfile as file_exists
-
-from .word_slot import WordSlot, get_unique_wordslots
+from collections import Counter, deque
+from dataclasses import replace
+from itertools import islice
+from heapq import nlargest, nsmallest
+from operator import attrgetter, countOf
+from time import perf_counter
+
+from .word_slot import WordSlot
 from .text_info import TextInfo
-from .kanji import all_kanji_in_string, Kanji
+from .kanji import all_kanji_in_string, count_kanji_in_string, Kanji
 from .util import percent_of, in_range
-from .word import Word, WordType
+from .word import Word, WordType, word_types_mask
+from .reader import (
+    DEFAULT_MAX_CHUNK_SIZE,
+    DEFAULT_READ_SIZE,
+    SentenceChunker,
+    iter_file_chunks,
+    iter_text_chunks,
+)
+from .cache import LRUCache, CacheInfo
+from .snapshot import SnapshotCounts, read_snapshot, write_snapshot
+from .stats import ProcessingStats, Stage
+from .tagger_pool import DEFAULT_TAGGER_ARGUMENTS, DEFAULT_TAGGER_POOL
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fugashi import Tagger
+
+# fugashi, asyncio, concurrent.futures and html.parser are imported where they are first needed,
+# so importing this module and creating a list stay fast for processes that never tag text
 
 
 def word_validator_exclude_by_type(
@@ -24,18 +56,206 @@ def word_validator_exclude_by_type(
     input_word : UnidicNode
         The word to validate.
     excluded_word_types : list[str]
-        A list of word types to exclude. Defaults to `EXCLUDED_WORD_TYPES`.
+        A list of word types to exclude, e.g. `DEFAULT_EXCLUDED_WORD_TYPES`.
+
+    Returns
+    -------
+    bool
+        Whether the word is valid or not.
+    """
+    return word_validator_exclude_by_mask(
+        input_word, word_types_mask(excluded_word_types)
+    )
+
+
+def word_validator_exclude_by_mask(input_word: Word, excluded_mask: int) -> bool:
+    """
+    Validates a word by excluding it if any of its types are set in `excluded_mask`.
+
+    Parameters
+    ----------
+    input_word : Word
+        The word to validate.
+    excluded_mask : int
+        The mask of the word types to exclude, see `jpfreq.word.word_types_mask`.
 
     Returns
     -------
     bool
         Whether the word is valid or not.
     """
-    for word_type in input_word.types:
-        if word_type in excluded_word_types:
-            return False
+    return not word_types_mask(input_word.types) & excluded_mask
+
+
+DEFAULT_EXCLUDED_WORD_TYPES: list[WordType] = [
+    WordType.PARTICLE,
+    WordType.AUXILIARY_VERB,
+    WordType.SUPPLEMENTARY_SYMBOL,
+    WordType.BLANK_SPACE,
+    WordType.NUMERAL,
+]
+"""The word types excluded from a frequency list unless others are specified."""
+
+
+DEFAULT_PARALLEL_BATCH_SIZE = 512
+"""The number of lines sent to a worker process at a time when processing in parallel."""
+
+DEFAULT_WORD_CACHE_SIZE = 65536
+"""The default number of distinct tokens whose representation and types are cached."""
+
+DEFAULT_ASYNC_QUEUE_SIZE = 8
+"""The default number of batches waiting for or being tagged at once when processing asynchronously."""
+
+DEFAULT_TAG_BATCH_SIZE = 0
+"""The default maximum number of characters tagged in a single Tagger call. 0 tags every line on its own."""
+
+DEFAULT_LINE_CACHE_SIZE = 0
+"""The default number of distinct lines whose counts are cached. 0 disables the line cache."""
+
+_worker_list: "JapaneseFrequencyList | None" = None
+
+
+def _init_parallel_worker(settings: dict) -> None:
+    """
+    Initialises a worker process used for parallel processing, giving it its own Tagger.
+
+    Parameters
+    ----------
+    settings : dict
+        The processing settings of the frequency list that started the worker, see `_worker_settings`.
+    """
+    global _worker_list
+
+    _worker_list = JapaneseFrequencyList(**settings)
+
+
+def _process_lines_in_worker(
+    lines: list[str],
+) -> tuple[dict[str, WordSlot], dict[str, Kanji], int]:
+    """
+    Counts a batch of lines inside a worker process.
+
+    Parameters
+    ----------
+    lines : list[str]
+        The lines to count.
+
+    Returns
+    -------
+    tuple[dict[str, WordSlot], dict[str, Kanji], int]
+        The word slots, kanji and word count of the batch.
+    """
+    _worker_list.process_lines(lines)
+
+    return _worker_list._take_counts()
+
+
+async def _read_files_async(file_paths: list[str]) -> AsyncIterator[str]:
+    """
+    Reads several files in blocks without blocking the event loop, ending each file with a newline.
+
+    Parameters
+    ----------
+    file_paths : list[str]
+        The paths to the files to read.
+
+    Returns
+    -------
+    AsyncIterator[str]
+        The blocks of the files, in order.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+
+    for file_path in file_paths:
+        with open(file_path, "r", encoding="utf-8") as fs:
+            while block := await loop.run_in_executor(None, fs.read, DEFAULT_READ_SIZE):
+                yield block
+
+        yield "\n"
+
+
+def _batched(items: Iterable[str], batch_size: int) -> Iterator[list[str]]:
+    """
+    Splits an iterable into lists of at most `batch_size` items.
+
+    Parameters
+    ----------
+    items : Iterable[str]
+        The items to split.
+    batch_size : int
+        The maximum size of each batch.
+
+    Returns
+    -------
+    Iterator[list[str]]
+        The batches, in order.
+    """
+    iterator = iter(items)
+
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def _pack_lines(lines: Iterable[str], max_size: int) -> Iterator[str]:
+    """
+    Joins consecutive lines with newlines into texts of at most `max_size` characters.
+
+    MeCab treats the newlines as whitespace, so no token spans two lines.
+    A line longer than `max_size` is returned on its own.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines to join.
+    max_size : int
+        The maximum number of characters in each text.
+
+    Returns
+    -------
+    Iterator[str]
+        The joined texts, in order.
+    """
+    batch = []
+    size = -1
+
+    for line in lines:
+        line = line.replace("\n", "").strip()
+
+        if batch and size + 1 + len(line) > max_size:
+            yield "\n".join(batch)
+            batch = []
+            size = -1
+
+        batch.append(line)
+        size += 1 + len(line)
+
+    if batch:
+        yield "\n".join(batch)
+
+
+def _resolve_jobs(jobs: int) -> int:
+    """
+    Resolves the number of worker processes to use.
+
+    Parameters
+    ----------
+    jobs : int
+        The requested number of processes. -1 means one per CPU core.
+
+    Returns
+    -------
+    int
+        The number of processes to use.
+    """
+    if jobs == -1:
+        return cpu_count() or 1
 
-    return True
+    if jobs < 1:
+        raise ValueError(f"jobs must be a positive integer or -1, not {jobs}")
+
+    return jobs
 
 
 class JapaneseFrequencyList:
@@ -46,16 +266,21 @@ class JapaneseFrequencyList:
     _unique_words: dict[str, WordSlot]
     _unique_kanji: dict[str, Kanji]
     _word_count: int
-    _tagger: Tagger
+    _tagger: "Tagger | None"
+    _pooled_taggers: threading.local
     _word_validator: Callable[[Word], bool]
-    compare_surface: bool
-    excluded_word_types: list[WordType] = [
-        WordType.PARTICLE,
-        WordType.AUXILIARY_VERB,
-        WordType.SUPPLEMENTARY_SYMBOL,
-        WordType.BLANK_SPACE,
-        WordType.NUMERAL,
-    ]
+    _word_cache: LRUCache | None
+    _line_cache: LRUCache | None
+    _excluded_word_types: list[WordType]
+    _excluded_word_types_mask: int
+    _surface_index: dict[str, str] | None
+    _shared_surfaces: set[str]
+    _stats: ProcessingStats | None
+    _frequency_buckets: dict[int, dict[str, int]]
+    _kanji_used_once: int
+    _next_slot_order: int
+    max_chunk_size: int
+    tag_batch_size: int
 
     def __init__(
         self,
@@ -63,23 +288,57 @@ class JapaneseFrequencyList:
         tagger_instance=None,
         compare_surface: bool = False,
         excluded_word_types: list[WordType] = None,
+        max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
+        word_cache_size: int = DEFAULT_WORD_CACHE_SIZE,
+        tag_batch_size: int = DEFAULT_TAG_BATCH_SIZE,
+        collect_stats: bool = False,
+        line_cache_size: int = DEFAULT_LINE_CACHE_SIZE,
     ):
         self._unique_words = {}
         self._unique_kanji = {}
         self._word_count = 0
+        self._frequency_buckets = {}
+        self._next_slot_order = 0
+        self._kanji_used_once = 0
+        self._word_cache = LRUCache(word_cache_size) if word_cache_size > 0 else None
+        self._line_cache = LRUCache(line_cache_size) if line_cache_size > 0 else None
+        self._surface_index = None
+        self._shared_surfaces = set()
         self.compare_surface = compare_surface
+        self._stats = ProcessingStats() if collect_stats else None
+
+        if max_chunk_size < 1:
+            raise ValueError(
+                f"JapaneseFrequencyList: max_chunk_size must be at least 1, not {max_chunk_size}"
+            )
 
-        if excluded_word_types is not None:
-            self.excluded_word_types = excluded_word_types
+        self.max_chunk_size = max_chunk_size
 
-        self._tagger = tagger_instance
-        if not self._tagger:
-            self._tagger = Tagger("-Owakati")
-        elif not isinstance(self._tagger, Tagger):
-            raise TypeError(
-                f"JapaneseFrequencyList: tagger_instance must be of type fugashi.Tagger, not {type(self._tagger)}"
+        if tag_batch_size < 0:
+            raise ValueError(
+                f"JapaneseFrequencyList: tag_batch_size must not be negative, not {tag_batch_size}"
             )
 
+        self.tag_batch_size = tag_batch_size
+
+        if excluded_word_types is None:
+            excluded_word_types = list(DEFAULT_EXCLUDED_WORD_TYPES)
+
+        self.excluded_word_types = excluded_word_types
+
+        self._tagger = None
+        self._pooled_taggers = threading.local()
+
+        if tagger_instance:
+            from fugashi import Tagger
+
+            if not isinstance(tagger_instance, Tagger):
+                raise TypeError(
+                    f"JapaneseFrequencyList: tagger_instance must be of type fugashi.Tagger, not {type(tagger_instance)}"
+                )
+
+            self._tagger = tagger_instance
+
         if text_to_analyse is not None:
             self.process_texts(text_to_analyse)
 
@@ -91,7 +350,7 @@ class JapaneseFrequencyList:
         int
             The number of unique words in the frequency list.
         """
-        return len(self.wordslots)
+        return len(self._unique_words)
 
     def __repr__(self) -> str:  # pragma: no cover
         """
@@ -103,6 +362,48 @@ class JapaneseFrequencyList:
         text_info = self.generate_text_info()
         return f"JapaneseFrequencyList(\ntext_info={text_info!r}\n)"
 
+    def __add__(self, other: "JapaneseFrequencyList") -> "JapaneseFrequencyList":
+        """
+        Creates a new frequency list containing the counts of both frequency lists.
+        Neither frequency list is modified.
+        Parameters
+        ----------
+        other : JapaneseFrequencyList
+            The frequency list to add.
+
+        Returns
+        -------
+        JapaneseFrequencyList
+            The combined frequency list.
+        """
+        if not isinstance(other, JapaneseFrequencyList):
+            return NotImplemented
+
+        combined = self.copy()
+        combined.merge(other)
+
+        return combined
+
+    def __iadd__(self, other: "JapaneseFrequencyList") -> "JapaneseFrequencyList":
+        """
+        Adds the counts of another frequency list to this one.
+        Parameters
+        ----------
+        other : JapaneseFrequencyList
+            The frequency list to add.
+
+        Returns
+        -------
+        JapaneseFrequencyList
+            This frequency list.
+        """
+        if not isinstance(other, JapaneseFrequencyList):
+            return NotImplemented
+
+        self.merge(other)
+
+        return self
+
     def __contains__(self, word: str) -> bool:
         """
         Whether the representation of a word is in the frequency list.
@@ -118,12 +419,10 @@ class JapaneseFrequencyList:
         bool
             Whether the word is in the frequency list.
         """
-        contains = word in self._unique_words
-
-        if self.compare_surface and not contains:
-            contains = any(word in word_slot for word_slot in self.wordslots)
+        if word in self._unique_words:
+            return True
 
-        return contains
+        return self._surface_index is not None and word in self._surface_index
 
     def __getitem__(self, word: str) -> WordSlot:
         """
@@ -131,6 +430,9 @@ class JapaneseFrequencyList:
         This will search using the word's representation, not its surface.
         This means that if you pass "これ", it will fail, as the representation is "此れ".
         Please see the function `get_representation` in this class to get the representation of a word.
+
+        If `compare_surface` is True, surfaces are searched too when no representation matches.
+        A surface shared by several representations returns the slot of the first one counted.
         Parameters
         ----------
         word
@@ -139,10 +441,18 @@ class JapaneseFrequencyList:
         -------
 
         """
-        if word not in self._unique_words.keys():
+        word_slot = self._unique_words.get(word)
+
+        if word_slot is None and self._surface_index is not None:
+            representation = self._surface_index.get(word)
+
+            if representation is not None:
+                word_slot = self._unique_words[representation]
+
+        if word_slot is None:
             raise KeyError(f"Word '{word}' not found in frequency list")
 
-        return self._unique_words[word]
+        return word_slot
 
     @property
     def wordslots(self) -> list[WordSlot]:
@@ -155,6 +465,170 @@ class JapaneseFrequencyList:
         """
         return list(self._unique_words.values())
 
+    @property
+    def tagger(self) -> "Tagger":
+        """
+        The Tagger used to tag text.
+
+        Unless one was passed to the constructor, this is the Tagger of the current thread from
+        `jpfreq.tagger_pool.DEFAULT_TAGGER_POOL`. It is fetched the first time text is tagged, so creating a list
+        is cheap and lists that only load, merge or export never load the MeCab dictionary. Lists used from
+        several threads tag with each thread's own Tagger.
+        Returns
+        -------
+        Tagger
+            The Tagger of the frequency list.
+        """
+        if self._tagger is not None:
+            return self._tagger
+
+        # Kept per thread, as a single attribute could be swapped by another thread between checking and reading it
+        tagger = getattr(self._pooled_taggers, "tagger", None)
+
+        if tagger is None:
+            tagger = self._pooled_taggers.tagger = DEFAULT_TAGGER_POOL.get(
+                DEFAULT_TAGGER_ARGUMENTS
+            )
+
+        return tagger
+
+    @property
+    def compare_surface(self) -> bool:
+        """
+        Whether lookups also match the surfaces of words, not only their representations.
+
+        When enabled, an index from each surface to its representation is kept up to date as words are added,
+        so surface lookups take constant time. Enabling it on a filled list builds the index once.
+        Returns
+        -------
+        bool
+            Whether lookups also match surfaces.
+        """
+        return self._surface_index is not None
+
+    @compare_surface.setter
+    def compare_surface(self, compare_surface: bool) -> None:
+        """
+        Enables or disables matching surfaces in lookups, building or dropping the surface index.
+        Parameters
+        ----------
+        compare_surface : bool
+            Whether lookups should also match surfaces.
+        """
+        if not compare_surface:
+            self._surface_index = None
+            self._shared_surfaces.clear()
+            return
+
+        if self._surface_index is None:
+            self._surface_index = {}
+            self._index_surfaces(self._unique_words.items())
+
+    @property
+    def excluded_word_types(self) -> list[WordType]:
+        """
+        The word types excluded from the frequency list.
+
+        These are compiled into a bitmask when set, so assign a new list rather than modifying this one in place.
+        Returns
+        -------
+        list[WordType]
+            The excluded word types.
+        """
+        return self._excluded_word_types
+
+    @excluded_word_types.setter
+    def excluded_word_types(self, excluded_word_types: list[WordType]) -> None:
+        """
+        Sets the word types excluded from the frequency list, compiling them into a bitmask.
+        Parameters
+        ----------
+        excluded_word_types : list[WordType]
+            The word types to exclude.
+        """
+        self._excluded_word_types = excluded_word_types
+        self._excluded_word_types_mask = word_types_mask(excluded_word_types)
+
+        # Cached lines only hold the words that were valid when they were counted
+        if self._line_cache is not None:
+            self._line_cache.clear()
+
+    @property
+    def collect_stats(self) -> bool:
+        """
+        Whether timings and counters are collected while lines are processed, see `stats`.
+
+        Collecting stats times each stage of every line, which slows processing down.
+        When disabled, the only cost is a single check per line.
+        Returns
+        -------
+        bool
+            Whether stats are collected.
+        """
+        return self._stats is not None
+
+    @collect_stats.setter
+    def collect_stats(self, collect_stats: bool) -> None:
+        """
+        Starts or stops collecting stats. Stopping discards the stats collected so far.
+        Parameters
+        ----------
+        collect_stats : bool
+            Whether stats should be collected.
+        """
+        if not collect_stats:
+            self._stats = None
+        elif self._stats is None:
+            self._stats = ProcessingStats()
+
+    @property
+    def stats(self) -> ProcessingStats | None:
+        """
+        The timings and counters collected while processing lines in this process.
+
+        Lines processed by worker processes or threads, with `jobs` above 1 or asynchronously, aren't included.
+        Returns
+        -------
+        ProcessingStats | None
+            The stats, or None if `collect_stats` is False.
+        """
+        return self._stats
+
+    def reset_stats(self) -> None:
+        """
+        Resets the collected stats to zero, if stats are collected.
+        """
+        if self._stats is not None:
+            self._stats.reset()
+
+    @property
+    def word_cache_info(self) -> CacheInfo:
+        """
+        Returns statistics about the cache of token representations and types used while parsing.
+        Returns
+        -------
+        CacheInfo
+            The hits, misses, maximum size and current size of the cache. All zero if the cache is disabled.
+        """
+        if self._word_cache is None:
+            return CacheInfo(0, 0, 0, 0)
+
+        return self._word_cache.cache_info()
+
+    @property
+    def line_cache_info(self) -> CacheInfo:
+        """
+        Returns statistics about the cache of line counts, see `process_line`.
+        Returns
+        -------
+        CacheInfo
+            The hits, misses, maximum size and current size of the cache. All zero if the cache is disabled.
+        """
+        if self._line_cache is None:
+            return CacheInfo(0, 0, 0, 0)
+
+        return self._line_cache.cache_info()
+
     @property
     def word_count(self) -> int:
         """
@@ -175,7 +649,7 @@ class JapaneseFrequencyList:
         int
             The number of unique words.
         """
-        return len(self.wordslots)
+        return len(self._unique_words)
 
     @property
     def unique_words_used_once(self) -> int:
@@ -186,7 +660,7 @@ class JapaneseFrequencyList:
         int
             The number of unique words used once.
         """
-        return len(get_unique_wordslots(self.wordslots))
+        return len(self._frequency_buckets.get(1, ()))
 
     @property
     def unique_words_all(self) -> tuple[int, int, float]:
@@ -225,9 +699,7 @@ class JapaneseFrequencyList:
         int
             The number of unique kanji used once.
         """
-        return len(
-            [kanji for kanji in self._unique_kanji.values() if kanji.frequency == 1]
-        )
+        return self._kanji_used_once
 
     @property
     def unique_kanji_all(self) -> tuple[int, int, float]:
@@ -256,6 +728,96 @@ class JapaneseFrequencyList:
 
         self._unique_words.clear()
         self._unique_kanji.clear()
+        self._frequency_buckets.clear()
+        self._next_slot_order = 0
+        self._kanji_used_once = 0
+
+        if self._surface_index is not None:
+            self._surface_index.clear()
+            self._shared_surfaces.clear()
+
+    def copy(self) -> "JapaneseFrequencyList":
+        """
+        Creates a copy of the frequency list. The copy shares this list's Tagger, or its Tagger pool.
+        Returns
+        -------
+        JapaneseFrequencyList
+            The copied frequency list.
+        """
+        copied = type(self)(
+            tagger_instance=self._tagger,
+            compare_surface=self.compare_surface,
+            excluded_word_types=list(self.excluded_word_types),
+            max_chunk_size=self.max_chunk_size,
+            word_cache_size=self.word_cache_info.maxsize,
+            tag_batch_size=self.tag_batch_size,
+            collect_stats=self.collect_stats,
+            line_cache_size=self.line_cache_info.maxsize,
+        )
+        copied._absorb(*self._counts(), copy=True)
+
+        return copied
+
+    def merge(self, other: "JapaneseFrequencyList") -> None:
+        """
+        Adds the words, kanji and word count of another frequency list to this one.
+
+        Word slots are combined by summing the frequencies of each surface.
+        This is linear in the size of `other`, so when reducing many lists it is cheapest to merge the
+        smaller lists into the larger ones. `other` is not modified.
+        Parameters
+        ----------
+        other : JapaneseFrequencyList
+            The frequency list to merge into this one.
+        """
+        if not isinstance(other, JapaneseFrequencyList):
+            raise TypeError(
+                f"JapaneseFrequencyList: can only merge with a JapaneseFrequencyList, not {type(other)}"
+            )
+
+        self._absorb(*other._counts(), copy=True)
+
+    def save(self, file_path: str | PathLike) -> None:
+        """
+        Saves the words, surfaces, types, kanji and word count of the frequency list to a binary snapshot.
+
+        Settings such as `excluded_word_types` are not saved. See `jpfreq.snapshot` for the format.
+        Parameters
+        ----------
+        file_path : str | PathLike
+            The path to save the snapshot to.
+        """
+        with open(file_path, "wb") as fs:
+            write_snapshot(fs, *self._counts())
+
+    @classmethod
+    def load(cls, file_path: str | PathLike, **kwargs) -> "JapaneseFrequencyList":
+        """
+        Loads a frequency list from a snapshot created by `save`.
+
+        Word types are loaded as shared `jpfreq.word.WordTypes`.
+        Parameters
+        ----------
+        file_path : str | PathLike
+            The path of the snapshot to load.
+        **kwargs
+            Passed to the constructor of the frequency list, e.g. `tagger_instance`.
+
+        Returns
+        -------
+        JapaneseFrequencyList
+            The loaded frequency list.
+        """
+        if not file_exists(file_path):
+            raise FileExistsError(f"load: File path passed doesn't exist ({file_path})")
+
+        with open(file_path, "rb") as fs:
+            counts = read_snapshot(fs.read())
+
+        freq_list = cls(**kwargs)
+        freq_list._absorb(*counts)
+
+        return freq_list
 
     def get_most_frequent(
         self, limit: int = 100, minimum: int = -1, maximum: int = -1
@@ -275,29 +837,72 @@ class JapaneseFrequencyList:
         -------
         list[WordSlot]
             A list of the most frequent words in the text with the specified limit, sorted by frequency.
+            Words with the same frequency are in the order they were first counted.
         """
-        item_array: list[WordSlot] = sorted(
-            self.wordslots, key=lambda x: x.frequency, reverse=True
-        )
-
         if minimum != -1 or maximum != -1:
-            item_array = [
-                item
-                for item in item_array
-                if in_range(item.frequency, minimum, maximum)
-            ]
+            return self._get_most_frequent_in_range(limit, minimum, maximum)
 
-        if limit == -1 or limit > len(item_array):
-            return item_array
+        if limit == -1:
+            return sorted(
+                self._unique_words.values(), key=attrgetter("frequency"), reverse=True
+            )
 
-        return item_array[:limit]
+        return nlargest(limit, self._unique_words.values(), key=attrgetter("frequency"))
 
-    def generate_text_info(self) -> TextInfo:
+    def _get_most_frequent_in_range(
+        self, limit: int, minimum: int, maximum: int
+    ) -> list[WordSlot]:
         """
-        Generates a TextInfo object from the frequency list.
+        Returns the most frequent words within a frequency range, only visiting the word slots in that range.
+        Parameters
+        ----------
+        limit : int
+            The number of words to return. -1 returns all words in the range.
+        minimum : int
+            The minimum frequency of the words to return (inclusive). -1 means no minimum.
+        maximum : int
+            The maximum frequency of the words to return (inclusive). -1 means no maximum.
+
         Returns
         -------
-        TextInfo
+        list[WordSlot]
+            The most frequent words within the range, sorted by frequency.
+        """
+        frequencies = sorted(
+            (
+                frequency
+                for frequency in self._frequency_buckets
+                if in_range(frequency, minimum, maximum)
+            ),
+            reverse=True,
+        )
+        item_array: list[WordSlot] = []
+
+        for frequency in frequencies:
+            if limit != -1 and len(item_array) >= limit:
+                break
+
+            bucket = self._frequency_buckets[frequency]
+
+            if limit == -1:
+                representations = sorted(bucket, key=bucket.__getitem__)
+            else:
+                representations = nsmallest(
+                    limit - len(item_array), bucket, key=bucket.__getitem__
+                )
+
+            item_array.extend(
+                self._unique_words[representation] for representation in representations
+            )
+
+        return item_array
+
+    def generate_text_info(self) -> TextInfo:
+        """
+        Generates a TextInfo object from the frequency list.
+        Returns
+        -------
+        TextInfo
             A TextInfo object containing information about the text.
         """
         (
@@ -330,10 +935,57 @@ class JapaneseFrequencyList:
             The kanji to add.
         """
         if kanji.representation in self._unique_kanji:
-            self._unique_kanji[kanji.representation].frequency += 1
+            existing_kanji = self._unique_kanji[kanji.representation]
+            self._count_kanji_used_once(
+                existing_kanji.frequency, existing_kanji.frequency + 1
+            )
+            existing_kanji.frequency += 1
             return
 
         self._unique_kanji[kanji.representation] = kanji
+        self._count_kanji_used_once(0, kanji.frequency)
+
+    def add_kanji_counts(self, kanji_counts: Mapping[str, int]) -> None:
+        """
+        Adds several occurrences of kanji to the frequency list at once.
+        Parameters
+        ----------
+        kanji_counts : Mapping[str, int]
+            The number of occurrences of each kanji character, see `jpfreq.kanji.count_kanji_in_string`.
+        """
+        for character, count in kanji_counts.items():
+            kanji = self._unique_kanji.get(character)
+
+            if kanji is None:
+                self._unique_kanji[character] = Kanji(character, count)
+                self._count_kanji_used_once(0, count)
+            else:
+                self._count_kanji_used_once(kanji.frequency, kanji.frequency + count)
+                kanji.frequency += count
+
+    def remove_kanji_counts(self, kanji_counts: Mapping[str, int]) -> None:
+        """
+        Removes several occurrences of kanji from the frequency list at once, the reverse of `add_kanji_counts`.
+        Kanji whose frequency reaches 0 are removed.
+        Parameters
+        ----------
+        kanji_counts : Mapping[str, int]
+            The number of occurrences of each kanji character to remove.
+        """
+        for character, count in kanji_counts.items():
+            kanji = self._unique_kanji.get(character)
+
+            if kanji is None or kanji.frequency < count:
+                raise ValueError(
+                    f"remove_kanji_counts: can't remove {count} of '{character}', "
+                    f"only {kanji.frequency if kanji else 0} counted"
+                )
+
+            self._count_kanji_used_once(kanji.frequency, kanji.frequency - count)
+            kanji.frequency -= count
+
+            if not kanji.frequency:
+                del self._unique_kanji[character]
 
     def validate_word(self, word: Word) -> bool:
         """
@@ -349,14 +1001,14 @@ class JapaneseFrequencyList:
         bool
             Whether the word is valid or not.
         """
-        return word_validator_exclude_by_type(word, self.excluded_word_types)
+        return word_validator_exclude_by_mask(word, self._excluded_word_types_mask)
 
     def add_word(self, word: Word) -> None:
         """
         Adds a word to the frequency list.
 
-        If the word is already in the list, then the frequency is increased by 1.
-        Otherwise, the word is added to the list with a frequency of 1.
+        If the word is already in the list, then its frequency is increased by the frequency of the word, usually 1.
+        Otherwise, the word is added to the list with the frequency of the word.
 
         Note: This method assumes the word is valid.
 
@@ -365,14 +1017,52 @@ class JapaneseFrequencyList:
         word : Word
             The word to add.
         """
-        self._word_count += 1
+        self._word_count += word.frequency
+
+        if self._surface_index is not None:
+            self._index_surface(word.surface, word.representation)
+
+        word_slot = self._unique_words.get(word.representation)
 
-        if word.representation in self._unique_words.keys():
-            self._unique_words[word.representation].add_word(word)
+        if word_slot is not None:
+            old_frequency = word_slot.frequency
+            word_slot.add_word(word)
+            self._move_bucket(word.representation, old_frequency, word_slot.frequency)
             return
 
         # if there is no representation of this word then we must add one
-        self._unique_words[word.representation] = WordSlot([word])
+        word_slot = self._unique_words[word.representation] = WordSlot([word])
+        self._add_to_bucket(word.representation, word_slot.frequency)
+
+    def remove_word(self, word: Word) -> None:
+        """
+        Removes occurrences of a word from the frequency list, the reverse of `add_word`.
+
+        The frequency of the word's surface is decreased by the frequency of the word, usually 1.
+        Surfaces and word slots whose frequency reaches 0 are removed, so the list is the same as if
+        the word had never been added, apart from the order of words with the same frequency.
+        Parameters
+        ----------
+        word : Word
+            The word to remove.
+        """
+        word_slot = self._unique_words.get(word.representation)
+
+        if word_slot is None:
+            raise KeyError(f"Word '{word.representation}' not found in frequency list")
+
+        old_frequency = word_slot.frequency
+        word_slot.remove_word(word)
+        self._word_count -= word.frequency
+
+        if word_slot.frequency:
+            self._move_bucket(word.representation, old_frequency, word_slot.frequency)
+        else:
+            del self._unique_words[word.representation]
+            self._remove_from_bucket(word.representation, old_frequency)
+
+        if self._surface_index is not None and word.surface not in word_slot:
+            self._unindex_surface(word.surface, word.representation)
 
     def get_representation(self, word: str) -> str:
         """
@@ -411,38 +1101,436 @@ class JapaneseFrequencyList:
         tuple[list[Word], list[Kanji]]
             A tuple containing the list of Words and the list of Kanji.
         """
-        words = self._tagger(line)
+        return self._parse_words(line), all_kanji_in_string(line)
 
-        return [Word.from_node(word) for word in words], all_kanji_in_string(line)
+    def _parse_words(self, line: str) -> list[Word]:
+        """
+        Tags a line of text, returning its Words.
+        Parameters
+        ----------
+        line : str
+            The line to parse.
+
+        Returns
+        -------
+        list[Word]
+            The Words of the line, valid or not.
+        """
+        return [Word.from_node(node, self._word_cache) for node in self.tagger(line)]
 
     def process_line(self, line_to_process: str) -> None:
         """
         Parses a line, adding the valid words and all kanji to the frequency list.
         All other processing functions boil down to this.
 
+        If the list has a line cache, the counts of each distinct line are cached, so a repeated line is added
+        without tagging it again. The cache isn't used while collecting stats, so that every stage is timed.
+
         Parameters
         ----------
         line_to_process : str
             The line to process.
         """
+        if self._stats is not None:
+            self._process_line_with_stats(line_to_process)
+            return
+
+        if self._line_cache is not None:
+            self._process_line_cached(line_to_process)
+            return
+
+        line_to_process = line_to_process.replace("\n", "").strip()
+
+        self.add_kanji_counts(count_kanji_in_string(line_to_process))
+        [
+            self.add_word(word)
+            for word in self._parse_words(line_to_process)
+            if self.validate_word(word)
+        ]
+
+    def _process_line_cached(self, line_to_process: str) -> None:
+        """
+        Does the same as `process_line`, reusing the counts of lines seen before.
+        Parameters
+        ----------
+        line_to_process : str
+            The line to process.
+        """
+        self._add_tagged_line(*self._tag_line(line_to_process))
+
+    def _tag_line(self, line_to_process: str) -> tuple[list[Word], dict[str, int]]:
+        """
+        Tags a line without adding it to the frequency list, using the line cache if any.
+        Parameters
+        ----------
+        line_to_process : str
+            The line to tag.
+
+        Returns
+        -------
+        tuple[list[Word], dict[str, int]]
+            New Words for the valid tokens of the line and the kanji counts of the line.
+            Add them with `_add_tagged_line`.
+        """
         line_to_process = line_to_process.replace("\n", "").strip()
-        words, kanji = self.parse_line(line_to_process)
 
-        [self.add_kanji(kanji) for kanji in kanji]
-        [self.add_word(word) for word in words if self.validate_word(word)]
+        if self._line_cache is None:
+            return [
+                word
+                for word in self._parse_words(line_to_process)
+                if self.validate_word(word)
+            ], count_kanji_in_string(line_to_process)
+
+        line_counts = self._line_cache.get(line_to_process)
+
+        if line_counts is None:
+            line_counts = self._line_counts(
+                line_to_process, self.tagger(line_to_process)
+            )
+            self._line_cache.put(line_to_process, line_counts)
+
+        word_counts, kanji_counts = line_counts
+
+        return [Word(*word_count) for word_count in word_counts], kanji_counts
+
+    def _add_tagged_line(self, words: list[Word], kanji_counts: dict[str, int]) -> None:
+        """
+        Adds a line tagged by `_tag_line` to the frequency list.
+        Parameters
+        ----------
+        words : list[Word]
+            The valid words of the line. Stored as is.
+        kanji_counts : dict[str, int]
+            The kanji counts of the line.
+        """
+        self.add_kanji_counts(kanji_counts)
+        [self.add_word(word) for word in words]
+
+    def _line_counts(self, line: str, nodes: list) -> tuple:
+        """
+        The counts of a line as kept in the line cache.
+        Parameters
+        ----------
+        line : str
+            The line, stripped.
+        nodes : list
+            The nodes the Tagger split the line into.
+
+        Returns
+        -------
+        tuple
+            The representation, surface, types and frequency of each valid word, and the kanji counts of the line.
+        """
+        return (
+            tuple(
+                (word.representation, word.surface, word.types, word.frequency)
+                for word in self._count_valid_nodes(nodes)
+            ),
+            count_kanji_in_string(line),
+        )
+
+    def _add_line_counts(self, line_counts: tuple) -> None:
+        """
+        Adds the counts of a line created by `_line_counts` to the frequency list.
+        Parameters
+        ----------
+        line_counts : tuple
+            The counts of the line.
+        """
+        word_counts, kanji_counts = line_counts
+
+        self.add_kanji_counts(kanji_counts)
+
+        for representation, surface, types, frequency in word_counts:
+            self.add_word(Word(representation, surface, types, frequency))
+
+    def _count_valid_words(self, text: str) -> list[Word]:
+        """
+        Tags text, counting each distinct valid token once.
+        Parameters
+        ----------
+        text : str
+            The text to tag.
+
+        Returns
+        -------
+        list[Word]
+            A Word per distinct valid token with the number of times it occurs as its frequency,
+            in the order the tokens first appear.
+        """
+        return self._count_valid_nodes(self.tagger(text))
+
+    def _count_valid_nodes(self, nodes: list) -> list[Word]:
+        """
+        Counts each distinct valid token of tagged text once.
+        Parameters
+        ----------
+        nodes : list
+            The nodes the Tagger split the text into.
+
+        Returns
+        -------
+        list[Word]
+            A Word per distinct valid token with the number of times it occurs as its frequency,
+            in the order the tokens first appear.
+        """
+        tokens = [(node.surface, node.feature_raw) for node in nodes]
+        nodes_by_token = dict(zip(tokens, nodes))
+        words = []
+
+        for token, count in Counter(tokens).items():
+            word = Word.from_node(nodes_by_token[token], self._word_cache)
+            word.frequency = count
+
+            if self.validate_word(word):
+                words.append(word)
+
+        return words
+
+    def _process_line_with_stats(self, line_to_process: str) -> None:
+        """
+        Does the same as `process_line`, timing each stage into `stats`.
+        Parameters
+        ----------
+        line_to_process : str
+            The line to process.
+        """
+        stats = self._stats
+        start = perf_counter()
+        line_to_process = line_to_process.replace("\n", "").strip()
+
+        kanji_counts = count_kanji_in_string(line_to_process)
+        counted = perf_counter()
+        self.add_kanji_counts(kanji_counts)
+        kanji_added = perf_counter()
+        nodes = self.tagger(line_to_process)
+        tagged = perf_counter()
+
+        parse_time = validate_time = add_time = 0
+        words = 0
+
+        for node in nodes:
+            parse_start = perf_counter()
+            word = Word.from_node(node, self._word_cache)
+            parsed = perf_counter()
+            valid = self.validate_word(word)
+            validated = perf_counter()
+            parse_time += parsed - parse_start
+            validate_time += validated - parsed
+
+            if valid:
+                self.add_word(word)
+                add_time += perf_counter() - validated
+                words += 1
+
+        line_time = perf_counter() - start
+
+        stats.record(Stage.COUNT_KANJI, counted - start)
+        stats.record(Stage.ADD_KANJI, kanji_added - counted)
+        stats.record(Stage.TAG, tagged - kanji_added)
+        stats.record(Stage.PARSE, parse_time, len(nodes))
+        stats.record(Stage.VALIDATE, validate_time, len(nodes))
+        stats.record(Stage.ADD_WORD, add_time, words)
+        stats.lines += 1
+        stats.tokens += len(nodes)
+        stats.words += words
+        stats.time += line_time
+        stats.latency.add(line_time)
+
+    def process_lines(self, lines_to_process: Iterable[str]) -> None:
+        """
+        Parses several lines in order, adding the valid words and all kanji to the frequency list.
+
+        If `tag_batch_size` is above 0, consecutive lines are joined with newlines and tagged together in a single
+        Tagger call of at most `tag_batch_size` characters, which is much cheaper for many short lines. No token
+        spans two lines, but MeCab sees the end of the previous line as context, so a few ambiguous tokens at
+        the start of a line may be analysed differently than when the line is tagged on its own.
+
+        If the list also has a line cache, each line is looked up before packing and only the lines missing from
+        the cache are tagged, once per batch even if repeated. Their counts are then cached as tagged in the batch.
+
+        Parameters
+        ----------
+        lines_to_process : Iterable[str]
+            The lines to process.
+        """
+        if not self.tag_batch_size:
+            [self.process_line(line) for line in lines_to_process]
+            return
+
+        if self._line_cache is not None and self._stats is None:
+            self._process_lines_cached(lines_to_process)
+            return
+
+        for text in _pack_lines(lines_to_process, self.tag_batch_size):
+            self._process_packed_lines(text)
+
+    def _process_lines_cached(self, lines_to_process: Iterable[str]) -> None:
+        """
+        Does the same as `process_lines` with a line cache, tagging the lines missing from the cache in batches.
+
+        Lines are added in order, so lines after a miss wait until its batch is tagged.
+        Parameters
+        ----------
+        lines_to_process : Iterable[str]
+            The lines to process.
+        """
+        # The cached counts of each waiting line, or the line itself if it is waiting to be tagged
+        waiting = []
+        misses = {}
+        size = -1
+
+        for line in lines_to_process:
+            line = line.replace("\n", "").strip()
+            line_counts = line if line in misses else self._line_cache.get(line)
+
+            if line_counts is None:
+                if misses and size + 1 + len(line) > self.tag_batch_size:
+                    self._add_waiting_lines(waiting, misses)
+                    waiting = []
+                    misses = {}
+                    size = -1
+
+                misses[line] = None
+                size += 1 + len(line)
+                line_counts = line
+
+            if not waiting and not isinstance(line_counts, str):
+                self._add_line_counts(line_counts)
+                continue
+
+            waiting.append(line_counts)
+
+            # Waiting lines are bounded too, in case a miss is followed by many hits
+            if len(waiting) >= self.tag_batch_size:
+                self._add_waiting_lines(waiting, misses)
+                waiting = []
+                misses = {}
+                size = -1
+
+        self._add_waiting_lines(waiting, misses)
+
+    def _add_waiting_lines(self, waiting: list, misses: dict[str, None]) -> None:
+        """
+        Tags the lines missing from the line cache in one call, caches them and adds every waiting line in order.
+        Parameters
+        ----------
+        waiting : list
+            The cached counts of each waiting line, or the line itself if it is in `misses`.
+        misses : dict[str, None]
+            The distinct lines to tag, stripped, in order.
+        """
+        if not misses:
+            return
+
+        text = "\n".join(misses)
+        line_nodes = [[] for _ in misses]
+        line_number = 0
+
+        # MeCab treats the newlines as whitespace, so they are found in the whitespace before each token
+        for node in self.tagger(text):
+            line_number += node.white_space.count("\n")
+            line_nodes[line_number].append(node)
+
+        for line, nodes in zip(misses, line_nodes):
+            misses[line] = self._line_counts(line, nodes)
+            self._line_cache.put(line, misses[line])
+
+        for line_counts in waiting:
+            self._add_line_counts(
+                misses[line_counts] if isinstance(line_counts, str) else line_counts
+            )
+
+    def _process_packed_lines(self, text: str) -> None:
+        """
+        Tags lines joined by `_pack_lines` in one call, adding the valid words and all kanji in a single pass.
+        Parameters
+        ----------
+        text : str
+            The lines, joined with newlines.
+        """
+        if self._stats is not None:
+            self._process_packed_lines_with_stats(text)
+            return
+
+        self.add_kanji_counts(count_kanji_in_string(text))
+
+        # Repeated tokens are counted first, keeping the order they first appear in,
+        # so each distinct token is parsed, validated and added once
+        [self.add_word(word) for word in self._count_valid_words(text)]
+
+    def _process_packed_lines_with_stats(self, text: str) -> None:
+        """
+        Does the same as `_process_packed_lines`, timing each stage into `stats`.
+
+        The lines are processed together, so each of them is recorded with the average latency of the batch.
+        Parameters
+        ----------
+        text : str
+            The lines, joined with newlines.
+        """
+        stats = self._stats
+        start = perf_counter()
+
+        kanji_counts = count_kanji_in_string(text)
+        counted = perf_counter()
+        self.add_kanji_counts(kanji_counts)
+        kanji_added = perf_counter()
+        nodes = self.tagger(text)
+        tagged = perf_counter()
+
+        tokens = [(node.surface, node.feature_raw) for node in nodes]
+        nodes_by_token = dict(zip(tokens, nodes))
+        token_counts = Counter(tokens)
+        parse_time = perf_counter() - tagged
+        validate_time = add_time = 0
+        words = added = 0
+
+        for token, count in token_counts.items():
+            parse_start = perf_counter()
+            word = Word.from_node(nodes_by_token[token], self._word_cache)
+            word.frequency = count
+            parsed = perf_counter()
+            valid = self.validate_word(word)
+            validated = perf_counter()
+            parse_time += parsed - parse_start
+            validate_time += validated - parsed
+
+            if valid:
+                self.add_word(word)
+                add_time += perf_counter() - validated
+                words += count
+                added += 1
+
+        batch_time = perf_counter() - start
+        lines = text.count("\n") + 1
+
+        stats.record(Stage.COUNT_KANJI, counted - start)
+        stats.record(Stage.ADD_KANJI, kanji_added - counted)
+        stats.record(Stage.TAG, tagged - kanji_added)
+        stats.record(Stage.PARSE, parse_time, len(token_counts))
+        stats.record(Stage.VALIDATE, validate_time, len(token_counts))
+        stats.record(Stage.ADD_WORD, add_time, added)
+        stats.lines += lines
+        stats.tokens += len(nodes)
+        stats.words += words
+        stats.time += batch_time
+        stats.latency.add(batch_time / lines, lines)
 
     def process_text(self, text_to_process: str) -> None:
         """
         Parses a string split by the newline character, adding the valid words to the frequency list.
 
+        Lines longer than `max_chunk_size` are split at sentence boundaries, see `jpfreq.reader`.
+
         Parameters
         ----------
         text_to_process : str
             Text potentially containing multiple lines.
         """
-        [self.process_line(line) for line in text_to_process.split("\n")]
+        self.process_lines(iter_text_chunks(text_to_process, self.max_chunk_size))
 
-    def process_texts(self, texts_to_process: list) -> None:
+    def process_texts(self, texts_to_process: list, jobs: int = 1) -> None:
         """
         Parses a list of texts, adding the valid words to the frequency list.
 
@@ -450,21 +1538,597 @@ class JapaneseFrequencyList:
         ----------
         texts_to_process : list
             A list of texts to process.
+        jobs : int
+            The number of worker processes to use. -1 uses one per CPU core.
+            Must be 1 if the list has a `tagger_instance`.
+            With a `tag_batch_size` of 0, the result is identical to processing the texts one after another.
         """
-        [self.process_text(text) for text in texts_to_process]
+        if _resolve_jobs(jobs) == 1:
+            [self.process_text(text) for text in texts_to_process]
+            return
 
-    def process_file(self, file_path: str) -> None:
+        self._process_lines_parallel(
+            (
+                chunk
+                for text in texts_to_process
+                for chunk in iter_text_chunks(text, self.max_chunk_size)
+            ),
+            jobs,
+        )
+
+    def process_file(self, file_path: str, jobs: int = 1) -> None:
         """
         Parses a file, adding the valid words to the frequency list.
+
+        The file is read in blocks, so memory use stays bounded no matter how long its lines are.
+        Lines longer than `max_chunk_size` are split at sentence boundaries, see `jpfreq.reader`.
         Parameters
         ----------
         file_path : str
             The path to the file to process.
+        jobs : int
+            The number of worker processes to use. -1 uses one per CPU core.
+            Must be 1 if the list has a `tagger_instance`.
+            With a `tag_batch_size` of 0, the result is identical to processing the file in a single process.
+        """
+        self.process_files([file_path], jobs=jobs)
+
+    def process_files(self, file_paths: list[str], jobs: int = 1) -> None:
+        """
+        Parses a list of files in order, adding the valid words to the frequency list.
+        Parameters
+        ----------
+        file_paths : list[str]
+            The paths to the files to process.
+        jobs : int
+            The number of worker processes to use. -1 uses one per CPU core.
+            Must be 1 if the list has a `tagger_instance`.
+            With a `tag_batch_size` of 0, the result is identical to processing the files in a single process.
+        """
+        for file_path in file_paths:
+            if not file_exists(file_path):
+                raise FileExistsError(
+                    f"process_file: File path passed doesn't exist ({file_path})"
+                )
+
+        if _resolve_jobs(jobs) == 1:
+            for file_path in file_paths:
+                with open(file_path, "r", encoding="utf-8") as fs:
+                    self.process_lines(iter_file_chunks(fs, self.max_chunk_size))
+            return
+
+        self._process_lines_parallel(self._read_chunks(file_paths), jobs)
+
+    def process_html(self, html_to_process: str) -> None:
+        """
+        Parses the visible text of an HTML document, adding the valid words to the frequency list.
+
+        The HTML is parsed incrementally and its text is processed as it is found, see `jpfreq.html_reader`.
+        Script and style content is skipped, and block elements such as paragraphs and line breaks end a line.
+        Parameters
+        ----------
+        html_to_process : str
+            The HTML to process.
+        """
+        from .html_reader import iter_html_text_chunks
+
+        self.process_lines(iter_html_text_chunks(html_to_process, self.max_chunk_size))
+
+    def process_html_file(self, file_path: str, jobs: int = 1) -> None:
+        """
+        Parses the visible text of an HTML file, adding the valid words to the frequency list.
+
+        The file is read and parsed in blocks in a single pass, so memory use stays bounded however large it is.
+        See `process_html`.
+        Parameters
+        ----------
+        file_path : str
+            The path to the HTML file to process.
+        jobs : int
+            The number of worker processes to use. -1 uses one per CPU core.
+            Must be 1 if the list has a `tagger_instance`.
+            With a `tag_batch_size` of 0, the result is identical to processing the file in a single process.
         """
         if not file_exists(file_path):
             raise FileExistsError(
-                f"process_file: File path passed doesn't exist ({file_path})"
+                f"process_html_file: File path passed doesn't exist ({file_path})"
             )
 
+        from .html_reader import iter_html_file_chunks
+
         with open(file_path, "r", encoding="utf-8") as fs:
-            [self.process_line(line) for line in fs]
+            chunks = iter_html_file_chunks(fs, self.max_chunk_size)
+
+            if _resolve_jobs(jobs) == 1:
+                self.process_lines(chunks)
+            else:
+                self._process_lines_parallel(chunks, jobs)
+
+    def _read_chunks(self, file_paths: list[str]) -> Iterator[str]:
+        """
+        Lazily reads the chunks of several files, one file after another.
+        Parameters
+        ----------
+        file_paths : list[str]
+            The paths to the files to read.
+
+        Returns
+        -------
+        Iterator[str]
+            The chunks of the files.
+        """
+        for file_path in file_paths:
+            with open(file_path, "r", encoding="utf-8") as fs:
+                yield from iter_file_chunks(fs, self.max_chunk_size)
+
+    def _process_lines_parallel(
+        self,
+        lines: Iterable[str],
+        jobs: int,
+        batch_size: int = DEFAULT_PARALLEL_BATCH_SIZE,
+    ) -> None:
+        """
+        Processes lines across several worker processes, each with its own Tagger.
+
+        Lines are sent to the workers in batches, and the partial counts are merged back in
+        the original order, so with a `tag_batch_size` of 0 the frequency list ends up identical to a serial run.
+        Otherwise lines are only joined within a batch, so MeCab sees different context where a serial run joins
+        lines across batches, and a few tokens there may be analysed differently, see `process_lines`.
+        Only a bounded number of batches are in flight at once, keeping memory use flat.
+
+        A Tagger can't be sent to another process, so lists with a `tagger_instance` can't be processed in parallel.
+
+        Parameters
+        ----------
+        lines : Iterable[str]
+            The lines to process.
+        jobs : int
+            The number of worker processes to use. -1 uses one per CPU core.
+        batch_size : int
+            The number of lines sent to a worker at a time.
+        """
+        jobs = _resolve_jobs(jobs)
+
+        if self._tagger is not None:
+            raise ValueError(
+                "JapaneseFrequencyList: tagger_instance isn't supported with jobs above 1, "
+                "each worker process uses its own Tagger"
+            )
+
+        pending = deque()
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_parallel_worker,
+            initargs=(self._worker_settings(),),
+        ) as executor:
+            for batch in _batched(lines, batch_size):
+                pending.append(executor.submit(_process_lines_in_worker, batch))
+
+                if len(pending) >= jobs * 2:
+                    self._absorb(*pending.popleft().result())
+
+            while pending:
+                self._absorb(*pending.popleft().result())
+
+    async def process_stream(
+        self,
+        text_stream: AsyncIterable[str],
+        jobs: int = 1,
+        queue_size: int = DEFAULT_ASYNC_QUEUE_SIZE,
+    ) -> None:
+        """
+        Parses text from an asynchronous iterable without blocking the event loop.
+
+        The pieces of text are joined as if they were read from one file, so end each document with a newline
+        to keep it apart from the next. Lines are tagged in batches by worker threads, each with its own Tagger,
+        or with the list's `tagger_instance` when there is one thread. At most `queue_size` batches wait for or
+        are being tagged at once; when the queue is full, reading from `text_stream` pauses until a batch is done.
+        With a `tag_batch_size` of 0, the result is identical to processing the text in one go.
+        Parameters
+        ----------
+        text_stream : AsyncIterable[str]
+            The text to process, in pieces of any size.
+        jobs : int
+            The number of worker threads to use. -1 uses one per CPU core.
+            Must be 1 if the list has a `tagger_instance`.
+        queue_size : int
+            The maximum number of batches queued at once.
+        """
+        jobs = _resolve_jobs(jobs)
+
+        if queue_size < 1:
+            raise ValueError(
+                f"process_stream: queue_size must be at least 1, not {queue_size}"
+            )
+
+        if self._tagger is not None and jobs > 1:
+            raise ValueError(
+                "process_stream: tagger_instance isn't supported with jobs above 1, "
+                "a Tagger can't be shared between threads"
+            )
+
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[asyncio.Future | None] = asyncio.Queue(queue_size)
+        executor = ThreadPoolExecutor(max_workers=jobs)
+        thread_lists = threading.local()
+
+        def process_batch(lines: list[str]) -> SnapshotCounts:
+            worker_list = getattr(thread_lists, "freq_list", None)
+
+            if worker_list is None:
+                # With one thread, the list's own Tagger is never used by two threads at once
+                worker_list = thread_lists.freq_list = JapaneseFrequencyList(
+                    tagger_instance=self._tagger, **self._worker_settings()
+                )
+
+            worker_list.process_lines(lines)
+
+            return worker_list._take_counts()
+
+        async def submit(lines: list[str]) -> None:
+            await queue.put(loop.run_in_executor(executor, process_batch, lines))
+
+        async def read() -> None:
+            try:
+                chunker = SentenceChunker(self.max_chunk_size)
+                lines: list[str] = []
+
+                async for text in text_stream:
+                    lines.extend(chunker.feed(text))
+
+                    while len(lines) >= DEFAULT_PARALLEL_BATCH_SIZE:
+                        await submit(lines[:DEFAULT_PARALLEL_BATCH_SIZE])
+                        del lines[:DEFAULT_PARALLEL_BATCH_SIZE]
+
+                lines.extend(chunker.flush())
+
+                if lines:
+                    await submit(lines)
+            except Exception:
+                await queue.put(None)
+                raise
+
+            # Cancellation skips this, as the consumer has stopped reading the queue by then
+            await queue.put(None)
+
+        reader = asyncio.ensure_future(read())
+
+        try:
+            # Batches are merged in the order they were read, like `_process_lines_parallel`
+            while (batch := await queue.get()) is not None:
+                self._absorb(*await batch)
+
+            await reader
+        finally:
+            reader.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def process_files_async(
+        self,
+        file_paths: list[str],
+        jobs: int = 1,
+        queue_size: int = DEFAULT_ASYNC_QUEUE_SIZE,
+    ) -> None:
+        """
+        Parses a list of files in order without blocking the event loop, see `process_stream`.
+
+        The files are read in blocks by a thread while earlier lines are being tagged.
+        Parameters
+        ----------
+        file_paths : list[str]
+            The paths to the files to process.
+        jobs : int
+            The number of worker threads to use. -1 uses one per CPU core.
+            Must be 1 if the list has a `tagger_instance`.
+        queue_size : int
+            The maximum number of batches queued at once.
+        """
+        for file_path in file_paths:
+            if not file_exists(file_path):
+                raise FileExistsError(
+                    f"process_file: File path passed doesn't exist ({file_path})"
+                )
+
+        await self.process_stream(
+            _read_files_async(file_paths), jobs=jobs, queue_size=queue_size
+        )
+
+    def _worker_settings(self) -> dict:
+        """
+        The settings that affect how lines are counted, for creating the frequency lists of workers.
+        Returns
+        -------
+        dict
+            Keyword arguments for the constructor of a worker's frequency list.
+        """
+        return {
+            "excluded_word_types": self.excluded_word_types,
+            "word_cache_size": self.word_cache_info.maxsize,
+            "tag_batch_size": self.tag_batch_size,
+            "line_cache_size": self.line_cache_info.maxsize,
+        }
+
+    def _counts(self) -> SnapshotCounts:
+        """
+        The counts of the frequency list as word slots and kanji, without copying them.
+        Returns
+        -------
+        SnapshotCounts
+            The word slots, kanji and word count of the frequency list.
+        """
+        return self._unique_words, self._unique_kanji, self._word_count
+
+    def _take_counts(self) -> tuple[dict[str, WordSlot], dict[str, Kanji], int]:
+        """
+        Removes and returns the counts of the frequency list, leaving it empty.
+        Returns
+        -------
+        tuple[dict[str, WordSlot], dict[str, Kanji], int]
+            The word slots, kanji and word count of the frequency list.
+        """
+        counts = self._unique_words, self._unique_kanji, self._word_count
+
+        self._unique_words = {}
+        self._unique_kanji = {}
+        self.clear()
+
+        return counts
+
+    def _absorb(
+        self,
+        unique_words: dict[str, WordSlot],
+        unique_kanji: dict[str, Kanji],
+        word_count: int,
+        copy: bool = False,
+    ) -> None:
+        """
+        Adds partial counts to the frequency list in bulk.
+
+        This is linear in the size of the partial counts, not in the number of words they were built from.
+        Parameters
+        ----------
+        unique_words : dict[str, WordSlot]
+            The word slots to add.
+        unique_kanji : dict[str, Kanji]
+            The kanji to add.
+        word_count : int
+            The number of words the partial counts were built from.
+        copy : bool
+            Whether to copy the passed objects. If False, slots and kanji that are new to this list are stored as is.
+        """
+        self._word_count += word_count
+
+        if not copy and not self._unique_words and not self._unique_kanji:
+            self._adopt(unique_words, unique_kanji)
+            return
+
+        for representation, word_slot in unique_words.items():
+            existing_slot = self._unique_words.get(representation)
+
+            if existing_slot is not None:
+                old_frequency = existing_slot.frequency
+                existing_slot.merge(word_slot, copy=copy)
+                self._move_bucket(
+                    representation, old_frequency, existing_slot.frequency
+                )
+                continue
+
+            if copy:
+                word_slot = word_slot.copy()
+
+            self._unique_words[representation] = word_slot
+            self._add_to_bucket(representation, word_slot.frequency)
+
+        if self._surface_index is not None:
+            self._index_surfaces(unique_words.items())
+
+        for representation, kanji in unique_kanji.items():
+            existing_kanji = self._unique_kanji.get(representation)
+
+            if existing_kanji is not None:
+                self._count_kanji_used_once(
+                    existing_kanji.frequency, existing_kanji.frequency + kanji.frequency
+                )
+                existing_kanji.frequency += kanji.frequency
+                continue
+
+            self._unique_kanji[representation] = replace(kanji) if copy else kanji
+            self._count_kanji_used_once(0, kanji.frequency)
+
+    def _adopt(
+        self, unique_words: dict[str, WordSlot], unique_kanji: dict[str, Kanji]
+    ) -> None:
+        """
+        Takes ownership of partial counts while the frequency list is empty, building the indexes in a single pass.
+        Parameters
+        ----------
+        unique_words : dict[str, WordSlot]
+            The word slots to store as is.
+        unique_kanji : dict[str, Kanji]
+            The kanji to store as is.
+        """
+        self._unique_words = unique_words
+        self._unique_kanji = unique_kanji
+
+        for order, (representation, frequency) in enumerate(
+            zip(unique_words, map(attrgetter("frequency"), unique_words.values())),
+            self._next_slot_order,
+        ):
+            bucket = self._frequency_buckets.get(frequency)
+
+            if bucket is None:
+                bucket = self._frequency_buckets[frequency] = {}
+
+            bucket[representation] = order
+
+        self._next_slot_order += len(unique_words)
+        self._kanji_used_once = countOf(
+            map(attrgetter("frequency"), unique_kanji.values()), 1
+        )
+
+        if self._surface_index is not None:
+            self._index_surfaces(unique_words.items())
+
+    def _index_surfaces(self, word_slots: Iterable[tuple[str, WordSlot]]) -> None:
+        """
+        Adds the surfaces of word slots to the surface index, keeping the first counted representation of shared surfaces.
+        Parameters
+        ----------
+        word_slots : Iterable[tuple[str, WordSlot]]
+            The representations and word slots to index.
+        """
+        for representation, word_slot in word_slots:
+            for surface in word_slot.surfaces:
+                self._index_surface(surface, representation)
+
+    def _index_surface(self, surface: str, representation: str) -> None:
+        """
+        Adds a surface to the surface index, keeping the representation that was counted first if it is shared.
+        Parameters
+        ----------
+        surface : str
+            The surface to index.
+        representation : str
+            The representation of the word with the surface.
+        """
+        indexed = self._surface_index.setdefault(surface, representation)
+
+        if indexed == representation:
+            return
+
+        self._shared_surfaces.add(surface)
+
+        if representation in self._unique_words and self._slot_order(
+            representation
+        ) < self._slot_order(indexed):
+            self._surface_index[surface] = representation
+
+    def _slot_order(self, representation: str) -> int:
+        """
+        The position of a word slot in the order the word slots were first counted in.
+        Parameters
+        ----------
+        representation : str
+            The representation of the word slot.
+
+        Returns
+        -------
+        int
+            The position of the word slot.
+        """
+        frequency = self._unique_words[representation].frequency
+
+        return self._frequency_buckets[frequency][representation]
+
+    def _add_to_bucket(self, representation: str, frequency: int) -> None:
+        """
+        Adds a new word slot to the bucket of its frequency, recording the order it was first counted in.
+        Parameters
+        ----------
+        representation : str
+            The representation of the word slot.
+        frequency : int
+            The frequency of the word slot.
+        """
+        bucket = self._frequency_buckets.get(frequency)
+
+        if bucket is None:
+            bucket = self._frequency_buckets[frequency] = {}
+
+        bucket[representation] = self._next_slot_order
+        self._next_slot_order += 1
+
+    def _move_bucket(
+        self, representation: str, old_frequency: int, new_frequency: int
+    ) -> None:
+        """
+        Moves a word slot between frequency buckets after its frequency changed.
+        Parameters
+        ----------
+        representation : str
+            The representation of the word slot.
+        old_frequency : int
+            The frequency of the word slot before it changed.
+        new_frequency : int
+            The frequency of the word slot now.
+        """
+        old_bucket = self._frequency_buckets[old_frequency]
+        order = old_bucket.pop(representation)
+
+        if not old_bucket:
+            del self._frequency_buckets[old_frequency]
+
+        new_bucket = self._frequency_buckets.get(new_frequency)
+
+        if new_bucket is None:
+            new_bucket = self._frequency_buckets[new_frequency] = {}
+
+        new_bucket[representation] = order
+
+    def _remove_from_bucket(self, representation: str, frequency: int) -> None:
+        """
+        Removes a word slot that is no longer counted from the bucket of its last frequency.
+        Parameters
+        ----------
+        representation : str
+            The representation of the word slot.
+        frequency : int
+            The frequency of the word slot before it was removed.
+        """
+        bucket = self._frequency_buckets[frequency]
+        del bucket[representation]
+
+        if not bucket:
+            del self._frequency_buckets[frequency]
+
+    def _unindex_surface(self, surface: str, representation: str) -> None:
+        """
+        Removes a surface a word slot no longer has from the surface index.
+
+        If the surface was indexed to that word slot and other representations share it,
+        it is indexed to the one of them that was counted first instead.
+        Parameters
+        ----------
+        surface : str
+            The surface that was removed.
+        representation : str
+            The representation of the word slot it was removed from.
+        """
+        if self._surface_index.get(surface) != representation:
+            return
+
+        del self._surface_index[surface]
+
+        if surface not in self._shared_surfaces:
+            return
+
+        # Shared surfaces are rare, so they are looked for by scanning rather than kept in a second index
+        sharing = [
+            other
+            for other, word_slot in self._unique_words.items()
+            if surface in word_slot
+        ]
+
+        if len(sharing) < 2:
+            self._shared_surfaces.discard(surface)
+
+        if sharing:
+            self._surface_index[surface] = min(sharing, key=self._slot_order)
+
+    def _count_kanji_used_once(self, old_frequency: int, new_frequency: int) -> None:
+        """
+        Keeps the number of kanji used once up to date after a kanji's frequency changed.
+        Parameters
+        ----------
+        old_frequency : int
+            The frequency of the kanji before it changed. 0 for a new kanji.
+        new_frequency : int
+            The frequency of the kanji now.
+        """
+        self._kanji_used_once += (new_frequency == 1) - (old_frequency == 1)
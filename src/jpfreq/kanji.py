@@ -2,12 +2,23 @@
 .. include:: ../../documentation/kanji.md
 """
 
-from unicodedata import name as u_name
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass
 
-KANJI_UNICODE_NAME = "CJK UNIFIED IDEOGRAPH"
-"""The unicode name of a kanji character. 
-Used with the `u_name` function to determine if a code point is a kanji character."""
+KANJI_RANGES: tuple[tuple[int, int], ...] = (
+    (0x3400, 0x4DBF),  # CJK Unified Ideographs Extension A
+    (0x4E00, 0x9FFF),  # CJK Unified Ideographs
+    (0x20000, 0x2A6DF),  # Extension B
+    (0x2A700, 0x2EE5F),  # Extensions C, D, E, F and I
+    (0x30000, 0x323AF),  # Extensions G and H
+)
+"""The inclusive code point ranges of the CJK Unified Ideograph blocks, in ascending order."""
+
+_KANJI_BOUNDARIES: list[int] = [
+    boundary for start, end in KANJI_RANGES for boundary in (start, end + 1)
+]
+"""The start and end (exclusive) of each range in `KANJI_RANGES`, flattened for use with bisect."""
 
 
 @dataclass
@@ -22,6 +33,22 @@ class Kanji:
     """The frequency of the kanji character."""
 
 
+def _is_code_point_kanji(code_point: int) -> bool:
+    """
+    Checks if a code point is in one of the `KANJI_RANGES`.
+    Parameters
+    ----------
+    code_point : int
+        The code point to check.
+
+    Returns
+    -------
+    bool
+        Whether the code point is a kanji character or not.
+    """
+    return bisect_right(_KANJI_BOUNDARIES, code_point) % 2 == 1
+
+
 def is_character_kanji(input_character: str) -> bool:
     """
     Checks if the input character is a kanji character.
@@ -40,7 +67,29 @@ def is_character_kanji(input_character: str) -> bool:
             f"is_character_kanji: Expected str of length 1, got length of {len(input_character)} instead"
         )
 
-    return KANJI_UNICODE_NAME in u_name(input_character)
+    return _is_code_point_kanji(ord(input_character))
+
+
+def count_kanji_in_string(input_string: str) -> dict[str, int]:
+    """
+    Counts the occurrences of each kanji character in the input string.
+
+    Characters are counted in bulk first, so each distinct character is only checked once.
+    Parameters
+    ----------
+    input_string : str
+        The string to count the kanji of.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of occurrences of each kanji character, in order of first appearance.
+    """
+    return {
+        character: count
+        for character, count in Counter(input_string).items()
+        if _is_code_point_kanji(ord(character))
+    }
 
 
 def all_kanji_in_string(input_string: str) -> list[Kanji]:
@@ -56,10 +105,8 @@ def all_kanji_in_string(input_string: str) -> list[Kanji]:
     list[Kanji]
         A list of all kanji characters in the input string.
     """
-    kanji: list[Kanji] = []
-
-    for character in input_string:
-        if is_character_kanji(character):
-            kanji.append(Kanji(character, 1))
-
-    return kanji
+    return [
+        Kanji(character, 1)
+        for character in input_string
+        if _is_code_point_kanji(ord(character))
+    ]
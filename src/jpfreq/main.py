@@ -2,9 +2,13 @@
 .. include:: ../../documentation/main.md
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .jp_frequency_list import JapaneseFrequencyList
-from .exporters.iexporter import IExporter
-from .exporters.json import JsonExporter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .exporters.iexporter import IExporter
 
 # UniDic word contains:
 # char_type
@@ -20,11 +24,24 @@ from .exporters.json import JsonExporter
 # white_space
 
 
-def get_exporter(exporter_name: str) -> IExporter:
+EXPORTERS: dict[str, tuple[str, str]] = {
+    "json": (".exporters.json", "JsonExporter"),
+    "ndjson": (".exporters.ndjson", "NdjsonExporter"),
+    "jsonl": (".exporters.ndjson", "NdjsonExporter"),
+    "csv": (".exporters.csv", "CsvExporter"),
+    "tsv": (".exporters.csv", "TsvExporter"),
+}
+"""The module and class name of the exporters returned by `get_exporter`, keyed on name.
+Exporters are only imported when they are first requested."""
+
+
+def get_exporter(exporter_name: str) -> "IExporter":
     exporter_name = exporter_name.lower().strip()
 
-    if exporter_name == "json":
-        return JsonExporter()
+    if exporter_name in EXPORTERS:
+        module_name, class_name = EXPORTERS[exporter_name]
+
+        return getattr(import_module(module_name, __package__), class_name)()
 
     raise ValueError(f"Unknown exporter '{exporter_name}'")
 
@@ -0,0 +1,414 @@
+"""
+.. include:: ../../documentation/mapped_frequency_list.md
+"""
+
+from bisect import bisect_left, bisect_right
+from mmap import mmap, ACCESS_READ
+from os import PathLike
+from os.path import isfile as file_exists
+from sys import byteorder
+from typing import Sequence
+
+from .snapshot import (
+    _META,
+    _UINT32,
+    _UINT64,
+    _from_little_endian,
+    read_sections,
+    read_type_sets,
+)
+from .word import Word
+from .word_slot import WordSlot
+
+_INDEX_SECTIONS = (b"RANK", b"RIDX", b"SIDX")
+
+
+class MappedFrequencyList:
+    """
+    A read-only frequency list that answers queries directly from a memory mapped snapshot.
+
+    Nothing is loaded up front: lookups binary search the sorted indexes stored in the snapshot and only the
+    word slots that are returned are created. Processes mapping the same snapshot share its pages.
+    """
+
+    compare_surface: bool
+    _file: mmap | None
+    _views: list[memoryview]
+
+    def __init__(self, file_path: str | PathLike, compare_surface: bool = False):
+        """
+        Opens a snapshot created by `jpfreq.jp_frequency_list.JapaneseFrequencyList.save`.
+        Parameters
+        ----------
+        file_path : str | PathLike
+            The path of the snapshot to open.
+        compare_surface : bool
+            Whether to look words up by their surfaces when no representation matches.
+        """
+        if not file_exists(file_path):
+            raise FileExistsError(
+                f"MappedFrequencyList: File path passed doesn't exist ({file_path})"
+            )
+
+        self.compare_surface = compare_surface
+        self._views = []
+
+        with open(file_path, "rb") as fs:
+            self._file = mmap(fs.fileno(), 0, access=ACCESS_READ)
+
+        try:
+            self._map_sections()
+        except Exception:
+            self.close()
+            raise
+
+    def _map_sections(self) -> None:
+        """
+        Reads the section directory and maps each section to a column.
+        """
+        data = memoryview(self._file)
+        self._views.append(data)
+        sections = read_sections(data)
+        self._views.extend(sections.values())
+
+        for tag in (b"META", b"STRO", b"STRB", b"SFRQ") + _INDEX_SECTIONS:
+            if tag not in sections:
+                raise ValueError(
+                    f"MappedFrequencyList: snapshot has no {tag.decode()} section, save it again to add it"
+                )
+
+        self._word_count, _, _, _, _, self._kanji_count = _META.unpack(
+            sections[b"META"]
+        )
+        self._string_blob = sections[b"STRB"]
+        self._string_offsets = self._column(_UINT64, sections[b"STRO"])
+        self._slot_representations = self._column(_UINT32, sections[b"SREP"])
+        self._slot_frequencies = self._column(_UINT64, sections[b"SFRQ"])
+        self._slot_starts = self._column(_UINT32, sections[b"SWRD"])
+        self._word_surfaces = self._column(_UINT32, sections[b"WSUR"])
+        self._word_types = self._column(_UINT32, sections[b"WTYP"])
+        self._word_frequencies = self._column(_UINT64, sections[b"WFRQ"])
+        self._rank = self._column(_UINT32, sections[b"RANK"])
+        self._representation_index = self._column(_UINT32, sections[b"RIDX"])
+        self._surface_index = self._column(_UINT32, sections[b"SIDX"])
+        self._type_sets = read_type_sets(
+            self._string,
+            self._column(_UINT32, sections[b"TYPO"]),
+            self._column(_UINT32, sections[b"TYPV"]),
+        )
+
+    def _column(self, typecode: str, section: memoryview) -> Sequence[int]:
+        """
+        Views a section as a column of integers without copying it.
+        Parameters
+        ----------
+        typecode : str
+            The typecode of the integers.
+        section : memoryview
+            The section to view.
+
+        Returns
+        -------
+        Sequence[int]
+            The integers in the section. Copied only on big endian machines.
+        """
+        if byteorder == "big":  # pragma: no cover
+            return _from_little_endian(typecode, section)
+
+        column = section.cast(typecode)
+        self._views.append(column)
+
+        return column
+
+    def close(self) -> None:
+        """
+        Unmaps the snapshot. The frequency list can't be used afterwards.
+        """
+        if self._file is None:
+            return
+
+        for view in reversed(self._views):
+            view.release()
+
+        self._views.clear()
+        self._file.close()
+        self._file = None
+
+    def __enter__(self) -> "MappedFrequencyList":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        The number of unique words in the frequency list.
+        Returns
+        -------
+        int
+            The number of unique words in the frequency list.
+        """
+        return len(self._slot_frequencies)
+
+    def __contains__(self, word: str) -> bool:
+        """
+        Whether the representation of a word is in the frequency list.
+
+        This will compare against surfaces only if `compare_surface` is True.
+        Parameters
+        ----------
+        word : str
+            The word to check for.
+
+        Returns
+        -------
+        bool
+            Whether the word is in the frequency list.
+        """
+        return self._find_slot(word) != -1
+
+    def __getitem__(self, word: str) -> WordSlot:
+        """
+        Returns the WordSlot for the specified word, searching by representation.
+
+        If `compare_surface` is True, surfaces are searched too when no representation matches.
+        A surface shared by several representations returns the slot of the first one counted.
+        Parameters
+        ----------
+        word : str
+            The representation of the word.
+
+        Returns
+        -------
+        WordSlot
+            A new word slot containing the counts of the word.
+        """
+        slot_id = self._find_slot(word)
+
+        if slot_id == -1:
+            raise KeyError(f"Word '{word}' not found in frequency list")
+
+        return self._word_slot(slot_id)
+
+    @property
+    def word_count(self) -> int:
+        """
+        The number of words counted.
+        Returns
+        -------
+        int
+            The number of words counted.
+        """
+        return self._word_count
+
+    @property
+    def unique_words(self) -> int:
+        """
+        The number of unique words in the frequency list.
+        Returns
+        -------
+        int
+            The number of unique words.
+        """
+        return len(self)
+
+    @property
+    def unique_kanji(self) -> int:
+        """
+        The number of unique kanji in the frequency list.
+        Returns
+        -------
+        int
+            The number of unique kanji.
+        """
+        return self._kanji_count
+
+    def rank(self, word: str) -> int:
+        """
+        The position of a word in the frequency list, as ordered by `get_most_frequent`.
+        Parameters
+        ----------
+        word : str
+            The representation of the word, or its surface if `compare_surface` is True.
+
+        Returns
+        -------
+        int
+            The rank of the word, where the most frequent word has rank 1.
+        """
+        slot_id = self._find_slot(word)
+
+        if slot_id == -1:
+            raise KeyError(f"Word '{word}' not found in frequency list")
+
+        # Slots with the same frequency are adjacent in the rank and ordered by id
+        frequency = self._slot_frequencies[slot_id]
+        start = bisect_left(self._rank, -frequency, key=self._negative_frequency)
+        end = bisect_right(
+            self._rank, -frequency, lo=start, key=self._negative_frequency
+        )
+
+        return bisect_left(self._rank, slot_id, lo=start, hi=end) + 1
+
+    def get_most_frequent(
+        self, limit: int = 100, minimum: int = -1, maximum: int = -1
+    ) -> list[WordSlot]:
+        """
+        Returns a list of the most frequent words with the specified limit.
+        If limit is -1, then all words are returned.
+        Parameters
+        ----------
+        limit : int
+            The number of words to return.
+        minimum : int
+            The minimum frequency of the words to return (inclusive). -1 means no minimum.
+        maximum : int
+            The maximum frequency of the words to return (inclusive). -1 means no maximum.
+
+        Returns
+        -------
+        list[WordSlot]
+            A list of the most frequent words with the specified limit, sorted by frequency.
+            Words with the same frequency are in the order they were first counted.
+        """
+        start = 0
+        end = len(self._rank)
+
+        if maximum != -1:
+            start = bisect_left(self._rank, -maximum, key=self._negative_frequency)
+
+        if minimum != -1:
+            end = bisect_right(self._rank, -minimum, key=self._negative_frequency)
+
+        if limit != -1:
+            end = min(end, start + limit)
+
+        return [self._word_slot(slot_id) for slot_id in self._rank[start:end]]
+
+    def _find_slot(self, word: str) -> int:
+        """
+        Finds the id of the word slot of a representation, or of a surface if `compare_surface` is True.
+        Parameters
+        ----------
+        word : str
+            The word to find.
+
+        Returns
+        -------
+        int
+            The id of the word slot, or -1 if the word isn't in the frequency list.
+        """
+        if not isinstance(word, str):
+            return -1
+
+        key = word.encode("utf-8", "surrogatepass")
+        slot_id = self._search(
+            self._representation_index, key, self._slot_representations
+        )
+
+        if slot_id != -1 or not self.compare_surface:
+            return slot_id
+
+        word_id = self._search(self._surface_index, key, self._word_surfaces)
+
+        if word_id == -1:
+            return -1
+
+        return bisect_right(self._slot_starts, word_id) - 1
+
+    def _search(
+        self, index: Sequence[int], key: bytes, string_ids: Sequence[int]
+    ) -> int:
+        """
+        Binary searches an index of ids sorted by the UTF-8 bytes of their strings.
+        Parameters
+        ----------
+        index : Sequence[int]
+            The ids, sorted by their strings.
+        key : bytes
+            The UTF-8 bytes of the string to find.
+        string_ids : Sequence[int]
+            The string id of each id in the index.
+
+        Returns
+        -------
+        int
+            The first id whose string is `key`, or -1 if there is none.
+        """
+
+        def string_of(item: int) -> bytes:
+            return self._string_bytes(string_ids[item])
+
+        position = bisect_left(index, key, key=string_of)
+
+        if position == len(index) or string_of(index[position]) != key:
+            return -1
+
+        return index[position]
+
+    def _negative_frequency(self, slot_id: int) -> int:
+        """
+        The negated frequency of a word slot, so the rank can be searched in ascending order.
+        """
+        return -self._slot_frequencies[slot_id]
+
+    def _string_bytes(self, string_id: int) -> bytes:
+        """
+        Gets the UTF-8 bytes of a string in the string table.
+        Parameters
+        ----------
+        string_id : int
+            The id of the string.
+
+        Returns
+        -------
+        bytes
+            The bytes of the string, without its null terminator.
+        """
+        return self._string_blob[
+            self._string_offsets[string_id] : self._string_offsets[string_id + 1] - 1
+        ].tobytes()
+
+    def _string(self, string_id: int) -> str:
+        """
+        Gets a string from the string table.
+        Parameters
+        ----------
+        string_id : int
+            The id of the string.
+
+        Returns
+        -------
+        str
+            The string.
+        """
+        return self._string_bytes(string_id).decode("utf-8")
+
+    def _word_slot(self, slot_id: int) -> WordSlot:
+        """
+        Creates the word slot with the given id from the mapped columns.
+        Parameters
+        ----------
+        slot_id : int
+            The id of the word slot.
+
+        Returns
+        -------
+        WordSlot
+            The word slot.
+        """
+        representation = self._string(self._slot_representations[slot_id])
+        words = {}
+
+        for word_id in range(
+            self._slot_starts[slot_id], self._slot_starts[slot_id + 1]
+        ):
+            surface = self._string(self._word_surfaces[word_id])
+            words[surface] = Word(
+                representation,
+                surface,
+                self._type_sets[self._word_types[word_id]],
+                self._word_frequencies[word_id],
+            )
+
+        return WordSlot._from_surfaces(words, self._slot_frequencies[slot_id])
@@ -0,0 +1,233 @@
+"""
+.. include:: ../../documentation/reader.md
+"""
+
+from typing import Iterator, TextIO
+
+SENTENCE_TERMINATORS = "。！？!?．…"
+"""Characters that end a sentence. Long lines are preferably split just after one of these."""
+
+CLAUSE_SEPARATORS = "、，,　 \t"
+"""Characters that separate clauses. Used to split long lines that contain no sentence terminators."""
+
+DEFAULT_MAX_CHUNK_SIZE = 4096
+"""The default maximum number of characters in a single chunk."""
+
+DEFAULT_READ_SIZE = 65536
+"""The default number of characters read from a file at a time."""
+
+
+def _split_point(text: str, start: int, window_end: int) -> int:
+    """
+    Finds where to split a line that is too long to be a single chunk.
+    Parameters
+    ----------
+    text : str
+        The text containing the line.
+    start : int
+        The index the chunk starts at.
+    window_end : int
+        The index the chunk must end before (exclusive).
+
+    Returns
+    -------
+    int
+        The index the chunk ends at (exclusive).
+    """
+    for separators in (SENTENCE_TERMINATORS, CLAUSE_SEPARATORS):
+        split_at = max(
+            text.rfind(separator, start, window_end) for separator in separators
+        )
+
+        if split_at != -1:
+            return split_at + 1
+
+    return window_end
+
+
+def _find_chunk(
+    text: str, start: int, max_chunk_size: int, final: bool
+) -> tuple[int, int]:
+    """
+    Finds the end of the chunk starting at `start`.
+    Parameters
+    ----------
+    text : str
+        The text to find the chunk in.
+    start : int
+        The index the chunk starts at.
+    max_chunk_size : int
+        The maximum number of characters in the chunk.
+    final : bool
+        Whether no more text will follow `text`.
+
+    Returns
+    -------
+    tuple[int, int]
+        The index the chunk ends at (exclusive) and the index the next chunk starts at.
+        The end is -1 if more text is needed to find the end of the chunk.
+    """
+    window_end = start + max_chunk_size
+    newline = text.find("\n", start, window_end + 1)
+
+    if newline != -1:
+        return newline, newline + 1
+
+    if len(text) <= window_end:
+        if final:
+            return len(text), len(text)
+
+        return -1, start
+
+    split_at = _split_point(text, start, window_end)
+
+    return split_at, split_at
+
+
+class SentenceChunker:
+    """
+    Incrementally splits text into chunks of at most `max_chunk_size` characters.
+
+    Each line becomes its own chunk. Lines longer than `max_chunk_size` are split after the last
+    sentence terminator that fits, falling back to clause separators and finally to a hard split.
+    At most `max_chunk_size` characters are held back between calls to `feed`.
+    """
+
+    max_chunk_size: int
+    _buffer: str
+
+    def __init__(self, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE):
+        """
+        Creates a SentenceChunker.
+        Parameters
+        ----------
+        max_chunk_size : int
+            The maximum number of characters in a chunk.
+        """
+        if max_chunk_size < 1:
+            raise ValueError(
+                f"SentenceChunker: max_chunk_size must be at least 1, not {max_chunk_size}"
+            )
+
+        self.max_chunk_size = max_chunk_size
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        """
+        Adds text to the chunker, returning the chunks that are complete.
+        Parameters
+        ----------
+        text : str
+            The text to add.
+
+        Returns
+        -------
+        list[str]
+            The complete chunks, without newline characters. Empty chunks are skipped.
+        """
+        return self._split(self._buffer + text, final=False)
+
+    def flush(self) -> list[str]:
+        """
+        Returns the remaining text as chunks, emptying the chunker.
+        Returns
+        -------
+        list[str]
+            The remaining chunks.
+        """
+        return self._split(self._buffer, final=True)
+
+    def _split(self, text: str, final: bool) -> list[str]:
+        """
+        Splits text into chunks, keeping any incomplete chunk in the buffer.
+        Parameters
+        ----------
+        text : str
+            The text to split.
+        final : bool
+            Whether no more text will follow.
+
+        Returns
+        -------
+        list[str]
+            The complete chunks.
+        """
+        chunks: list[str] = []
+        start = 0
+
+        while start < len(text):
+            end, next_start = _find_chunk(text, start, self.max_chunk_size, final)
+
+            if end == -1:
+                break
+
+            if end > start:
+                chunks.append(text[start:end])
+
+            start = next_start
+
+        self._buffer = text[start:]
+
+        return chunks
+
+
+def iter_text_chunks(
+    text: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Lazily splits a string into chunks without copying it or splitting it all at once.
+    Parameters
+    ----------
+    text : str
+        The text to split.
+    max_chunk_size : int
+        The maximum number of characters in a chunk.
+
+    Returns
+    -------
+    Iterator[str]
+        The chunks, without newline characters. Empty chunks are skipped.
+    """
+    if max_chunk_size < 1:
+        raise ValueError(
+            f"iter_text_chunks: max_chunk_size must be at least 1, not {max_chunk_size}"
+        )
+
+    start = 0
+
+    while start < len(text):
+        end, next_start = _find_chunk(text, start, max_chunk_size, True)
+
+        if end > start:
+            yield text[start:end]
+
+        start = next_start
+
+
+def iter_file_chunks(
+    file: TextIO,
+    max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
+    read_size: int = DEFAULT_READ_SIZE,
+) -> Iterator[str]:
+    """
+    Lazily splits an open text file into chunks, reading it `read_size` characters at a time.
+    Parameters
+    ----------
+    file : TextIO
+        The file to read from.
+    max_chunk_size : int
+        The maximum number of characters in a chunk.
+    read_size : int
+        The number of characters read at a time.
+
+    Returns
+    -------
+    Iterator[str]
+        The chunks, without newline characters. Empty chunks are skipped.
+    """
+    chunker = SentenceChunker(max_chunk_size)
+
+    while block := file.read(read_size):
+        yield from chunker.feed(block)
+
+    yield from chunker.flush()
@@ -0,0 +1,504 @@
+"""
+.. include:: ../../documentation/snapshot.md
+"""
+
+import gc
+import struct
+from array import array
+from itertools import accumulate, chain, count, islice, repeat
+from operator import add, attrgetter, sub
+from sys import byteorder
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterable, Iterator, NamedTuple, Sequence
+
+from .kanji import Kanji
+from .word import Word, WordType, WordTypes, intern_word_types
+from .word_slot import WordSlot
+
+MAGIC = b"JPFQ"
+"""The bytes every snapshot starts with."""
+
+FORMAT_VERSION = 1
+"""The version of the snapshot format written by `write_snapshot`."""
+
+_HEADER = struct.Struct("<4sHHI")
+"""Magic, format version, reserved, number of sections."""
+
+_SECTION = struct.Struct("<4sQQ")
+"""Section tag, offset from the start of the file, length in bytes."""
+
+_META = struct.Struct("<QQQQQQ")
+"""Word count, number of strings, type sets, word slots, words and kanji."""
+
+_ALIGNMENT = 8
+
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+_UINT64 = "Q"
+
+SnapshotCounts = tuple[dict[str, WordSlot], dict[str, Kanji], int]
+"""The word slots, kanji and word count stored in a snapshot."""
+
+
+class SnapshotColumns(NamedTuple):
+    """
+    The packed columns of a snapshot, see `write_snapshot` and `read_snapshot_columns`.
+    """
+
+    word_count: int
+    """The number of words counted."""
+    string_count: int
+    """The number of strings in the string table."""
+    string_offsets: array
+    """The offset of each null terminated string in `string_blob`, followed by the length of the blob."""
+    string_blob: memoryview
+    """The null terminated UTF-8 strings."""
+    type_offsets: array
+    """The offset of each type set in `type_values`, followed by the number of type values."""
+    type_values: array
+    """The string ids of the word types of every type set."""
+    slot_representations: array
+    """The string id of the representation of each word slot."""
+    slot_frequencies: array
+    """The frequency of each word slot."""
+    slot_starts: array
+    """The id of the first word of each word slot, followed by the number of words."""
+    word_surfaces: array
+    """The string id of the surface of each word."""
+    word_types: array
+    """The type set id of each word."""
+    word_frequencies: array
+    """The frequency of each word."""
+    kanji_characters: array
+    """The string id of each kanji character."""
+    kanji_frequencies: array
+    """The frequency of each kanji."""
+
+
+def _build_string_table(strings: Iterable[str]) -> tuple[dict[str, int], array, bytes]:
+    """
+    Assigns each distinct string an id in order of first use and encodes them.
+    Parameters
+    ----------
+    strings : Iterable[str]
+        The strings to store, with repeats.
+
+    Returns
+    -------
+    tuple[dict[str, int], array, bytes]
+        The id of each string, the offset of each string in the blob followed by the length of the blob,
+        and the blob of null terminated UTF-8 strings.
+    """
+    distinct = list(dict.fromkeys(strings))
+    if "\0" in "".join(distinct):
+        raise ValueError("write_snapshot: strings can't contain null characters")
+
+    blob = ("\0".join(distinct) + "\0").encode("utf-8")
+    offsets = array(_UINT64, [0])
+    offsets.extend(accumulate(map(add, map(len, blob.split(b"\0")[:-1]), repeat(1))))
+
+    return dict(zip(distinct, count())), offsets, blob
+
+
+@contextmanager
+def _paused_gc() -> Iterator[None]:
+    """
+    Pauses the cyclic garbage collector, which otherwise repeatedly scans the millions of objects
+    created or visited for a large snapshot. None of these objects form reference cycles.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _to_little_endian(values: array) -> bytes:
+    """
+    Gets the little endian bytes of an array.
+    Parameters
+    ----------
+    values : array
+        The array to convert.
+
+    Returns
+    -------
+    bytes
+        The little endian bytes of the array.
+    """
+    if byteorder == "big":  # pragma: no cover
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes | memoryview) -> array:
+    """
+    Reads an array from little endian bytes.
+    Parameters
+    ----------
+    typecode : str
+        The typecode of the array.
+    data : bytes | memoryview
+        The little endian bytes.
+
+    Returns
+    -------
+    array
+        The array.
+    """
+    values = array(typecode)
+    values.frombytes(data)
+
+    if byteorder == "big":  # pragma: no cover
+        values.byteswap()
+
+    return values
+
+
+def _write_sections(file: BinaryIO, sections: list[tuple[bytes, bytes]]) -> None:
+    """
+    Writes the header, section directory and aligned sections of a snapshot.
+    Parameters
+    ----------
+    file : BinaryIO
+        The file to write to.
+    sections : list[tuple[bytes, bytes]]
+        The tag and content of each section.
+    """
+    position = _HEADER.size + _SECTION.size * len(sections)
+    directory = []
+
+    for tag, content in sections:
+        position += -position % _ALIGNMENT
+        directory.append(_SECTION.pack(tag, position, len(content)))
+        position += len(content)
+
+    file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(sections)))
+    file.write(b"".join(directory))
+
+    position = _HEADER.size + _SECTION.size * len(sections)
+
+    for tag, content in sections:
+        padding = -position % _ALIGNMENT
+        file.write(b"\0" * padding)
+        file.write(content)
+        position += padding + len(content)
+
+
+def read_sections(data: bytes | memoryview) -> dict[bytes, memoryview]:
+    """
+    Reads the section directory of a snapshot.
+    Parameters
+    ----------
+    data : bytes | memoryview
+        The contents of the snapshot.
+
+    Returns
+    -------
+    dict[bytes, memoryview]
+        The content of each section, keyed on its tag.
+    """
+    data = memoryview(data)
+
+    if len(data) < _HEADER.size:
+        raise ValueError("read_snapshot: data is too short to be a snapshot")
+
+    magic, version, _, section_count = _HEADER.unpack_from(data)
+
+    if magic != MAGIC:
+        raise ValueError("read_snapshot: data is not a jpfreq snapshot")
+
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"read_snapshot: snapshot format version {version} is newer than the supported version {FORMAT_VERSION}"
+        )
+
+    sections = {}
+
+    for index in range(section_count):
+        tag, offset, length = _SECTION.unpack_from(
+            data, _HEADER.size + _SECTION.size * index
+        )
+
+        if offset + length > len(data):
+            raise ValueError(f"read_snapshot: section {tag!r} is truncated")
+
+        sections[tag] = data[offset : offset + length]
+
+    return sections
+
+
+def read_type_sets(
+    string: Callable[[int], str],
+    type_offsets: Sequence[int],
+    type_values: Sequence[int],
+) -> list[WordTypes]:
+    """
+    Reads the interned word type sets of a snapshot.
+    Parameters
+    ----------
+    string : Callable[[int], str]
+        Gets a string from the string table by id.
+    type_offsets : Sequence[int]
+        The contents of the `TYPO` section.
+    type_values : Sequence[int]
+        The contents of the `TYPV` section.
+
+    Returns
+    -------
+    list[WordTypes]
+        The word types of each type set id.
+    """
+    return [
+        intern_word_types(WordType(string(value)) for value in type_values[start:end])
+        for start, end in zip(type_offsets, type_offsets[1:])
+    ]
+
+
+def write_snapshot(
+    file: BinaryIO,
+    unique_words: dict[str, WordSlot],
+    unique_kanji: dict[str, Kanji],
+    word_count: int,
+) -> None:
+    """
+    Writes the counts of a frequency list to a binary file.
+
+    Strings are stored once in a shared table, word types as interned sets of string ids,
+    and all counts as packed integer columns.
+    Parameters
+    ----------
+    file : BinaryIO
+        The file to write to.
+    unique_words : dict[str, WordSlot]
+        The word slots to write, keyed on representation.
+    unique_kanji : dict[str, Kanji]
+        The kanji to write, keyed on character.
+    word_count : int
+        The number of words counted.
+    """
+    with _paused_gc():
+        _write_snapshot(file, unique_words, unique_kanji, word_count)
+
+
+def _write_snapshot(
+    file: BinaryIO,
+    unique_words: dict[str, WordSlot],
+    unique_kanji: dict[str, Kanji],
+    word_count: int,
+) -> None:
+    """
+    Writes a snapshot, see `write_snapshot`.
+    """
+    word_slots = unique_words.values()
+    slot_words = list(map(attrgetter("words"), word_slots))
+    words = list(chain.from_iterable(slot_words))
+    surfaces = list(map(attrgetter("surface"), words))
+    types = list(map(attrgetter("types"), words))
+
+    # Words usually share interned type sequences, so only convert each distinct object once
+    type_sets: dict[tuple[WordType, ...], int] = {}
+    type_set_ids: dict[int, int] = {}
+
+    for word_types in dict(zip(map(id, types), types)).values():
+        type_set_ids[id(word_types)] = type_sets.setdefault(
+            tuple(word_types), len(type_sets)
+        )
+
+    string_ids, string_offsets, string_blob = _build_string_table(
+        chain(
+            unique_words,
+            surfaces,
+            (word_type.value for type_set in type_sets for word_type in type_set),
+            unique_kanji,
+        )
+    )
+
+    type_offsets = array(_UINT32, [0])
+    type_offsets.extend(accumulate(map(len, type_sets)))
+    type_values = array(
+        _UINT32,
+        (
+            string_ids[word_type.value]
+            for type_set in type_sets
+            for word_type in type_set
+        ),
+    )
+
+    slot_starts = array(_UINT32, [0])
+    slot_starts.extend(accumulate(map(len, slot_words)))
+    slot_frequencies = array(_UINT64, map(attrgetter("frequency"), word_slots))
+    representations = list(unique_words)
+
+    # Indexes for reading the snapshot in place, see `jpfreq.mapped_frequency_list`.
+    # Python orders strings by code point, which is the same as ordering their UTF-8 bytes.
+    # The sorts are stable, so equal frequencies and surfaces stay in the order they were counted.
+    rank = sorted(
+        range(len(representations)), key=slot_frequencies.__getitem__, reverse=True
+    )
+    representation_index = sorted(
+        range(len(representations)), key=representations.__getitem__
+    )
+    surface_index = sorted(range(len(surfaces)), key=surfaces.__getitem__)
+
+    meta = _META.pack(
+        word_count,
+        len(string_ids),
+        len(type_sets),
+        len(unique_words),
+        len(words),
+        len(unique_kanji),
+    )
+
+    _write_sections(
+        file,
+        [
+            (b"META", meta),
+            (b"STRO", _to_little_endian(string_offsets)),
+            (b"STRB", string_blob),
+            (b"TYPO", _to_little_endian(type_offsets)),
+            (b"TYPV", _to_little_endian(type_values)),
+            (
+                b"SREP",
+                _to_little_endian(
+                    array(_UINT32, map(string_ids.__getitem__, representations))
+                ),
+            ),
+            (b"SFRQ", _to_little_endian(slot_frequencies)),
+            (b"SWRD", _to_little_endian(slot_starts)),
+            (
+                b"WSUR",
+                _to_little_endian(
+                    array(_UINT32, map(string_ids.__getitem__, surfaces))
+                ),
+            ),
+            (
+                b"WTYP",
+                _to_little_endian(
+                    array(_UINT32, map(type_set_ids.__getitem__, map(id, types)))
+                ),
+            ),
+            (
+                b"WFRQ",
+                _to_little_endian(array(_UINT64, map(attrgetter("frequency"), words))),
+            ),
+            (
+                b"KCHR",
+                _to_little_endian(
+                    array(_UINT32, map(string_ids.__getitem__, unique_kanji))
+                ),
+            ),
+            (
+                b"KFRQ",
+                _to_little_endian(
+                    array(_UINT64, map(attrgetter("frequency"), unique_kanji.values()))
+                ),
+            ),
+            (b"RANK", _to_little_endian(array(_UINT32, rank))),
+            (b"RIDX", _to_little_endian(array(_UINT32, representation_index))),
+            (b"SIDX", _to_little_endian(array(_UINT32, surface_index))),
+        ],
+    )
+
+
+def read_snapshot_columns(data: bytes | memoryview) -> SnapshotColumns:
+    """
+    Reads the packed columns of a snapshot without creating any words.
+    Parameters
+    ----------
+    data : bytes | memoryview
+        The contents of the snapshot, see `write_snapshot`.
+
+    Returns
+    -------
+    SnapshotColumns
+        The columns of the snapshot.
+    """
+    sections = read_sections(data)
+
+    try:
+        word_count, string_count, _, _, _, _ = _META.unpack(sections[b"META"])
+
+        return SnapshotColumns(
+            word_count,
+            string_count,
+            _from_little_endian(_UINT64, sections[b"STRO"]),
+            sections[b"STRB"],
+            _from_little_endian(_UINT32, sections[b"TYPO"]),
+            _from_little_endian(_UINT32, sections[b"TYPV"]),
+            _from_little_endian(_UINT32, sections[b"SREP"]),
+            _from_little_endian(_UINT64, sections[b"SFRQ"]),
+            _from_little_endian(_UINT32, sections[b"SWRD"]),
+            _from_little_endian(_UINT32, sections[b"WSUR"]),
+            _from_little_endian(_UINT32, sections[b"WTYP"]),
+            _from_little_endian(_UINT64, sections[b"WFRQ"]),
+            _from_little_endian(_UINT32, sections[b"KCHR"]),
+            _from_little_endian(_UINT64, sections[b"KFRQ"]),
+        )
+    except KeyError as e:
+        raise ValueError(f"read_snapshot: snapshot is missing section {e}") from e
+
+
+def read_snapshot(data: bytes | memoryview) -> SnapshotCounts:
+    """
+    Reads the counts of a frequency list from the contents of a snapshot.
+    Parameters
+    ----------
+    data : bytes | memoryview
+        The contents of the snapshot, see `write_snapshot`.
+
+    Returns
+    -------
+    SnapshotCounts
+        The word slots, kanji and word count, in the order they were written.
+    """
+    (
+        word_count,
+        string_count,
+        _,
+        string_blob,
+        type_offsets,
+        type_values,
+        slot_representations,
+        slot_frequencies,
+        slot_starts,
+        word_surfaces,
+        word_types,
+        word_frequencies,
+        kanji_characters,
+        kanji_frequencies,
+    ) = read_snapshot_columns(data)
+    strings = bytes(string_blob).decode("utf-8").split("\0")[:string_count]
+
+    type_sets = read_type_sets(strings.__getitem__, type_offsets, type_values)
+
+    with _paused_gc():
+        # Everything is built with map and zip rather than Python level loops, which dominate for large lists
+        representations = list(map(strings.__getitem__, slot_representations))
+        slot_sizes = list(map(sub, slot_starts[1:], slot_starts))
+        surfaces = list(map(strings.__getitem__, word_surfaces))
+        words = map(
+            Word,
+            chain.from_iterable(map(repeat, representations, slot_sizes)),
+            surfaces,
+            map(type_sets.__getitem__, word_types),
+            word_frequencies,
+        )
+        surface_maps = map(dict, map(islice, repeat(zip(surfaces, words)), slot_sizes))
+        unique_words = dict(
+            zip(
+                representations,
+                map(WordSlot._from_surfaces, surface_maps, slot_frequencies),
+            )
+        )
+
+        unique_kanji = {
+            strings[character_id]: Kanji(strings[character_id], frequency)
+            for character_id, frequency in zip(kanji_characters, kanji_frequencies)
+        }
+
+    return unique_words, unique_kanji, word_count
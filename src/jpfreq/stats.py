@@ -0,0 +1,238 @@
+"""
+.. include:: ../../documentation/stats.md
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from enum import Enum
+from math import inf
+
+
+class Stage(Enum):
+    """
+    The stages of processing a line that are timed separately.
+    """
+
+    TAG = "tag"
+    """Tagging the line with MeCab."""
+    PARSE = "parse"
+    """Creating Words from the nodes of the Tagger, see `jpfreq.word.Word.from_node`."""
+    VALIDATE = "validate"
+    """Checking whether words are excluded."""
+    COUNT_KANJI = "count_kanji"
+    """Counting the kanji characters of the line."""
+    ADD_WORD = "add_word"
+    """Adding valid words to the frequency list."""
+    ADD_KANJI = "add_kanji"
+    """Adding the counted kanji to the frequency list."""
+
+
+@dataclass
+class StageStats:
+    """
+    The cumulative time and number of calls of a stage.
+    """
+
+    time: float = 0
+    """The total time spent in the stage, in seconds."""
+    calls: int = 0
+    """The number of times the stage ran."""
+
+
+LATENCY_BOUNDS: tuple[float, ...] = tuple(2**power / 1e6 for power in range(21))
+"""The upper bounds of the latency histogram buckets in seconds, doubling from 1µs to about 1s."""
+
+
+class LatencyHistogram:
+    """
+    A histogram of latencies with buckets whose upper bounds double, see `LATENCY_BOUNDS`.
+
+    Latencies above the last bound are counted in an extra bucket with an infinite bound.
+    """
+
+    counts: list[int]
+    """The number of latencies in each bucket."""
+
+    def __init__(self):
+        """
+        Creates an empty LatencyHistogram.
+        """
+        self.counts = [0] * (len(LATENCY_BOUNDS) + 1)
+
+    def __len__(self) -> int:
+        """
+        The number of latencies recorded.
+        Returns
+        -------
+        int
+            The number of latencies recorded.
+        """
+        return sum(self.counts)
+
+    @property
+    def bounds(self) -> tuple[float, ...]:
+        """
+        The upper bound of each bucket in seconds, including the infinite bound of the last one.
+        Returns
+        -------
+        tuple[float, ...]
+            The upper bounds, in the same order as `counts`.
+        """
+        return LATENCY_BOUNDS + (inf,)
+
+    def add(self, seconds: float, count: int = 1) -> None:
+        """
+        Records a latency.
+        Parameters
+        ----------
+        seconds : float
+            The latency in seconds.
+        count : int
+            The number of times to record it.
+        """
+        self.counts[bisect_left(LATENCY_BOUNDS, seconds)] += count
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimates a percentile of the recorded latencies.
+        Parameters
+        ----------
+        fraction : float
+            The percentile as a fraction between 0 and 1, e.g. 0.99.
+
+        Returns
+        -------
+        float
+            The upper bound of the bucket holding the percentile, in seconds. 0 if nothing was recorded.
+        """
+        if not 0 <= fraction <= 1:
+            raise ValueError(
+                f"LatencyHistogram: fraction must be between 0 and 1, not {fraction}"
+            )
+
+        target = fraction * len(self)
+        seen = 0
+
+        if target == 0:
+            return 0
+
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+
+            if seen >= target:
+                return bound
+
+        return inf  # pragma: no cover
+
+    def clear(self) -> None:
+        """
+        Removes all recorded latencies.
+        """
+        self.counts = [0] * len(self.counts)
+
+
+class ProcessingStats:
+    """
+    Timings and counters collected while a frequency list processes text.
+
+    See `jpfreq.jp_frequency_list.JapaneseFrequencyList.collect_stats`.
+    """
+
+    stages: dict[Stage, StageStats]
+    """The cumulative time and calls of each stage."""
+    lines: int
+    """The number of lines processed."""
+    tokens: int
+    """The number of tokens produced by the Tagger, valid or not."""
+    words: int
+    """The number of valid words added."""
+    time: float
+    """The total time spent processing lines, in seconds."""
+    latency: LatencyHistogram
+    """The time taken to process each line."""
+
+    def __init__(self):
+        """
+        Creates an empty ProcessingStats.
+        """
+        self.reset()
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return (
+            f"ProcessingStats(lines={self.lines}, tokens={self.tokens}, "
+            f"words={self.words}, time={self.time:.6f})"
+        )
+
+    def reset(self) -> None:
+        """
+        Resets every timing and counter to zero.
+        """
+        self.stages = {stage: StageStats() for stage in Stage}
+        self.lines = 0
+        self.tokens = 0
+        self.words = 0
+        self.time = 0
+        self.latency = LatencyHistogram()
+
+    def record(self, stage: Stage, seconds: float, calls: int = 1) -> None:
+        """
+        Adds time spent in a stage.
+        Parameters
+        ----------
+        stage : Stage
+            The stage the time was spent in.
+        seconds : float
+            The time spent, in seconds.
+        calls : int
+            The number of calls the time covers.
+        """
+        stage_stats = self.stages[stage]
+        stage_stats.time += seconds
+        stage_stats.calls += calls
+
+    @property
+    def tokens_per_second(self) -> float:
+        """
+        The number of tokens processed per second.
+        Returns
+        -------
+        float
+            The throughput in tokens. 0 if nothing was processed.
+        """
+        return self.tokens / self.time if self.time else 0
+
+    @property
+    def lines_per_second(self) -> float:
+        """
+        The number of lines processed per second.
+        Returns
+        -------
+        float
+            The throughput in lines. 0 if nothing was processed.
+        """
+        return self.lines / self.time if self.time else 0
+
+    def to_dict(self) -> dict:
+        """
+        Converts the stats to a dictionary that can be serialised as JSON.
+        Returns
+        -------
+        dict
+            The dictionary representation of the stats. Latency bounds are in seconds, with null for infinity.
+        """
+        return {
+            "lines": self.lines,
+            "tokens": self.tokens,
+            "words": self.words,
+            "time": self.time,
+            "tokens_per_second": self.tokens_per_second,
+            "lines_per_second": self.lines_per_second,
+            "stages": {
+                stage.value: {"time": stage_stats.time, "calls": stage_stats.calls}
+                for stage, stage_stats in self.stages.items()
+            },
+            "latency": {
+                "bounds": list(LATENCY_BOUNDS) + [None],
+                "counts": list(self.latency.counts),
+            },
+        }
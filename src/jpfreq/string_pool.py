@@ -0,0 +1,234 @@
+"""
+.. include:: ../../documentation/string_pool.md
+"""
+
+from array import array
+
+_EMPTY = -1
+_INITIAL_TABLE_SIZE = 8
+
+
+class StringPool:
+    """
+    Interns strings to consecutive integer ids.
+
+    The strings are stored once as UTF-8 in a single buffer and found through an open addressing hash table
+    held in an array, so each string costs a few dozen bytes rather than a Python object and a dictionary entry.
+    """
+
+    __slots__ = ("_blob", "_offsets", "_hashes", "_table", "_mask")
+
+    _blob: bytearray
+    _offsets: array
+    _hashes: array | None
+    _table: array | None
+    _mask: int
+
+    def __init__(self):
+        """
+        Creates an empty StringPool.
+        """
+        self._blob = bytearray()
+        self._offsets = array("q", [0])
+        self._hashes = array("q")
+        self._table = array("i", [_EMPTY]) * _INITIAL_TABLE_SIZE
+        self._mask = _INITIAL_TABLE_SIZE - 1
+
+    @classmethod
+    def _from_encoded(cls, blob: bytes, offsets: array) -> "StringPool":
+        """
+        Creates a StringPool holding strings that are already encoded, e.g. read from a snapshot.
+
+        The hash table is only built on the first lookup or addition, so pools that are only read by id
+        are created in the time it takes to copy the blob.
+        Parameters
+        ----------
+        blob : bytes
+            The UTF-8 bytes of the strings, one after another.
+        offsets : array
+            The offset of each string in the blob, followed by the length of the blob, with typecode "q".
+
+        Returns
+        -------
+        StringPool
+            The created pool. String ids are the positions of the strings in the blob.
+        """
+        pool = cls.__new__(cls)
+        pool._blob = bytearray(blob)
+        pool._offsets = offsets
+        pool._hashes = None
+        pool._table = None
+        pool._mask = 0
+
+        return pool
+
+    def __len__(self) -> int:
+        """
+        The number of strings in the pool.
+        Returns
+        -------
+        int
+            The number of strings in the pool.
+        """
+        return len(self._offsets) - 1
+
+    def __contains__(self, string: str) -> bool:
+        """
+        Whether the string is in the pool.
+        Parameters
+        ----------
+        string : str
+            The string to check for.
+
+        Returns
+        -------
+        bool
+            Whether the string is in the pool.
+        """
+        return self.get(string) != _EMPTY
+
+    def __getitem__(self, string_id: int) -> str:
+        """
+        Gets a string by its id.
+        Parameters
+        ----------
+        string_id : int
+            The id of the string.
+
+        Returns
+        -------
+        str
+            The string.
+        """
+        if not 0 <= string_id < len(self._offsets) - 1:
+            raise IndexError(f"StringPool: string id {string_id} out of range")
+
+        return self._encoded(string_id).decode("utf-8", "surrogatepass")
+
+    def get(self, string: str) -> int:
+        """
+        Gets the id of a string.
+        Parameters
+        ----------
+        string : str
+            The string to look up.
+
+        Returns
+        -------
+        int
+            The id of the string, or -1 if it isn't in the pool.
+        """
+        if not isinstance(string, str):
+            return _EMPTY
+
+        if self._table is None:
+            self._build_table()
+
+        return self._table[self._probe(string.encode("utf-8", "surrogatepass"))]
+
+    def add(self, string: str) -> int:
+        """
+        Gets the id of a string, adding it to the pool if it is new.
+        Parameters
+        ----------
+        string : str
+            The string to add.
+
+        Returns
+        -------
+        int
+            The id of the string.
+        """
+        if self._table is None:
+            self._build_table()
+
+        encoded = string.encode("utf-8", "surrogatepass")
+        index = self._probe(encoded)
+        string_id = self._table[index]
+
+        if string_id != _EMPTY:
+            return string_id
+
+        string_id = len(self._hashes)
+        self._blob += encoded
+        self._offsets.append(len(self._blob))
+        self._hashes.append(hash(encoded))
+        self._table[index] = string_id
+
+        if len(self._hashes) * 2 > len(self._table):
+            self._grow()
+
+        return string_id
+
+    def _encoded(self, string_id: int) -> bytes:
+        """
+        Gets the UTF-8 bytes of a string by its id.
+        """
+        return self._blob[self._offsets[string_id] : self._offsets[string_id + 1]]
+
+    def _probe(self, encoded: bytes) -> int:
+        """
+        Finds the index of the hash table holding a string, or the empty index it would be added at.
+        Parameters
+        ----------
+        encoded : bytes
+            The UTF-8 bytes of the string.
+
+        Returns
+        -------
+        int
+            The index in the hash table.
+        """
+        string_hash = hash(encoded)
+        index = string_hash & self._mask
+
+        while True:
+            string_id = self._table[index]
+
+            if string_id == _EMPTY or (
+                self._hashes[string_id] == string_hash
+                and self._encoded(string_id) == encoded
+            ):
+                return index
+
+            index = (index + 1) & self._mask
+
+    def _build_table(self) -> None:
+        """
+        Hashes every string and builds the hash table of a pool created by `_from_encoded`.
+        """
+        self._hashes = array(
+            "q",
+            (hash(bytes(self._encoded(string_id))) for string_id in range(len(self))),
+        )
+        size = _INITIAL_TABLE_SIZE
+
+        while len(self._hashes) * 2 > size:
+            size *= 2
+
+        self._rebuild(size)
+
+    def _grow(self) -> None:
+        """
+        Doubles the size of the hash table, keeping it at most half full.
+        """
+        self._rebuild(len(self._table) * 2)
+
+    def _rebuild(self, size: int) -> None:
+        """
+        Replaces the hash table with an empty one of the given size and adds every string to it.
+        Parameters
+        ----------
+        size : int
+            The size of the new hash table, a power of two.
+        """
+        self._table = array("i", [_EMPTY]) * size
+        self._mask = size - 1
+
+        for string_id, string_hash in enumerate(self._hashes):
+            index = string_hash & self._mask
+
+            while self._table[index] != _EMPTY:
+                index = (index + 1) & self._mask
+
+            self._table[index] = string_id
@@ -0,0 +1,139 @@
+"""
+.. include:: ../../documentation/tagger_pool.md
+"""
+
+import threading
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fugashi import Tagger
+
+DEFAULT_TAGGER_ARGUMENTS = "-Owakati"
+"""The arguments of the Tagger used by frequency lists."""
+
+
+class TaggerPoolInfo(NamedTuple):
+    """
+    Statistics about the usage of a tagger pool.
+    """
+
+    created: int
+    """The number of Taggers created."""
+    reused: int
+    """The number of times an existing Tagger was handed out."""
+
+    @property
+    def reuse_rate(self) -> float:
+        """
+        The fraction of requests that were given an existing Tagger.
+        Returns
+        -------
+        float
+            The reuse rate between 0 and 1. 0 if no Tagger has been requested.
+        """
+        requests = self.created + self.reused
+
+        if requests == 0:
+            return 0
+
+        return self.reused / requests
+
+
+class TaggerPool:
+    """
+    Shares Taggers between frequency lists, keeping one Tagger per thread for each set of Tagger arguments.
+
+    A Tagger isn't safe to use from several threads at once, so every thread gets its own. Within a thread,
+    every request with the same arguments returns the same Tagger, so the MeCab dictionary is loaded once.
+    """
+
+    _local: threading.local
+    _lock: threading.Lock
+    _created: int
+    _reused: int
+
+    def __init__(self):
+        """
+        Creates an empty TaggerPool.
+        """
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._reused = 0
+
+    def get(self, arguments: str = DEFAULT_TAGGER_ARGUMENTS) -> "Tagger":
+        """
+        Gets the Tagger of the current thread for the given arguments, creating it if needed.
+        Parameters
+        ----------
+        arguments : str
+            The arguments passed to the Tagger, e.g. "-Owakati".
+
+        Returns
+        -------
+        Tagger
+            The Tagger. Only use it from the current thread.
+        """
+        taggers = getattr(self._local, "taggers", None)
+
+        if taggers is None:
+            taggers = self._local.taggers = {}
+
+        tagger = taggers.get(arguments)
+
+        if tagger is not None:
+            with self._lock:
+                self._reused += 1
+
+            return tagger
+
+        from fugashi import Tagger
+
+        tagger = taggers[arguments] = Tagger(arguments)
+
+        with self._lock:
+            self._created += 1
+
+        return tagger
+
+    def pool_info(self) -> TaggerPoolInfo:
+        """
+        Returns statistics about the usage of the pool.
+        Returns
+        -------
+        TaggerPoolInfo
+            The number of Taggers created and reused.
+        """
+        with self._lock:
+            return TaggerPoolInfo(self._created, self._reused)
+
+    def clear(self) -> None:
+        """
+        Drops the pooled Taggers of every thread and resets the statistics.
+
+        Taggers already handed out keep working, but new requests create new Taggers.
+        """
+        with self._lock:
+            self._local = threading.local()
+            self._created = 0
+            self._reused = 0
+
+
+DEFAULT_TAGGER_POOL = TaggerPool()
+"""The pool frequency lists draw their Taggers from unless they are given one."""
+
+
+def get_tagger(arguments: str = DEFAULT_TAGGER_ARGUMENTS) -> "Tagger":
+    """
+    Gets the Tagger of the current thread from `DEFAULT_TAGGER_POOL`.
+    Parameters
+    ----------
+    arguments : str
+        The arguments passed to the Tagger.
+
+    Returns
+    -------
+    Tagger
+        The Tagger. Only use it from the current thread.
+    """
+    return DEFAULT_TAGGER_POOL.get(arguments)
@@ -2,7 +2,10 @@
 .. include:: ../../documentation/util.md
 """
 
-from fugashi import UnidicNode
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fugashi import UnidicNode
 
 
 def percent_of(part: [int | float], total: [int | float]) -> float:
@@ -49,7 +52,7 @@ def parse_pos_node(pos: str) -> list[str]:
     return [pos_value for pos_value in split_pos if pos_value != "*"]
 
 
-def word_rep(word: UnidicNode):
+def word_rep(word: "UnidicNode"):
     """
     Gets the string representation of a UnidicNode.
     This is the lemma of the word.
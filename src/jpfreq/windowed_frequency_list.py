@@ -0,0 +1,230 @@
+"""
+.. include:: ../../documentation/windowed_frequency_list.md
+"""
+
+from collections import deque
+from time import time
+from typing import NamedTuple
+
+from .jp_frequency_list import JapaneseFrequencyList
+from .word import Word, WordType, WordTypes
+from .word_slot import WordSlot
+
+
+class WindowDocument(NamedTuple):
+    """
+    The counts a document added to a WindowedJapaneseFrequencyList, kept until it leaves the window.
+    """
+
+    timestamp: float
+    """When the document was added, in seconds, e.g. from `time.time`."""
+    words: tuple[tuple[str, str, WordTypes, int], ...]
+    """The representation, surface, types and frequency of each valid word of the document."""
+    kanji_counts: dict[str, int]
+    """The number of occurrences of each kanji character of the document."""
+
+
+class WindowedJapaneseFrequencyList(JapaneseFrequencyList):
+    """
+    A JapaneseFrequencyList over a sliding window of documents, e.g. the last 1000 chat messages or the last hour.
+
+    Documents are added with `add_document`. The counts of each document are kept as a compact delta, and once the
+    document leaves the window they are subtracted again, removing word slots and kanji that reach 0. This is linear
+    in the size of the document, and the frequency buckets, word count and number of kanji used once are kept up to
+    date as it happens, so `get_most_frequent` and `generate_text_info` never scan the whole vocabulary.
+
+    Counts added by other means, such as `process_text` or `merge`, are not part of any document and never expire.
+    """
+
+    _documents: deque[WindowDocument]
+    _document_list: JapaneseFrequencyList | None
+    max_documents: int
+    max_age: float
+
+    def __init__(self, *args, max_documents: int = 0, max_age: float = 0, **kwargs):
+        """
+        Creates an empty WindowedJapaneseFrequencyList.
+        Takes the same arguments as `jpfreq.jp_frequency_list.JapaneseFrequencyList`.
+        Parameters
+        ----------
+        max_documents : int
+            The maximum number of documents in the window. 0 means no limit.
+        max_age : float
+            The maximum age of documents in the window, in seconds. 0 means no limit.
+        """
+        if max_documents < 0:
+            raise ValueError(
+                f"WindowedJapaneseFrequencyList: max_documents must not be negative, not {max_documents}"
+            )
+
+        if max_age < 0:
+            raise ValueError(
+                f"WindowedJapaneseFrequencyList: max_age must not be negative, not {max_age}"
+            )
+
+        self.max_documents = max_documents
+        self.max_age = max_age
+        self._documents = deque()
+        self._document_list = None
+
+        super().__init__(*args, **kwargs)
+
+    @JapaneseFrequencyList.excluded_word_types.setter
+    def excluded_word_types(self, excluded_word_types: list[WordType]) -> None:
+        """
+        Sets the word types to exclude from documents added from now on.
+        Documents already in the window keep their counts, and have them removed as they were added.
+        Parameters
+        ----------
+        excluded_word_types : list[WordType]
+            The word types to exclude.
+        """
+        JapaneseFrequencyList.excluded_word_types.fset(self, excluded_word_types)
+        self._document_list = None
+
+    @property
+    def documents(self) -> int:
+        """
+        The number of documents in the window.
+        Returns
+        -------
+        int
+            The number of documents in the window.
+        """
+        return len(self._documents)
+
+    def clear(self) -> None:
+        """
+        Clears the frequency list of all words, kanji and documents, reverting it to its initial state.
+        """
+        super().clear()
+        self._documents.clear()
+
+    def copy(self) -> "WindowedJapaneseFrequencyList":
+        """
+        Creates a copy of the frequency list, including its window and the documents in it.
+        Returns
+        -------
+        WindowedJapaneseFrequencyList
+            The copied frequency list.
+        """
+        copied = super().copy()
+        copied.max_documents = self.max_documents
+        copied.max_age = self.max_age
+        copied._documents = deque(self._documents)
+
+        return copied
+
+    def get_most_frequent(
+        self, limit: int = 100, minimum: int = -1, maximum: int = -1
+    ) -> list[WordSlot]:
+        """
+        Returns a list of the most frequent words in the window with the specified limit.
+        If limit is -1, then all words are returned.
+
+        Only the frequency buckets down to the `limit`th word are visited, so this stays fast as the vocabulary grows.
+        Parameters
+        ----------
+        limit : int
+            The number of words to return.
+        minimum : int
+            The minimum frequency of the words to return (inclusive). -1 means no minimum.
+        maximum : int
+            The maximum frequency of the words to return (inclusive). -1 means no maximum.
+        Returns
+        -------
+        list[WordSlot]
+            A list of the most frequent words with the specified limit, sorted by frequency.
+            Words with the same frequency are in the order they were first counted.
+        """
+        if limit == -1:
+            return super().get_most_frequent(limit, minimum, maximum)
+
+        return self._get_most_frequent_in_range(limit, minimum, maximum)
+
+    def add_document(self, text: str, timestamp: float | None = None) -> None:
+        """
+        Adds a document to the window, then removes the documents that left it.
+
+        Documents leave the window in the order they were added, once there are more than `max_documents` or once
+        they are `max_age` seconds older than the timestamp of the newest document, see `expire`.
+        Parameters
+        ----------
+        text : str
+            The text of the document, potentially containing multiple lines.
+        timestamp : float | None
+            When the document was written, in seconds. The current time from `time.time` if None.
+        """
+        if timestamp is None:
+            timestamp = time()
+
+        if self._document_list is None:
+            self._document_list = JapaneseFrequencyList(
+                tagger_instance=self._tagger,
+                max_chunk_size=self.max_chunk_size,
+                **self._worker_settings(),
+            )
+
+        self._document_list.process_text(text)
+        unique_words, unique_kanji, word_count = self._document_list._take_counts()
+
+        # The delta is taken before absorbing, as the absorbed words are counted into from then on
+        self._documents.append(
+            WindowDocument(
+                timestamp,
+                tuple(
+                    (word.representation, word.surface, word.types, word.frequency)
+                    for word_slot in unique_words.values()
+                    for word in word_slot.words
+                ),
+                {
+                    character: kanji.frequency
+                    for character, kanji in unique_kanji.items()
+                },
+            )
+        )
+        self._absorb(unique_words, unique_kanji, word_count)
+        self.expire(timestamp)
+
+    def expire(self, now: float | None = None) -> int:
+        """
+        Removes the documents that left the window, subtracting their counts.
+
+        Documents are only expired by age when this or `add_document` is called, so call it before reading a list
+        with a `max_age` that documents stopped being added to.
+        Parameters
+        ----------
+        now : float | None
+            The current time, in seconds. The current time from `time.time` if None.
+
+        Returns
+        -------
+        int
+            The number of documents removed.
+        """
+        if now is None:
+            now = time()
+
+        removed = 0
+
+        while self._documents and (
+            (self.max_documents and len(self._documents) > self.max_documents)
+            or (self.max_age and self._documents[0].timestamp <= now - self.max_age)
+        ):
+            self._remove_document(self._documents.popleft())
+            removed += 1
+
+        return removed
+
+    def _remove_document(self, document: WindowDocument) -> None:
+        """
+        Subtracts the counts of a document from the frequency list.
+        Parameters
+        ----------
+        document : WindowDocument
+            The document to subtract.
+        """
+        for representation, surface, types, frequency in document.words:
+            self.remove_word(Word(representation, surface, types, frequency))
+
+        self.remove_kanji_counts(document.kanji_counts)
@@ -4,8 +4,12 @@
 
 from enum import Enum
 from dataclasses import dataclass
-from fugashi import UnidicNode
+from typing import TYPE_CHECKING, Iterable, Sequence
 from .util import parse_pos_node, word_rep
+from .cache import LRUCache
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fugashi import UnidicNode
 
 
 class WordType(Enum):
@@ -87,21 +91,132 @@ class WordType(Enum):
     UNKNOWN: str = ""
 
 
+_WORD_TYPE_BITS: dict[WordType, int] = {
+    word_type: 1 << index for index, word_type in enumerate(WordType)
+}
+"""The bit representing each WordType in a word types mask."""
+
+
+def word_types_mask(word_types: Iterable[WordType]) -> int:
+    """
+    Gets the bitmask of a collection of WordTypes, with one bit set per type.
+    Parameters
+    ----------
+    word_types : Iterable[WordType]
+        The types to get the mask of.
+
+    Returns
+    -------
+    int
+        The bitmask of the types. Precomputed if `word_types` is a `WordTypes`.
+    """
+    if isinstance(word_types, WordTypes):
+        return word_types.mask
+
+    mask = 0
+
+    for word_type in word_types:
+        mask |= _WORD_TYPE_BITS[word_type]
+
+    return mask
+
+
+class WordTypes(tuple):
+    """
+    An immutable combination of WordTypes with a precomputed bitmask.
+
+    Use `intern_word_types` or `word_types_from_pos` to get one, so every word with the same types
+    shares a single instance.
+    """
+
+    mask: int
+    """The bitmask of the types, see `word_types_mask`."""
+
+    def __new__(cls, word_types: Iterable[WordType]) -> "WordTypes":
+        word_types = super().__new__(cls, word_types)
+        word_types.mask = word_types_mask(tuple(word_types))
+
+        return word_types
+
+    def __reduce__(self):
+        return intern_word_types, (tuple(self),)
+
+
+_interned_word_types: dict[tuple[WordType, ...], WordTypes] = {}
+_word_types_by_pos: dict[str, WordTypes] = {}
+
+
+def intern_word_types(word_types: Iterable[WordType]) -> WordTypes:
+    """
+    Gets the shared WordTypes instance for a combination of types.
+    Parameters
+    ----------
+    word_types : Iterable[WordType]
+        The types, in order.
+
+    Returns
+    -------
+    WordTypes
+        The shared instance.
+    """
+    key = tuple(word_types)
+    interned = _interned_word_types.get(key)
+
+    if interned is None:
+        interned = _interned_word_types.setdefault(key, WordTypes(key))
+
+    return interned
+
+
+def word_types_from_pos(pos: str) -> WordTypes:
+    """
+    Gets the shared WordTypes instance for a POS string from fugashi, e.g. "名詞,一般,*,*".
+    Parameters
+    ----------
+    pos : str
+        The POS string of a node.
+
+    Returns
+    -------
+    WordTypes
+        The shared instance.
+    """
+    interned = _word_types_by_pos.get(pos)
+
+    if interned is None:
+        interned = _word_types_by_pos.setdefault(
+            pos,
+            intern_word_types(WordType(word_type) for word_type in parse_pos_node(pos)),
+        )
+
+    return interned
+
+
 @dataclass()
 class Word:
     representation: str
     surface: str
-    types: list[WordType]
+    types: Sequence[WordType]
     frequency: int = 1
 
+    def __post_init__(self):
+        """
+        Normalises `types` to the shared `WordTypes` instance, so words compare equal whatever sequence they were given.
+        """
+        if not isinstance(self.types, WordTypes):
+            self.types = intern_word_types(self.types)
+
     @staticmethod
-    def from_node(node: UnidicNode) -> "Word":
+    def from_node(node: "UnidicNode", cache: LRUCache | None = None) -> "Word":
         """
         Creates a Word from a UnidicNode.
         Parameters
         ----------
         node : UnidicNode
             The node to create the word from.
+        cache : LRUCache | None
+            A cache of representations and types keyed on the node's surface and features.
+            The same tokens repeat constantly, so this skips re-parsing them.
 
         Returns
         -------
@@ -109,11 +224,20 @@ class Word:
             The created word.
 
         """
+        surface = node.surface
+
+        if cache is None:
+            parts = _node_parts(node)
+        else:
+            key = (surface, node.feature_raw)
+            parts = cache.get(key)
+
+            if parts is None:
+                parts = _node_parts(node)
+                cache.put(key, parts)
+
         return Word(
-            representation=word_rep(node),
-            surface=node.surface,
-            types=[WordType(word_type) for word_type in parse_pos_node(node.pos)],
-            frequency=1,
+            representation=parts[0], surface=surface, types=parts[1], frequency=1
         )
 
     def to_dict(self):
@@ -130,3 +254,19 @@ class Word:
             "types": [word_type.value for word_type in self.types],
             "frequency": self.frequency,
         }
+
+
+def _node_parts(node: "UnidicNode") -> tuple[str, WordTypes]:
+    """
+    Gets the representation and types of a UnidicNode.
+    Parameters
+    ----------
+    node : UnidicNode
+        The node to get the parts of.
+
+    Returns
+    -------
+    tuple[str, WordTypes]
+        The representation and the shared types of the node.
+    """
+    return word_rep(node), word_types_from_pos(node.pos)
@@ -2,15 +2,22 @@
 .. include:: ../../documentation/word_slot.md
 """
 
-from dataclasses import dataclass
+from dataclasses import replace
 from typing import Iterable
 
 from .word import Word
 
 
-@dataclass(init=False)
 class WordSlot:
-    words: list[Word]
+    """
+    The words sharing a representation, keyed on their surfaces.
+
+    The total frequency is kept up to date as words are added, so adding a word, checking for a surface
+    and reading the frequency all take constant time. Words should therefore only be modified through the slot.
+    """
+
+    _words: dict[str, Word]
+    _frequency: int
 
     def __init__(self, words: Iterable[Word]):
         """
@@ -20,10 +27,61 @@ class WordSlot:
         words : Iterable[Word]
             The words to create the word slot from.
         """
-        self.words = []
+        self._words = {}
+        self._frequency = 0
 
         [self.add_word(word) for word in words]
 
+    @classmethod
+    def _from_surfaces(cls, words: dict[str, Word], frequency: int) -> "WordSlot":
+        """
+        Creates a WordSlot from words already keyed on their surfaces, without adding them one by one.
+        Parameters
+        ----------
+        words : dict[str, Word]
+            The words of the word slot, keyed on their surfaces. Stored as is.
+        frequency : int
+            The sum of the frequencies of the words.
+
+        Returns
+        -------
+        WordSlot
+            The created word slot.
+        """
+        word_slot = cls.__new__(cls)
+        word_slot._words = words
+        word_slot._frequency = frequency
+
+        return word_slot
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Whether two word slots contain the same words in the same order.
+        Parameters
+        ----------
+        other : object
+            The object to compare to.
+
+        Returns
+        -------
+        bool
+            Whether the word slots are equal.
+        """
+        if not isinstance(other, WordSlot):
+            return NotImplemented
+
+        return self.words == other.words
+
+    def __repr__(self) -> str:
+        """
+        A string representation of the word slot in the form: 'WordSlot(words=[...])'
+        Returns
+        -------
+        str
+            The string representation of the word slot.
+        """
+        return f"WordSlot(words={self.words!r})"
+
     def __contains__(self, item: [Word | str]):
         """
         Checks if the word slot contains the item.
@@ -41,10 +99,10 @@ class WordSlot:
             Whether the word slot contains the item or not.
         """
         if isinstance(item, Word):
-            return item in self.words
+            return self._words.get(item.surface) == item
 
         if isinstance(item, str):
-            return item in [word.surface for word in self.words]
+            return item in self._words
 
         return False
 
@@ -56,7 +114,29 @@ class WordSlot:
         int
             The frequency of the word slot.
         """
-        return self.frequency
+        return self._frequency
+
+    @property
+    def words(self) -> list[Word]:
+        """
+        The words in the word slot, in the order their surfaces were first added.
+        Returns
+        -------
+        list[Word]
+            The words in the word slot.
+        """
+        return list(self._words.values())
+
+    @property
+    def surfaces(self) -> Iterable[str]:
+        """
+        The surfaces of the words in the word slot, in the order they were first added.
+        Returns
+        -------
+        Iterable[str]
+            A view of the surfaces of the word slot.
+        """
+        return self._words.keys()
 
     @property
     def frequency(self) -> int:
@@ -69,7 +149,7 @@ class WordSlot:
         int
             The frequency of the word slot.
         """
-        return sum(word.frequency for word in self.words)
+        return self._frequency
 
     def to_dict(self, combine: bool = False) -> dict:
         """
@@ -86,21 +166,18 @@ class WordSlot:
         dict
             The dictionary representation of the word slot.
         """
-        if not self.words:
+        if not self._words:
             return {}
 
         if combine:
-            word = Word(
-                representation=self.words[0].representation,
-                surface=self.words[0].representation,
-                types=self.words[0].types,
-                frequency=self.frequency,
-            )
-
-            for word in self.words[1:]:
-                word.frequency += word.frequency
+            first_word = next(iter(self._words.values()))
 
-            return word.to_dict()
+            return Word(
+                representation=first_word.representation,
+                surface=first_word.representation,
+                types=first_word.types,
+                frequency=self._frequency,
+            ).to_dict()
 
         words_array = []
 
@@ -116,12 +193,66 @@ class WordSlot:
         word : Word
             The word to add to the word slot.
         """
-        for old_word in self.words:
-            if old_word.surface == word.surface:
-                old_word.frequency += word.frequency
-                return
+        # Read first, as the word may be the stored word itself, whose frequency is about to change
+        frequency = word.frequency
+        existing_word = self._words.get(word.surface)
+
+        if existing_word is None:
+            self._words[word.surface] = word
+        else:
+            existing_word.frequency += frequency
+
+        self._frequency += frequency
+
+    def remove_word(self, word: Word) -> None:
+        """
+        Subtracts the frequency of a word from the word with the same surface, the reverse of `add_word`.
+        Surfaces whose frequency reaches 0 are removed from the word slot.
+        Parameters
+        ----------
+        word : Word
+            The word to remove from the word slot.
+        """
+        frequency = word.frequency
+        existing_word = self._words.get(word.surface)
+
+        if existing_word is None or existing_word.frequency < frequency:
+            raise ValueError(
+                f"WordSlot: can't remove {frequency} of '{word.surface}', "
+                f"only {existing_word.frequency if existing_word else 0} counted"
+            )
+
+        existing_word.frequency -= frequency
+        self._frequency -= frequency
+
+        if not existing_word.frequency:
+            del self._words[word.surface]
+
+    def merge(self, other: "WordSlot", copy: bool = True) -> None:
+        """
+        Adds the words of another word slot to this one, summing the frequencies of matching surfaces.
+        Parameters
+        ----------
+        other : WordSlot
+            The word slot to merge into this one.
+        copy : bool
+            Whether to copy the words of `other`. If False, new surfaces are stored as is.
+        """
+        if copy:
+            [self.add_word(replace(word)) for word in other.words]
+            return
+
+        [self.add_word(word) for word in other.words]
 
-        self.words.append(word)
+    def copy(self) -> "WordSlot":
+        """
+        Creates a copy of the word slot, including copies of its words.
+        Returns
+        -------
+        WordSlot
+            The copied word slot.
+        """
+        return WordSlot(replace(word) for word in self.words)
 
 
 def get_unique_wordslots(word_slots: Iterable[WordSlot]) -> list[WordSlot]:
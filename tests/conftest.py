@@ -0,0 +1,28 @@
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from typing import Callable
+
+import pytest
+
+
+def unordered_counts(freq_list: JapaneseFrequencyList) -> tuple[dict, dict, int]:
+    """
+    The counts of a frequency list, ignoring the order words were first counted in.
+    """
+    return (
+        {
+            slot.words[0].representation: sorted(
+                (word.surface, word.frequency) for word in slot.words
+            )
+            for slot in freq_list.wordslots
+        },
+        {
+            kanji.representation: kanji.frequency
+            for kanji in freq_list._unique_kanji.values()
+        },
+        freq_list.word_count,
+    )
+
+
+@pytest.fixture
+def counts() -> Callable[[JapaneseFrequencyList], tuple[dict, dict, int]]:
+    return unordered_counts
@@ -0,0 +1,94 @@
+from jpfreq.exporters.csv import CsvExporter, TsvExporter, COLUMNS
+from jpfreq.exporters.iexporter import open_export_file
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from jpfreq.word import Word, WordType
+from io import StringIO
+import bz2
+import csv
+import gzip
+import lzma
+
+import pytest
+
+
+@pytest.fixture()
+def freq_list():
+    freq_list = JapaneseFrequencyList()
+    freq_list.add_word(Word("猫", "猫", [WordType.NOUN, WordType.GENERAL]))
+    freq_list.add_word(Word("猫", "ねこ", [WordType.NOUN]))
+    freq_list.add_word(Word("猫", "猫", [WordType.NOUN, WordType.GENERAL]))
+    freq_list.add_word(Word('"引用",\t', '"引用",\t', []))
+
+    return freq_list
+
+
+test_export_data = [
+    (
+        False,
+        [
+            ["猫", "猫", "2", "名詞,一般"],
+            ["猫", "ねこ", "1", "名詞"],
+            ['"引用",\t', '"引用",\t', "1", ""],
+        ],
+    ),
+    (
+        True,
+        [
+            ["猫", "猫", "3", "名詞,一般"],
+            ['"引用",\t', '"引用",\t', "1", ""],
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize("exporter", [CsvExporter(), TsvExporter()])
+@pytest.mark.parametrize("combine, expected_rows", test_export_data)
+def test_export(freq_list, exporter, combine, expected_rows):
+    result = exporter.export(freq_list, limit=-1, combine=combine)
+    rows = list(csv.reader(StringIO(result), delimiter=exporter.delimiter))
+
+    assert rows == [list(COLUMNS)] + expected_rows
+    assert result == "".join(exporter.export_lazy(freq_list, limit=-1, combine=combine))
+
+
+def test_export_empty():
+    assert CsvExporter().export(JapaneseFrequencyList()) == ",".join(COLUMNS) + "\n"
+
+
+test_compression_data = [
+    ("export.csv", open),
+    ("export.csv.gz", gzip.open),
+    ("export.csv.bz2", bz2.open),
+    ("export.csv.xz", lzma.open),
+]
+
+
+@pytest.mark.parametrize("file_name, opener", test_compression_data)
+def test_export_to_file(freq_list, tmp_path, file_name, opener):
+    exporter = CsvExporter()
+    exporter.export_to_file(tmp_path / file_name, freq_list, limit=-1, combine=False)
+
+    with opener(tmp_path / file_name, "rt", encoding="utf-8", newline="") as fp:
+        assert fp.read() == exporter.export(freq_list, limit=-1, combine=False)
+
+
+@pytest.mark.parametrize("exporter", [CsvExporter(), TsvExporter()])
+def test_export_to_file_defaults(freq_list, tmp_path, exporter):
+    exporter.export_to_file(tmp_path / "export.csv", freq_list)
+
+    with open(tmp_path / "export.csv", encoding="utf-8", newline="") as fp:
+        assert fp.read() == exporter.export(freq_list)
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_explicit_compression(freq_list, tmp_path, compression):
+    file_path = tmp_path / "export"
+    CsvExporter().export_to_file(file_path, freq_list, compression=compression)
+
+    with open(file_path, "rb") as fp:
+        assert fp.read(3) != b"rep"
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        open_export_file(tmp_path / "export.csv", "zip")
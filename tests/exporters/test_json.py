@@ -1,6 +1,8 @@
 from jpfreq.exporters.json import JsonExporter
 from jpfreq.jp_frequency_list import JapaneseFrequencyList
-from json import dumps
+from json import dumps, loads
+from io import StringIO
+from os.path import dirname, abspath, join
 
 import pytest
 
@@ -113,3 +115,46 @@ def test_export_dict(exporter, freq_list, text, combine, limit):
     assert result == exporter._create_export_dictionary(
         freq_list, combine=combine, limit=limit
     )
+
+
+@pytest.mark.parametrize("text, combine, limit", test_export_data)
+def test_export_lazy(exporter, freq_list, text, combine, limit):
+    freq_list.process_text(text)
+
+    assert "".join(
+        exporter.export_lazy(freq_list, combine=combine, limit=limit)
+    ) == exporter.export(freq_list, combine=combine, limit=limit)
+
+
+def test_export_lazy_is_lazy(exporter, freq_list):
+    freq_list.process_text("猫が好き")
+    chunks = exporter.export_lazy(freq_list, limit=-1)
+
+    assert next(chunks).startswith('{\n    "text_info": {')
+    assert len(list(chunks)) == len(freq_list) + 1
+
+
+@pytest.mark.parametrize("combine", [True, False])
+def test_export_to(exporter, combine):
+    freq_list = JapaneseFrequencyList()
+    file_path = dirname(dirname(abspath(__file__)))
+    freq_list.process_file(join(file_path, "bigtext1.txt"))
+    buffer = StringIO()
+
+    exporter.export_to(buffer, freq_list, limit=-1, combine=combine)
+
+    assert buffer.getvalue() == exporter.export(freq_list, limit=-1, combine=combine)
+    assert loads(buffer.getvalue()) == exporter.export(
+        freq_list, limit=-1, combine=combine, as_dict=True
+    )
+
+
+def test_export_to_defaults(exporter):
+    freq_list = JapaneseFrequencyList()
+    file_path = dirname(dirname(abspath(__file__)))
+    freq_list.process_file(join(file_path, "bigtext1.txt"))
+    buffer = StringIO()
+
+    exporter.export_to(buffer, freq_list)
+
+    assert buffer.getvalue() == exporter.export(freq_list)
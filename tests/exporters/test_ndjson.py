@@ -0,0 +1,45 @@
+from jpfreq.exporters.ndjson import NdjsonExporter
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from jpfreq.word import Word, WordType
+from json import loads
+
+import pytest
+
+
+@pytest.fixture()
+def exporter():
+    return NdjsonExporter()
+
+
+test_export_data = [
+    ("", False, 100),
+    ("あ", False, 100),
+    ("猫が好き", False, 1),
+    ("猫が好き猫", False, -1),
+    ("猫が好き猫", True, -1),
+]
+
+
+@pytest.mark.parametrize("text, combine, limit", test_export_data)
+def test_export(exporter, text, combine, limit):
+    freq_list = JapaneseFrequencyList()
+    freq_list.process_text(text)
+    result = exporter.export(freq_list, limit=limit, combine=combine)
+    lines = list(exporter.export_lazy(freq_list, limit=limit, combine=combine))
+
+    assert result == "".join(lines)
+    assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+    assert [loads(line) for line in lines] == [
+        slot.to_dict(combine=combine)
+        for slot in freq_list.get_most_frequent(limit=limit)
+    ]
+
+
+def test_export_to_file_defaults(exporter, tmp_path):
+    freq_list = JapaneseFrequencyList()
+    freq_list.add_word(Word("猫", "猫", [WordType.NOUN, WordType.GENERAL]))
+    freq_list.add_word(Word("猫", "ねこ", [WordType.NOUN]))
+    exporter.export_to_file(tmp_path / "export.ndjson", freq_list)
+
+    with open(tmp_path / "export.ndjson", encoding="utf-8", newline="") as fp:
+        assert fp.read() == exporter.export(freq_list)
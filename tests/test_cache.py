@@ -0,0 +1,63 @@
+from jpfreq.cache import LRUCache, CacheInfo
+
+import pytest
+
+
+def test_get_missing():
+    cache = LRUCache(2)
+
+    assert cache.get("a") is None
+    assert cache.get("a", 1) == 1
+    assert cache.cache_info() == CacheInfo(hits=0, misses=2, maxsize=2, currsize=0)
+
+
+def test_put_get():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert len(cache) == 1
+    assert cache.cache_info() == CacheInfo(hits=1, misses=0, maxsize=2, currsize=1)
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_clear():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+hit_rate_data = [
+    (CacheInfo(0, 0, 1, 0), 0),
+    (CacheInfo(1, 0, 1, 0), 1),
+    (CacheInfo(1, 1, 1, 0), 0.5),
+    (CacheInfo(3, 1, 1, 0), 0.75),
+]
+
+
+@pytest.mark.parametrize("cache_info,expected", hit_rate_data)
+def test_hit_rate(cache_info, expected):
+    assert cache_info.hit_rate == expected
+
+
+@pytest.mark.parametrize("maxsize", [0, -1])
+def test_invalid_maxsize(maxsize):
+    with pytest.raises(ValueError):
+        LRUCache(maxsize)
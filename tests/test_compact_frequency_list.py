@@ -0,0 +1,323 @@
+from jpfreq.compact_frequency_list import CompactJapaneseFrequencyList
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from jpfreq.kanji import Kanji
+from jpfreq.word import Word, WordType, intern_word_types
+from os.path import dirname, abspath, join
+import tracemalloc
+
+import pytest
+
+file_path = dirname(abspath(__file__))
+big_files = [join(file_path, "bigtext1.txt"), join(file_path, "bigtext2.txt")]
+
+
+@pytest.fixture(scope="module")
+def big_lists():
+    freq_list = JapaneseFrequencyList(compare_surface=True)
+    freq_list.process_files(big_files)
+    compact_list = CompactJapaneseFrequencyList(compare_surface=True)
+    compact_list.process_files(big_files)
+
+    return freq_list, compact_list
+
+
+def test_same_counts(big_lists):
+    freq_list, compact_list = big_lists
+
+    assert len(compact_list) == len(freq_list)
+    assert compact_list.generate_text_info() == freq_list.generate_text_info()
+    assert compact_list.wordslots == freq_list.wordslots
+    assert compact_list._counts() == freq_list._counts()
+
+
+get_most_frequent_data = [
+    (100, -1, -1),
+    (-1, -1, -1),
+    (0, -1, -1),
+    (10, 2, -1),
+    (-1, -1, 3),
+    (50, 2, 10),
+    (-1, 10, 2),
+]
+
+
+@pytest.mark.parametrize("limit,minimum,maximum", get_most_frequent_data)
+def test_get_most_frequent(big_lists, limit, minimum, maximum):
+    freq_list, compact_list = big_lists
+
+    assert compact_list.get_most_frequent(
+        limit, minimum, maximum
+    ) == freq_list.get_most_frequent(limit, minimum, maximum)
+
+
+def test_lookups(big_lists):
+    freq_list, compact_list = big_lists
+
+    for word in list(freq_list._unique_words) + list(freq_list._surface_index):
+        assert word in compact_list
+        assert compact_list[word] == freq_list[word]
+
+    assert "存在しない単語" not in compact_list
+    assert 1 not in compact_list
+
+    with pytest.raises(KeyError):
+        compact_list["存在しない単語"]
+
+
+def test_compare_surface_enabled_later():
+    freq_list = CompactJapaneseFrequencyList()
+    freq_list.add_word(Word("無し", "無し", []))
+    freq_list.add_word(Word("無い", "ない", []))
+    freq_list.add_word(Word("無い", "なし", []))
+    freq_list.add_word(Word("無し", "なし", []))
+
+    assert "なし" not in freq_list
+
+    freq_list.compare_surface = True
+
+    assert freq_list["なし"] == freq_list["無し"]
+
+    freq_list.compare_surface = False
+
+    assert "なし" not in freq_list
+
+
+def test_word_types_interned():
+    freq_list = CompactJapaneseFrequencyList()
+    freq_list.add_word(Word("猫", "猫", [WordType.NOUN]))
+    freq_list.add_word(Word("猫", "ねこ", (WordType.NOUN,)))
+
+    first, second = freq_list["猫"].words
+
+    assert first.types is second.types
+    assert first.types == (WordType.NOUN,)
+
+
+def test_kanji():
+    freq_list = CompactJapaneseFrequencyList()
+    freq_list.add_kanji(Kanji("猫", 1))
+    freq_list.add_kanji(Kanji("猫", 1))
+    freq_list.add_kanji_counts({"犬": 1, "猫": 3})
+
+    assert freq_list._counts()[1] == {"猫": Kanji("猫", 5), "犬": Kanji("犬", 1)}
+    assert freq_list.unique_kanji == 2
+    assert freq_list.unique_kanji_used_once == 1
+
+
+def test_copy_merge_and_clear(big_lists):
+    freq_list, compact_list = big_lists
+
+    copied = compact_list.copy()
+    copied += freq_list
+
+    assert isinstance(copied, CompactJapaneseFrequencyList)
+    assert copied.compare_surface
+    assert copied.word_count == freq_list.word_count * 2
+    assert copied.generate_text_info() == (freq_list + freq_list).generate_text_info()
+    assert compact_list.word_count == freq_list.word_count
+
+    copied.clear()
+
+    assert len(copied) == 0
+    assert copied.word_count == 0
+    assert copied.unique_kanji == 0
+    assert copied.get_most_frequent() == []
+    assert copied.compare_surface
+
+
+def test_parallel(big_lists):
+    _, compact_list = big_lists
+    parallel_list = CompactJapaneseFrequencyList(compare_surface=True)
+    parallel_list.process_files(big_files, jobs=2)
+
+    assert parallel_list._counts() == compact_list._counts()
+
+
+def test_batched(big_lists):
+    _, compact_list = big_lists
+    batched_list = CompactJapaneseFrequencyList(
+        compare_surface=True, tag_batch_size=65536
+    )
+    batched_list.process_files(big_files)
+
+    assert batched_list._counts() == compact_list._counts()
+
+
+def test_save_load(big_lists, tmp_path):
+    freq_list, compact_list = big_lists
+    compact_list.save(tmp_path / "compact.jpfq")
+
+    loaded = CompactJapaneseFrequencyList.load(tmp_path / "compact.jpfq")
+
+    assert isinstance(loaded, CompactJapaneseFrequencyList)
+    assert loaded._counts() == freq_list._counts()
+    assert loaded.generate_text_info() == freq_list.generate_text_info()
+    assert loaded.wordslots == freq_list.wordslots
+
+
+@pytest.mark.parametrize("compare_surface", [False, True])
+def test_load_then_count(big_lists, tmp_path, compare_surface):
+    freq_list, compact_list = big_lists
+    compact_list.save(tmp_path / "compact.jpfq")
+
+    loaded = CompactJapaneseFrequencyList.load(
+        tmp_path / "compact.jpfq", compare_surface=compare_surface
+    )
+    expected = JapaneseFrequencyList(compare_surface=compare_surface)
+    expected.merge(freq_list)
+
+    assert loaded.compare_surface == compare_surface
+    words = list(freq_list._unique_words) + list(freq_list._surface_index) + ["猫"]
+    assert [word in loaded for word in words] == [word in expected for word in words]
+
+    for freq_list_to_update in (loaded, expected):
+        freq_list_to_update.process_line("今日は新しい単語を数える")
+        freq_list_to_update.add_kanji(Kanji("鬱", 1))
+
+    assert loaded._counts() == expected._counts()
+    assert loaded.unique_words_all == expected.unique_words_all
+    assert loaded.unique_kanji_all == expected.unique_kanji_all
+
+
+def test_load_into_counted_list(big_lists, tmp_path):
+    freq_list, compact_list = big_lists
+    compact_list.save(tmp_path / "compact.jpfq")
+
+    loaded = CompactJapaneseFrequencyList.load(
+        tmp_path / "compact.jpfq", text_to_analyse=["今日は猫を見た"]
+    )
+    expected = JapaneseFrequencyList(text_to_analyse=["今日は猫を見た"])
+    expected.merge(freq_list)
+
+    assert loaded._counts() == expected._counts()
+
+
+def test_memory():
+    types = intern_word_types([WordType.NOUN, WordType.GENERAL])
+    representations = [f"語{i}" for i in range(20000)]
+
+    def traced_size(freq_list):
+        tracemalloc.start()
+        for representation in representations:
+            freq_list.add_word(Word(representation[:], representation[:], types))
+
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        return size
+
+    freq_list_size = traced_size(JapaneseFrequencyList())
+    compact_list_size = traced_size(CompactJapaneseFrequencyList())
+
+    assert compact_list_size * 5 < freq_list_size
+
+
+def test_remove_kanji_counts():
+    compact_list = CompactJapaneseFrequencyList()
+    compact_list.process_text("日本日本")
+    compact_list.remove_kanji_counts({"日": 1, "本": 2})
+
+    assert compact_list.unique_kanji_all == (1, 1, 100)
+
+    with pytest.raises(ValueError):
+        compact_list.remove_kanji_counts({"本": 1})
+
+
+def test_remove_word():
+    compact_list = CompactJapaneseFrequencyList(compare_surface=True)
+    compact_list.process_text("猫と犬と猫")
+    compact_list.remove_word(Word("猫", "猫", [WordType.NOUN]))
+
+    assert compact_list["猫"].frequency == 1
+    assert compact_list.word_count == 2
+    assert compact_list.get_most_frequent(minimum=2) == []
+
+    compact_list.remove_word(Word("猫", "猫", [WordType.NOUN]))
+
+    assert "猫" not in compact_list
+    assert len(compact_list) == compact_list.unique_words == 1
+    assert compact_list.word_count == 1
+    assert compact_list.get_most_frequent(-1) == [compact_list["犬"]]
+    assert compact_list.get_most_frequent(maximum=1) == [compact_list["犬"]]
+    assert compact_list.wordslots == [compact_list["犬"]]
+    assert list(compact_list._counts()[0]) == ["犬"]
+
+    compact_list.add_word(Word("猫", "猫", [WordType.PROPER_NOUN]))
+
+    assert compact_list["猫"].words == [Word("猫", "猫", [WordType.PROPER_NOUN])]
+    assert len(compact_list) == 2
+    assert len(compact_list._slot_frequencies) == 2
+
+
+remove_word_error_data = [
+    (Word("鳥", "鳥", []), KeyError),
+    (Word("猫", "ねこ", []), ValueError),
+    (Word("猫", "猫", [], 2), ValueError),
+]
+
+
+@pytest.mark.parametrize("word,expected_error", remove_word_error_data)
+def test_remove_word_errors(word, expected_error):
+    compact_list = CompactJapaneseFrequencyList()
+    compact_list.process_text("猫")
+
+    with pytest.raises(expected_error):
+        compact_list.remove_word(word)
+
+    assert compact_list["猫"].frequency == 1
+    assert compact_list.word_count == 1
+
+
+def test_remove_shared_surface():
+    compact_list = CompactJapaneseFrequencyList(compare_surface=True)
+    compact_list.add_word(Word("行く", "行っ", []))
+    compact_list.add_word(Word("言う", "行っ", []))
+    compact_list.add_word(Word("言う", "言っ", []))
+
+    assert compact_list["行っ"].words[0].representation == "行く"
+
+    compact_list.remove_word(Word("行く", "行っ", []))
+
+    assert compact_list["行っ"].words[0].representation == "言う"
+
+    compact_list.remove_word(Word("言う", "行っ", []))
+
+    assert "行っ" not in compact_list
+    assert compact_list["言っ"].frequency == 1
+
+
+@pytest.mark.parametrize("compare_surface", [False, True])
+def test_remove_everything_from_big_list(compare_surface):
+    freq_list = JapaneseFrequencyList(compare_surface=compare_surface)
+    freq_list.process_file(big_files[1])
+    compact_list = CompactJapaneseFrequencyList(compare_surface=compare_surface)
+    compact_list.process_file(big_files[1])
+    removed = JapaneseFrequencyList()
+    removed.process_file(big_files[0])
+
+    for freq_list_to_update in (freq_list, compact_list):
+        freq_list_to_update.merge(removed)
+
+        for word_slot in removed.wordslots:
+            for word in word_slot.words:
+                freq_list_to_update.remove_word(word)
+
+    assert compact_list._counts() == freq_list._counts()
+    assert compact_list.generate_text_info() == freq_list.generate_text_info()
+    assert sorted(map(len, compact_list.get_most_frequent(-1)), reverse=True) == [
+        word_slot.frequency for word_slot in freq_list.get_most_frequent(-1)
+    ]
+
+    words = list(freq_list._unique_words) + list(removed._unique_words)
+
+    if compare_surface:
+        words += [
+            word.surface for word_slot in removed.wordslots for word in word_slot.words
+        ]
+
+    assert [word in compact_list for word in words] == [
+        word in freq_list for word in words
+    ]
+    assert [compact_list[word] for word in words if word in freq_list] == [
+        freq_list[word] for word in words if word in freq_list
+    ]
@@ -0,0 +1,195 @@
+from jpfreq.concurrent_frequency_list import ConcurrentJapaneseFrequencyList
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from jpfreq.word import Word, WordType
+from concurrent.futures import ThreadPoolExecutor
+from fugashi import Tagger
+from os.path import dirname, abspath, join
+from threading import Thread
+
+import pytest
+
+file_path = dirname(abspath(__file__))
+big_files = [join(file_path, "bigtext1.txt"), join(file_path, "bigtext2.txt")]
+
+
+@pytest.fixture(scope="module")
+def big_lines():
+    lines = []
+
+    for file in big_files:
+        with open(file, "r", encoding="utf-8") as fs:
+            lines.extend(fs.read().split("\n"))
+
+    return lines
+
+
+@pytest.fixture(scope="module")
+def serial_list(big_lines):
+    freq_list = JapaneseFrequencyList()
+    freq_list.process_lines(big_lines)
+
+    return freq_list
+
+
+@pytest.mark.parametrize("flush_size", [1, 7, 256, 100000])
+def test_process_line_from_threads(big_lines, serial_list, flush_size, counts):
+    freq_list = ConcurrentJapaneseFrequencyList(flush_size=flush_size)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(freq_list.process_line, big_lines))
+
+    assert counts(freq_list) == counts(serial_list)
+    assert freq_list.generate_text_info() == serial_list.generate_text_info()
+
+
+@pytest.mark.parametrize("tag_batch_size", [0, 4096])
+def test_process_files_from_threads(tag_batch_size, counts):
+    freq_list = ConcurrentJapaneseFrequencyList(tag_batch_size=tag_batch_size)
+    serial_list = JapaneseFrequencyList(tag_batch_size=tag_batch_size)
+    threads = [
+        Thread(target=freq_list.process_file, args=(file,)) for file in big_files * 2
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    serial_list.process_files(big_files * 2)
+
+    assert counts(freq_list) == counts(serial_list)
+
+
+def test_queries_while_processing(big_lines, serial_list, counts):
+    freq_list = ConcurrentJapaneseFrequencyList(flush_size=16)
+    word_counts = []
+
+    def query() -> None:
+        while thread.is_alive():
+            word_counts.append(freq_list.word_count)
+            freq_list.get_most_frequent(10)
+            freq_list.generate_text_info()
+
+    thread = Thread(target=freq_list.process_lines, args=(big_lines,))
+    thread.start()
+    query()
+    thread.join()
+
+    assert word_counts == sorted(word_counts)
+    assert counts(freq_list) == counts(serial_list)
+
+
+def test_queries_include_buffered_lines():
+    freq_list = ConcurrentJapaneseFrequencyList(flush_size=1000)
+    thread = Thread(target=freq_list.process_line, args=("私は猫です。",))
+    thread.start()
+    thread.join()
+
+    assert freq_list._buffers[0].pending == 1
+    assert freq_list.word_count == 2
+    assert "猫" in freq_list
+    assert freq_list["猫"].frequency == 1
+    assert freq_list._buffers == []
+
+
+@pytest.mark.parametrize("line_cache_size", [0, 16])
+def test_tags_without_lock(line_cache_size):
+    freq_list = ConcurrentJapaneseFrequencyList(
+        flush_size=1000, line_cache_size=line_cache_size
+    )
+    buffer = freq_list._buffer()
+    tagger = buffer.freq_list.tagger
+    locked_while_tagging = []
+
+    def tag(text: str) -> list:
+        locked_while_tagging.append(buffer.lock.locked())
+        return tagger(text)
+
+    buffer.freq_list._pooled_taggers.tagger = tag
+    freq_list.process_line("私は猫です。")
+    freq_list.process_lines(["猫と犬", "私は猫です。"])
+
+    assert locked_while_tagging and not any(locked_while_tagging)
+    assert freq_list["猫"].frequency == 3
+
+
+def test_remove_buffered_lines():
+    freq_list = ConcurrentJapaneseFrequencyList(flush_size=1000)
+    freq_list.process_line("日本")
+
+    freq_list.remove_kanji_counts({"日": 1})
+    freq_list.remove_word(Word("日本", "日本", [WordType.PROPER_NOUN], 1))
+
+    assert "日本" not in freq_list
+    assert freq_list.word_count == 0
+    assert list(freq_list._unique_kanji) == ["本"]
+
+
+def test_flush():
+    freq_list = ConcurrentJapaneseFrequencyList(flush_size=1000)
+    freq_list.process_text("私は猫です。\n猫と犬")
+
+    assert freq_list._buffers[0].pending == 2
+
+    freq_list.flush()
+
+    assert freq_list._buffers[0].pending == 0
+    assert freq_list._word_count == 4
+
+
+def test_clear_drops_buffered_lines():
+    freq_list = ConcurrentJapaneseFrequencyList(flush_size=1000)
+    freq_list.process_line("私は猫です。")
+    freq_list.clear()
+
+    assert freq_list.word_count == 0
+    assert len(freq_list) == 0
+
+
+def test_excluded_word_types():
+    freq_list = ConcurrentJapaneseFrequencyList(flush_size=1000)
+    freq_list.process_line("猫と犬")
+    freq_list.excluded_word_types = [WordType.NOUN]
+    freq_list.process_line("猫と犬")
+
+    assert freq_list["猫"].frequency == 1
+    assert freq_list["と"].frequency == 1
+
+
+def test_copy_and_merge(counts):
+    freq_list = ConcurrentJapaneseFrequencyList(flush_size=1000, compare_surface=True)
+    freq_list.process_text("私は猫です。\n猫と犬")
+    copied = freq_list.copy()
+
+    assert isinstance(copied, ConcurrentJapaneseFrequencyList)
+    assert copied.flush_size == 1000
+    assert counts(copied) == counts(freq_list)
+
+    copied.merge(freq_list)
+    plain_list = JapaneseFrequencyList()
+    plain_list.merge(freq_list)
+
+    assert copied["猫"].frequency == 4
+    assert plain_list["猫"].frequency == 2
+
+
+init_error_data = [
+    ({"flush_size": 0}, ValueError),
+    ({"tagger_instance": Tagger("-Owakati")}, ValueError),
+    ({"collect_stats": True}, ValueError),
+]
+
+
+@pytest.mark.parametrize("kwargs,expected_error", init_error_data)
+def test_init_errors(kwargs, expected_error):
+    with pytest.raises(expected_error):
+        ConcurrentJapaneseFrequencyList(**kwargs)
+
+
+def test_collect_stats_not_supported():
+    freq_list = ConcurrentJapaneseFrequencyList()
+    freq_list.collect_stats = False
+
+    with pytest.raises(ValueError):
+        freq_list.collect_stats = True
@@ -1,11 +1,16 @@
 from jpfreq.jp_frequency_list import (
     JapaneseFrequencyList,
+    DEFAULT_EXCLUDED_WORD_TYPES,
+    word_validator_exclude_by_type,
 )
 from jpfreq.text_info import TextInfo
 from jpfreq.word import WordType, Word
+from jpfreq.kanji import Kanji
+from jpfreq.stats import Stage
 from fugashi import Tagger
 from os.path import dirname, abspath, join
 
+import asyncio
 import pytest
 
 
@@ -360,6 +365,26 @@ def test_freq_provided_tagger():
     assert j._tagger is not None
 
 
+def test_tagger_created_on_first_use(tmp_path):
+    freq_list = JapaneseFrequencyList()
+    freq_list.save(tmp_path / "empty.jpfq")
+    freq_list.merge(JapaneseFrequencyList.load(tmp_path / "empty.jpfq"))
+
+    assert getattr(freq_list._pooled_taggers, "tagger", None) is None
+
+    freq_list.process_line("日本")
+    tagger = freq_list._pooled_taggers.tagger
+
+    assert isinstance(tagger, Tagger)
+    assert freq_list.tagger is tagger
+
+
+def test_copy_shares_tagger(freq_list):
+    freq_list.process_line("日本")
+
+    assert freq_list.copy().tagger is freq_list.tagger
+
+
 def test_freq_provided_tagger_incorrect():
     with pytest.raises(TypeError):
         JapaneseFrequencyList(tagger_instance="String!")
@@ -552,6 +577,37 @@ def test_process_big_text(freq_list, file, expected):
         assert word in freq_list
 
 
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_process_html_file(freq_list, jobs):
+    file_path = dirname(abspath(__file__))
+    freq_list.process_html_file(join(file_path, "bigsite1.html"), jobs=jobs)
+
+    with open(join(file_path, "bigtext1.txt"), "r", encoding="utf-8") as fs:
+        text_list = JapaneseFrequencyList()
+        text_list.process_text("小説\n" + fs.read())
+
+    assert freq_list.wordslots == text_list.wordslots
+    assert freq_list.generate_text_info() == text_list.generate_text_info()
+
+
+def test_process_html(freq_list):
+    freq_list.process_html(
+        "<html><head><style>.猫 { color: red; }</style></head>"
+        "<body><p>日本</p><script>犬();</script><p>語の本</p></body></html>"
+    )
+
+    assert "日本" in freq_list
+    assert "日本語" not in freq_list
+    assert "猫" not in freq_list
+    assert "犬" not in freq_list
+    assert freq_list.unique_kanji == 3
+
+
+def test_process_html_file_not_found(freq_list):
+    with pytest.raises(FileExistsError):
+        freq_list.process_html_file("not_found.html")
+
+
 def test_most_frequent_sorted_descending(freq_list):
     file_path = dirname(abspath(__file__))
     freq_list.process_file(join(file_path, "bigtext1.txt"))
@@ -599,3 +655,837 @@ def test_most_frequent_max(freq_list):
 
     most_frequent = freq_list.get_most_frequent(maximum=-1)
     assert len(most_frequent) == 3
+
+
+def test_process_file_parallel_matches_serial(freq_list):
+    file_path = join(dirname(abspath(__file__)), "bigtext1.txt")
+    freq_list.process_file(file_path)
+
+    parallel_list = JapaneseFrequencyList()
+    parallel_list.process_file(file_path, jobs=2)
+
+    assert parallel_list.generate_text_info() == freq_list.generate_text_info()
+    assert parallel_list.wordslots == freq_list.wordslots
+    assert parallel_list._unique_kanji == freq_list._unique_kanji
+    assert list(parallel_list._unique_kanji) == list(freq_list._unique_kanji)
+
+
+def test_process_files_parallel_matches_serial(freq_list):
+    file_path = dirname(abspath(__file__))
+    files = [join(file_path, "bigtext1.txt"), join(file_path, "bigtext2.txt")]
+    [freq_list.process_file(file) for file in files]
+
+    parallel_list = JapaneseFrequencyList()
+    parallel_list.process_files(files, jobs=2)
+
+    assert parallel_list.wordslots == freq_list.wordslots
+    assert parallel_list.generate_text_info() == freq_list.generate_text_info()
+
+
+@pytest.mark.parametrize("texts,expected_text_info", test_data_texts)
+def test_texts_parallel(texts, expected_text_info):
+    freq_list = JapaneseFrequencyList()
+    freq_list.process_texts(texts, jobs=2)
+
+    assert freq_list.generate_text_info() == expected_text_info
+
+
+def test_process_files_not_found(freq_list):
+    with pytest.raises(FileExistsError):
+        freq_list.process_files(["not_found.txt"], jobs=2)
+
+
+def test_process_parallel_tagger_instance(tmp_path):
+    freq_list = JapaneseFrequencyList(tagger_instance=Tagger())
+    (tmp_path / "text.txt").write_text("日本の猫", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        freq_list.process_texts(["日本の猫"], jobs=2)
+
+    with pytest.raises(ValueError):
+        freq_list.process_file(tmp_path / "text.txt", jobs=2)
+
+    freq_list.process_texts(["日本の猫"], jobs=1)
+
+    assert freq_list.word_count == 2
+
+
+@pytest.mark.parametrize("jobs", [0, -2])
+def test_process_texts_invalid_jobs(freq_list, jobs):
+    with pytest.raises(ValueError):
+        freq_list.process_texts(["日本"], jobs=jobs)
+
+
+async def iter_pieces(text: str, piece_size: int):
+    for start in range(0, len(text), piece_size):
+        await asyncio.sleep(0)
+        yield text[start : start + piece_size]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("piece_size", [1, 7, 100000])
+def test_process_stream_matches_serial(freq_list, jobs, piece_size):
+    file_path = join(dirname(abspath(__file__)), "bigtext1.txt")
+    freq_list.process_file(file_path)
+
+    with open(file_path, "r", encoding="utf-8") as fs:
+        text = fs.read()
+
+    stream_list = JapaneseFrequencyList()
+    asyncio.run(
+        stream_list.process_stream(iter_pieces(text, piece_size), jobs, queue_size=2)
+    )
+
+    assert stream_list.wordslots == freq_list.wordslots
+    assert list(stream_list._unique_kanji) == list(freq_list._unique_kanji)
+    assert stream_list.generate_text_info() == freq_list.generate_text_info()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_process_files_async_matches_serial(freq_list, jobs):
+    file_path = dirname(abspath(__file__))
+    files = [join(file_path, "bigtext1.txt"), join(file_path, "bigtext2.txt")]
+    freq_list.process_files(files)
+
+    async_list = JapaneseFrequencyList()
+    asyncio.run(async_list.process_files_async(files, jobs=jobs))
+
+    assert async_list.wordslots == freq_list.wordslots
+    assert async_list.generate_text_info() == freq_list.generate_text_info()
+
+
+def test_process_stream_tagger_instance(tmp_path):
+    tagger = Tagger()
+    freq_list = JapaneseFrequencyList(tagger_instance=tagger)
+    (tmp_path / "text.txt").write_text("日本の猫", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        asyncio.run(freq_list.process_stream(iter_pieces("日本の猫", 2), jobs=2))
+
+    with pytest.raises(ValueError):
+        asyncio.run(freq_list.process_files_async([tmp_path / "text.txt"], jobs=2))
+
+    asyncio.run(freq_list.process_files_async([tmp_path / "text.txt"]))
+
+    assert freq_list.word_count == 2
+
+
+def test_process_stream_does_not_block_loop(freq_list):
+    file_path = join(dirname(abspath(__file__)), "bigtext2.txt")
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def process():
+        ticker = asyncio.ensure_future(tick())
+        await freq_list.process_files_async([file_path])
+        ticker.cancel()
+
+    asyncio.run(process())
+
+    assert ticks > 1
+    assert freq_list.word_count > 0
+
+
+def test_process_stream_error(freq_list):
+    async def failing_stream():
+        yield "日本\n" * 5000
+        raise RuntimeError("stream failed")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(freq_list.process_stream(failing_stream(), queue_size=1))
+
+
+def test_process_stream_invalid_queue_size(freq_list):
+    with pytest.raises(ValueError):
+        asyncio.run(freq_list.process_stream(iter_pieces("日本", 1), queue_size=0))
+
+
+def test_process_files_async_not_found(freq_list):
+    with pytest.raises(FileExistsError):
+        asyncio.run(freq_list.process_files_async(["not_found.txt"]))
+
+
+def test_merge_matches_combined(freq_list):
+    freq_list.process_text("これは日本語です。")
+
+    other = JapaneseFrequencyList()
+    other.process_text("日本の学校に行きます。")
+
+    combined = JapaneseFrequencyList()
+    combined.process_texts(["これは日本語です。", "日本の学校に行きます。"])
+
+    freq_list.merge(other)
+
+    assert freq_list.wordslots == combined.wordslots
+    assert freq_list._unique_kanji == combined._unique_kanji
+    assert freq_list.generate_text_info() == combined.generate_text_info()
+
+
+def test_merge_leaves_other_unchanged(freq_list):
+    freq_list.process_text("日本")
+
+    other = JapaneseFrequencyList()
+    other.process_text("日本")
+
+    freq_list.merge(other)
+
+    assert freq_list["日本"].frequency == 2
+    assert other["日本"].frequency == 1
+    assert other._unique_kanji["日"].frequency == 1
+    assert other.word_count == 1
+
+
+def test_merge_invalid_type(freq_list):
+    with pytest.raises(TypeError):
+        freq_list.merge("日本")
+
+
+def test_add(freq_list):
+    freq_list.process_text("日本")
+
+    other = JapaneseFrequencyList()
+    other.process_text("日本の学校")
+
+    combined = freq_list + other
+
+    assert combined.word_count == 3
+    assert combined["日本"].frequency == 2
+    assert freq_list.word_count == 1
+    assert other.word_count == 2
+
+
+def test_add_invalid_type(freq_list):
+    with pytest.raises(TypeError):
+        freq_list + "日本"
+
+
+def test_iadd(freq_list):
+    original = freq_list
+    freq_list.process_text("日本")
+
+    other = JapaneseFrequencyList()
+    other.process_text("日本の学校")
+
+    freq_list += other
+
+    assert freq_list is original
+    assert freq_list.word_count == 3
+    assert freq_list.unique_kanji == 4
+
+
+def test_copy(freq_list):
+    freq_list.process_text("日本の学校")
+
+    copied = freq_list.copy()
+    copied.process_text("日本")
+
+    assert freq_list["日本"].frequency == 1
+    assert copied["日本"].frequency == 2
+    assert freq_list.word_count == 2
+
+
+def test_process_file_single_long_line(tmp_path):
+    text = "これは日本語です。" * 2000
+    file_path = tmp_path / "long.txt"
+    file_path.write_text(text, encoding="utf-8")
+
+    chunked_list = JapaneseFrequencyList(max_chunk_size=100)
+    chunked_list.process_file(str(file_path))
+
+    line_list = JapaneseFrequencyList()
+    line_list.process_text(text.replace("。", "。\n"))
+
+    assert chunked_list.generate_text_info() == line_list.generate_text_info()
+    assert chunked_list["日本"].frequency == 2000
+
+
+def test_invalid_max_chunk_size():
+    with pytest.raises(ValueError):
+        JapaneseFrequencyList(max_chunk_size=0)
+
+
+@pytest.mark.parametrize("tag_batch_size", [1, 16, 65536])
+@pytest.mark.parametrize("texts,expected_text_info", test_data_texts)
+def test_texts_batched(texts, expected_text_info, tag_batch_size):
+    freq_list = JapaneseFrequencyList(tag_batch_size=tag_batch_size)
+    [freq_list.process_text(text) for text in texts]
+
+    assert freq_list.generate_text_info() == expected_text_info
+
+
+@pytest.mark.parametrize("tag_batch_size", [1, 200, 65536])
+def test_process_files_batched_matches_serial(freq_list, tag_batch_size):
+    file_path = dirname(abspath(__file__))
+    files = [join(file_path, "bigtext1.txt"), join(file_path, "bigtext2.txt")]
+    freq_list.process_files(files)
+
+    batched_list = JapaneseFrequencyList(tag_batch_size=tag_batch_size)
+    batched_list.process_files(files)
+
+    assert batched_list.wordslots == freq_list.wordslots
+    assert list(batched_list._unique_kanji) == list(freq_list._unique_kanji)
+    assert batched_list.generate_text_info() == freq_list.generate_text_info()
+
+
+@pytest.mark.parametrize("tag_batch_size", [200, 65536])
+def test_process_file_batched_context(tag_batch_size):
+    # Tagged with the end of the previous line as context, 当然 is analysed as an adverb in bigtext2.txt,
+    # so only the counts match line by line processing, not the word types
+    file_path = join(dirname(abspath(__file__)), "bigtext2.txt")
+    freq_list = JapaneseFrequencyList()
+    freq_list.process_file(file_path)
+
+    batched_list = JapaneseFrequencyList(tag_batch_size=tag_batch_size)
+    batched_list.process_file(file_path)
+
+    assert batched_list.generate_text_info() == freq_list.generate_text_info()
+    assert {
+        representation: word_slot.frequency
+        for representation, word_slot in batched_list._unique_words.items()
+    } == {
+        representation: word_slot.frequency
+        for representation, word_slot in freq_list._unique_words.items()
+    }
+    assert batched_list.wordslots != freq_list.wordslots
+    assert freq_list["当然"].words[0].types == (WordType.NA_ADJECTIVE, WordType.GENERAL)
+    assert batched_list["当然"].words[0].types == (WordType.ADVERB,)
+
+
+def test_process_files_batched_parallel():
+    file_path = join(dirname(abspath(__file__)), "bigtext2.txt")
+
+    batched_list = JapaneseFrequencyList(tag_batch_size=1024)
+    batched_list.process_file(file_path)
+
+    parallel_list = JapaneseFrequencyList(tag_batch_size=1024)
+    parallel_list.process_file(file_path, jobs=2)
+
+    assert parallel_list.wordslots == batched_list.wordslots
+
+
+def test_process_lines_batched_keeps_lines_apart():
+    freq_list = JapaneseFrequencyList(tag_batch_size=65536)
+    freq_list.process_lines(["日本\n", "  ", "語の本"])
+
+    assert "日本語" not in freq_list
+    assert freq_list["日本"].frequency == 1
+    assert freq_list["語"].frequency == 1
+    assert freq_list.unique_kanji == 3
+
+
+def test_invalid_tag_batch_size():
+    with pytest.raises(ValueError):
+        JapaneseFrequencyList(tag_batch_size=-1)
+
+
+def test_copy_keeps_tag_batch_size():
+    freq_list = JapaneseFrequencyList(tag_batch_size=1024)
+
+    assert freq_list.copy().tag_batch_size == 1024
+
+
+def test_add_word_with_frequency(freq_list):
+    freq_list.add_word(Word("猫", "猫", [WordType.NOUN], 3))
+    freq_list.add_word(Word("猫", "ねこ", [WordType.NOUN]))
+
+    assert freq_list.word_count == 4
+    assert freq_list["猫"].frequency == 4
+
+
+@pytest.mark.parametrize("tag_batch_size", [0, 65536])
+def test_collect_stats(tag_batch_size):
+    file_path = join(dirname(abspath(__file__)), "bigtext2.txt")
+    freq_list = JapaneseFrequencyList(tag_batch_size=tag_batch_size)
+    freq_list.process_file(file_path)
+
+    stats_list = JapaneseFrequencyList(
+        collect_stats=True, tag_batch_size=tag_batch_size
+    )
+    stats_list.process_file(file_path)
+    stats = stats_list.stats
+
+    assert stats_list.wordslots == freq_list.wordslots
+    assert stats_list.generate_text_info() == freq_list.generate_text_info()
+    assert stats.words == freq_list.word_count
+    assert stats.tokens >= stats.words
+    assert stats.lines == len(stats.latency) > 0
+    assert stats.time > 0
+    assert stats.tokens_per_second > 0
+    assert stats.stages[Stage.ADD_WORD].calls <= stats.stages[Stage.PARSE].calls
+    assert all(stage_stats.calls > 0 for stage_stats in stats.stages.values())
+
+    stats_list.reset_stats()
+
+    assert stats_list.stats.lines == 0
+
+
+def test_collect_stats_toggle(freq_list):
+    assert freq_list.stats is None
+
+    freq_list.reset_stats()
+    freq_list.collect_stats = True
+    freq_list.process_line("日本の学校")
+    stats = freq_list.stats
+
+    assert stats.lines == 1
+    assert stats.words == 2
+
+    freq_list.collect_stats = True
+
+    assert freq_list.stats is stats
+    assert freq_list.copy().collect_stats
+
+    freq_list.collect_stats = False
+
+    assert freq_list.stats is None
+
+
+@pytest.mark.parametrize("line_cache_size", [1, 2, 4096])
+def test_line_cache_matches_uncached(freq_list, line_cache_size):
+    file_path = join(dirname(abspath(__file__)), "bigtext1.txt")
+
+    with open(file_path, "r", encoding="utf-8") as fs:
+        lines = fs.read().split("\n")
+
+    text = "\n".join(lines + ["はい", "そうですね", "はい"] * 20 + lines)
+    freq_list.process_text(text)
+
+    cached_list = JapaneseFrequencyList(line_cache_size=line_cache_size)
+    cached_list.process_text(text)
+
+    assert cached_list.wordslots == freq_list.wordslots
+    assert list(cached_list._unique_kanji) == list(freq_list._unique_kanji)
+    assert cached_list.generate_text_info() == freq_list.generate_text_info()
+    assert cached_list.line_cache_info.currsize <= line_cache_size
+
+
+def test_line_cache_info():
+    freq_list = JapaneseFrequencyList(line_cache_size=2)
+    freq_list.process_text("日本の猫\n日本の猫\n 日本の猫 \n犬\n学校\n日本の猫")
+
+    cache_info = freq_list.line_cache_info
+
+    assert cache_info.hits == 2
+    assert cache_info.misses == 4
+    assert cache_info.currsize == 2
+    assert freq_list["猫"].frequency == 4
+    assert freq_list.word_count == 10
+
+
+@pytest.mark.parametrize("line_cache_size", [1, 2, 4096])
+@pytest.mark.parametrize("tag_batch_size", [16, 4096])
+def test_line_cache_batched(line_cache_size, tag_batch_size):
+    file_path = join(dirname(abspath(__file__)), "bigtext1.txt")
+
+    with open(file_path, "r", encoding="utf-8") as fs:
+        lines = fs.read().split("\n")
+
+    lines = lines + ["はい", "そうですね", "はい"] * 20 + lines
+    batched_list = JapaneseFrequencyList(tag_batch_size=tag_batch_size)
+    batched_list.process_lines(lines)
+
+    cached_list = JapaneseFrequencyList(
+        tag_batch_size=tag_batch_size, line_cache_size=line_cache_size
+    )
+    cached_list.process_lines(lines)
+
+    assert list(cached_list._unique_words) == list(batched_list._unique_words)
+    assert list(cached_list._unique_kanji) == list(batched_list._unique_kanji)
+    assert cached_list.generate_text_info() == batched_list.generate_text_info()
+    # Lines repeated within a batch are tagged once, so fewer lines are tagged even if the cache is too small to hit
+    assert cached_list.line_cache_info.misses < len(lines)
+    assert cached_list.line_cache_info.currsize <= line_cache_size
+
+
+def test_line_cache_batched_info():
+    freq_list = JapaneseFrequencyList(tag_batch_size=16, line_cache_size=4)
+    freq_list.process_lines(["日本の猫", "犬", "日本の猫"])
+    freq_list.process_lines(["日本の猫", " 犬 ", "学校\n", ""])
+
+    cache_info = freq_list.line_cache_info
+
+    assert cache_info.hits == 2
+    assert cache_info.misses == 4
+    assert cache_info.currsize == 4
+    assert freq_list["猫"].frequency == 3
+    assert freq_list["犬"].frequency == 2
+    assert freq_list["学校"].frequency == 1
+    assert freq_list.word_count == 9
+
+
+def test_line_cache_words_not_shared():
+    freq_list = JapaneseFrequencyList(line_cache_size=16)
+    freq_list.process_line("猫")
+    freq_list.process_line("猫")
+    copied = freq_list.copy()
+    copied.process_line("猫")
+
+    assert freq_list["猫"].frequency == 2
+    assert copied["猫"].frequency == 3
+    assert copied.line_cache_info.maxsize == 16
+
+
+def test_line_cache_excluded_word_types_change():
+    freq_list = JapaneseFrequencyList(line_cache_size=16)
+    freq_list.process_line("日本の猫")
+    freq_list.excluded_word_types = [WordType.NOUN]
+    freq_list.process_line("日本の猫")
+
+    assert freq_list.line_cache_info.hits == 0
+    assert freq_list["日本"].frequency == 1
+    assert freq_list["の"].frequency == 1
+
+
+def test_line_cache_disabled(freq_list):
+    freq_list.process_line("猫")
+
+    assert freq_list.line_cache_info == (0, 0, 0, 0)
+
+
+def test_line_cache_parallel():
+    file_path = join(dirname(abspath(__file__)), "bigtext2.txt")
+
+    freq_list = JapaneseFrequencyList()
+    freq_list.process_file(file_path)
+
+    parallel_list = JapaneseFrequencyList(line_cache_size=64)
+    parallel_list.process_file(file_path, jobs=2)
+
+    assert parallel_list.wordslots == freq_list.wordslots
+
+
+def test_word_cache_info(freq_list):
+    freq_list.process_text("猫と猫と猫")
+
+    cache_info = freq_list.word_cache_info
+
+    assert cache_info.misses == 2
+    assert cache_info.hits == 3
+    assert cache_info.currsize == 2
+
+
+def test_word_cache_disabled():
+    cached_list = JapaneseFrequencyList()
+    uncached_list = JapaneseFrequencyList(word_cache_size=0)
+
+    file_path = join(dirname(abspath(__file__)), "bigtext1.txt")
+    cached_list.process_file(file_path)
+    uncached_list.process_file(file_path)
+
+    assert uncached_list.word_cache_info == (0, 0, 0, 0)
+    assert cached_list.wordslots == uncached_list.wordslots
+
+
+def test_excluded_word_types_reassigned(freq_list):
+    freq_list.excluded_word_types = [WordType.NOUN]
+
+    assert not freq_list.validate_word(Word("wow", "wow", [WordType.NOUN]))
+    assert freq_list.validate_word(Word("wow", "wow", [WordType.PARTICLE]))
+
+    freq_list.process_text("猫が好き")
+
+    assert "猫" not in freq_list
+    assert "が" in freq_list
+
+
+def test_excluded_word_types_not_shared():
+    first = JapaneseFrequencyList()
+    second = JapaneseFrequencyList()
+
+    assert first.excluded_word_types is not second.excluded_word_types
+    assert first.excluded_word_types == DEFAULT_EXCLUDED_WORD_TYPES
+
+
+@pytest.mark.parametrize("word,expected,excluded_types", word_validator_type_test_data)
+def test_word_validator_exclude_by_type(word, expected, excluded_types):
+    assert word_validator_exclude_by_type(word, excluded_types) == expected
+
+
+def test_add_kanji_counts(freq_list):
+    freq_list.process_text("日本")
+    freq_list.add_kanji_counts({"日": 2, "月": 3})
+
+    assert freq_list._unique_kanji["日"].frequency == 3
+    assert freq_list._unique_kanji["本"].frequency == 1
+    assert freq_list._unique_kanji["月"].frequency == 3
+    assert freq_list.unique_kanji == 3
+
+
+def test_process_line_with_tab(freq_list):
+    freq_list.process_line("日本\t学校")
+
+    assert freq_list.unique_kanji == 4
+
+
+def test_freq_getitem_surface(freq_list):
+    freq_list.compare_surface = True
+    freq_list.process_text("行かない")
+
+    assert freq_list["行か"] is freq_list["行く"]
+
+    with pytest.raises(KeyError):
+        freq_list["行け"]
+
+
+def test_freq_getitem_surface_disabled(freq_list):
+    freq_list.process_text("行かない")
+
+    with pytest.raises(KeyError):
+        freq_list["行か"]
+
+
+def test_compare_surface_enabled_after_processing(freq_list):
+    freq_list.process_text("今井さんが行かない")
+
+    assert "行か" not in freq_list
+
+    freq_list.compare_surface = True
+
+    assert "行か" in freq_list
+    assert "今井" in freq_list
+
+    freq_list.compare_surface = False
+
+    assert "行か" not in freq_list
+
+
+def test_compare_surface_merge_and_clear():
+    freq_list = JapaneseFrequencyList(compare_surface=True)
+    other = JapaneseFrequencyList()
+    other.process_text("行かない")
+
+    freq_list.merge(other)
+
+    assert "行か" in freq_list
+
+    freq_list.clear()
+
+    assert "行か" not in freq_list
+    assert freq_list.compare_surface
+
+
+@pytest.mark.parametrize("enable_first", [True, False])
+def test_compare_surface_shared_surface(enable_first):
+    freq_list = JapaneseFrequencyList(compare_surface=enable_first)
+    freq_list.add_word(Word("無し", "無し", []))
+    freq_list.add_word(Word("無い", "ない", []))
+    freq_list.add_word(Word("無い", "なし", []))
+    freq_list.add_word(Word("無し", "なし", []))
+    freq_list.compare_surface = True
+
+    assert freq_list["なし"] is freq_list["無し"]
+
+
+def reference_most_frequent(
+    freq_list: JapaneseFrequencyList, limit: int, minimum: int, maximum: int
+):
+    items = sorted(freq_list.wordslots, key=lambda x: x.frequency, reverse=True)
+    items = [
+        item
+        for item in items
+        if (minimum == -1 or item.frequency >= minimum)
+        and (maximum == -1 or item.frequency <= maximum)
+    ]
+
+    return items if limit == -1 else items[:limit]
+
+
+most_frequent_query_data = [
+    (limit, minimum, maximum)
+    for limit in (-1, 0, 1, 10, 100, 100000)
+    for minimum, maximum in ((-1, -1), (1, 1), (2, -1), (-1, 3), (2, 5), (5, 2), (0, 0))
+]
+
+
+@pytest.fixture(scope="module")
+def merged_big_list():
+    freq_list = JapaneseFrequencyList()
+    file_path = dirname(abspath(__file__))
+    freq_list.process_file(join(file_path, "bigtext1.txt"))
+
+    other = JapaneseFrequencyList()
+    other.process_file(join(file_path, "bigtext2.txt"))
+    freq_list.merge(other)
+
+    return freq_list
+
+
+@pytest.mark.parametrize("limit,minimum,maximum", most_frequent_query_data)
+def test_most_frequent_matches_full_sort(merged_big_list, limit, minimum, maximum):
+    expected = reference_most_frequent(merged_big_list, limit, minimum, maximum)
+    actual = merged_big_list.get_most_frequent(
+        limit=limit, minimum=minimum, maximum=maximum
+    )
+
+    assert [id(slot) for slot in actual] == [id(slot) for slot in expected]
+
+
+def test_most_frequent_range_after_clear(freq_list):
+    freq_list.process_text("猫　犬　本　本")
+    freq_list.clear()
+    freq_list.process_text("本　本　本")
+
+    assert freq_list.get_most_frequent(minimum=1) == [freq_list["本"]]
+    assert freq_list.get_most_frequent(maximum=2) == []
+
+
+def scanned_text_info(freq_list: JapaneseFrequencyList) -> TextInfo:
+    unique_words = len(freq_list.wordslots)
+    words_used_once = len([s for s in freq_list.wordslots if s.frequency == 1])
+    unique_kanji = len(freq_list._unique_kanji)
+    kanji_used_once = len(
+        [k for k in freq_list._unique_kanji.values() if k.frequency == 1]
+    )
+
+    return TextInfo(
+        freq_list.word_count,
+        unique_words,
+        words_used_once,
+        words_used_once / unique_words * 100 if unique_words else 0,
+        unique_kanji,
+        kanji_used_once,
+        kanji_used_once / unique_kanji * 100 if unique_kanji else 0,
+    )
+
+
+def test_text_info_matches_scan(freq_list):
+    file_path = dirname(abspath(__file__))
+    freq_list.process_file(join(file_path, "bigtext2.txt"))
+
+    assert freq_list.generate_text_info() == scanned_text_info(freq_list)
+
+    other = JapaneseFrequencyList()
+    other.process_file(join(file_path, "bigtext1.txt"))
+    freq_list += other
+
+    assert freq_list.generate_text_info() == scanned_text_info(freq_list)
+
+    freq_list.add_kanji(Kanji("鬱", 1))
+    freq_list.add_kanji_counts({"鬱": 1, "齉": 1})
+    freq_list.add_word(Word("齉", "齉", [WordType.NOUN]))
+
+    assert freq_list.generate_text_info() == scanned_text_info(freq_list)
+
+    freq_list.clear()
+
+    assert freq_list.generate_text_info() == TextInfo()
+
+
+def test_remove_word(freq_list):
+    freq_list.process_text("猫と犬と猫")
+    freq_list.remove_word(Word("猫", "猫", [WordType.NOUN]))
+
+    assert freq_list["猫"].frequency == 1
+    assert freq_list.word_count == 2
+    assert freq_list.get_most_frequent(minimum=2) == []
+
+    freq_list.remove_word(Word("猫", "猫", [WordType.NOUN]))
+
+    assert "猫" not in freq_list
+    assert freq_list.word_count == 1
+    assert freq_list.get_most_frequent(-1) == [freq_list["犬"]]
+    assert freq_list.generate_text_info() == scanned_text_info(freq_list)
+
+
+remove_word_error_data = [
+    (Word("鳥", "鳥", []), KeyError),
+    (Word("猫", "ねこ", []), ValueError),
+    (Word("猫", "猫", [], 2), ValueError),
+]
+
+
+@pytest.mark.parametrize("word,expected_error", remove_word_error_data)
+def test_remove_word_errors(freq_list, word, expected_error):
+    freq_list.process_text("猫")
+
+    with pytest.raises(expected_error):
+        freq_list.remove_word(word)
+
+    assert freq_list["猫"].frequency == 1
+    assert freq_list.word_count == 1
+
+
+def test_remove_kanji_counts(freq_list):
+    freq_list.process_text("日本日本")
+    freq_list.remove_kanji_counts({"日": 1, "本": 2})
+
+    assert freq_list._unique_kanji["日"].frequency == 1
+    assert "本" not in freq_list._unique_kanji
+    assert freq_list.unique_kanji_all == (1, 1, 100)
+
+    with pytest.raises(ValueError):
+        freq_list.remove_kanji_counts({"日": 2})
+
+    with pytest.raises(ValueError):
+        freq_list.remove_kanji_counts({"月": 1})
+
+
+def test_remove_everything_from_big_list():
+    file_path = dirname(abspath(__file__))
+    freq_list = JapaneseFrequencyList(compare_surface=True)
+    freq_list.process_file(join(file_path, "bigtext2.txt"))
+    removed = JapaneseFrequencyList()
+    removed.process_file(join(file_path, "bigtext1.txt"))
+    freq_list.merge(removed)
+
+    for word_slot in removed.wordslots:
+        for word in word_slot.words:
+            freq_list.remove_word(word)
+
+    freq_list.remove_kanji_counts(
+        {
+            kanji.representation: kanji.frequency
+            for kanji in removed._unique_kanji.values()
+        }
+    )
+    expected = JapaneseFrequencyList(compare_surface=True)
+    expected.process_file(join(file_path, "bigtext2.txt"))
+
+    assert sorted(freq_list._unique_words) == sorted(expected._unique_words)
+    assert {r: s.frequency for r, s in freq_list._unique_words.items()} == {
+        r: s.frequency for r, s in expected._unique_words.items()
+    }
+    assert freq_list.generate_text_info() == expected.generate_text_info()
+    assert freq_list.generate_text_info() == scanned_text_info(freq_list)
+    assert freq_list._surface_index == expected._surface_index
+    assert [s.frequency for s in freq_list.get_most_frequent(50)] == [
+        s.frequency for s in expected.get_most_frequent(50)
+    ]
+
+
+def test_remove_shared_surface():
+    freq_list = JapaneseFrequencyList(compare_surface=True)
+    freq_list.add_word(Word("無し", "なし", []))
+    freq_list.add_word(Word("無い", "なし", []))
+    freq_list.add_word(Word("成し", "なし", []))
+
+    freq_list.remove_word(Word("無し", "なし", []))
+
+    assert "無し" not in freq_list
+    assert freq_list["なし"] is freq_list["無い"]
+
+    freq_list.remove_word(Word("無い", "なし", []))
+
+    assert freq_list["なし"] is freq_list["成し"]
+
+    freq_list.remove_word(Word("成し", "なし", []))
+
+    assert "なし" not in freq_list
+    assert freq_list._shared_surfaces == set()
+
+
+def test_add_same_word_twice(freq_list):
+    word = Word("猫", "猫", [WordType.NOUN])
+    freq_list.add_word(word)
+    freq_list.add_word(word)
+
+    assert freq_list["猫"].frequency == 2
+    assert sum(word.frequency for word in freq_list["猫"].words) == 2
+    assert freq_list.word_count == 2
+    assert freq_list.get_most_frequent(minimum=2) == [freq_list["猫"]]
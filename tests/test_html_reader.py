@@ -0,0 +1,56 @@
+from jpfreq.html_reader import (
+    VisibleTextParser,
+    iter_html_file_chunks,
+    iter_html_text_chunks,
+)
+from io import StringIO
+
+import pytest
+
+html_chunks_data = [
+    ("", 10, []),
+    ("日本", 10, ["日本"]),
+    ("<p>日本</p><p>学校</p>", 10, ["日本", "学校"]),
+    ("日本<br>学校", 10, ["日本", "学校"]),
+    ("<b>日</b><i>本</i>", 10, ["日本"]),
+    ("<title>小説</title><p>本</p>", 10, ["小説", "本"]),
+    ("<script>var a = '<p>日本</p>';</script>学校", 10, ["学校"]),
+    ("<style>p { content: '日本'; }</style>学校", 10, ["学校"]),
+    ("<template><p>日本</p></template>学校", 10, ["学校"]),
+    ("<!-- 日本 -->学校", 10, ["学校"]),
+    ("猫&amp;犬&#x732B;", 10, ["猫&犬猫"]),
+    ("<div><ul><li>猫</li><li>犬</li></ul></div>", 10, ["猫", "犬"]),
+    ("<p>はい。そうです。</p>", 4, ["はい。", "そうです", "。"]),
+    ("<p>日本\n学校</p>", 10, ["日本", "学校"]),
+]
+
+
+@pytest.mark.parametrize("html,max_chunk_size,expected", html_chunks_data)
+def test_iter_html_text_chunks(html, max_chunk_size, expected):
+    chunks = list(iter_html_text_chunks(html, max_chunk_size, read_size=3))
+
+    assert [chunk for chunk in chunks if chunk.strip()] == expected
+
+
+@pytest.mark.parametrize("html,max_chunk_size,expected", html_chunks_data)
+def test_iter_html_file_chunks(html, max_chunk_size, expected):
+    chunks = list(iter_html_file_chunks(StringIO(html), max_chunk_size, read_size=2))
+
+    assert [chunk for chunk in chunks if chunk.strip()] == expected
+
+
+def test_parser_take_text():
+    parser = VisibleTextParser()
+    parser.feed("<p>日本</p><scr")
+
+    assert parser.take_text() == "\n日本\n"
+
+    parser.feed("ipt>学校</script>猫")
+    parser.close()
+
+    assert parser.take_text() == "猫"
+    assert parser.take_text() == ""
+
+
+def test_unmatched_end_tag():
+    assert list(iter_html_text_chunks("</script>日本<script>学校")) == ["日本"]
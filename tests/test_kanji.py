@@ -1,4 +1,10 @@
-from jpfreq.kanji import is_character_kanji, all_kanji_in_string, Kanji
+from jpfreq.kanji import (
+    is_character_kanji,
+    all_kanji_in_string,
+    count_kanji_in_string,
+    Kanji,
+)
+from unicodedata import name as u_name
 
 import pytest
 
@@ -53,3 +59,35 @@ kanji_in_string_test = [
 @pytest.mark.parametrize("input_string,expected", kanji_in_string_test)
 def test_all_kanji_in_string(input_string, expected):
     assert all_kanji_in_string(input_string) == expected
+
+
+def test_is_character_kanji_matches_unicode_names():
+    for code_point in range(0x110000):
+        name = u_name(chr(code_point), "")
+        expected = name.startswith("CJK UNIFIED IDEOGRAPH")
+
+        if expected or name:
+            assert is_character_kanji(chr(code_point)) == expected, hex(code_point)
+
+
+@pytest.mark.parametrize("input_character", ["\t", "\x00", " ", "🈐", "\uf900"])
+def test_is_character_kanji_not_kanji(input_character):
+    assert not is_character_kanji(input_character)
+
+
+count_kanji_in_string_data = [
+    ("", {}),
+    ("ここ", {}),
+    ("日本語", {"日": 1, "本": 1, "語": 1}),
+    ("本は本は本は", {"本": 3}),
+    ("この畑は母の畑です", {"畑": 2, "母": 1}),
+    ("𠮷野家の𠮷", {"𠮷": 2, "野": 1, "家": 1}),  # Extension B
+]
+
+
+@pytest.mark.parametrize("input_string,expected", count_kanji_in_string_data)
+def test_count_kanji_in_string(input_string, expected):
+    counts = count_kanji_in_string(input_string)
+
+    assert counts == expected
+    assert list(counts) == list(expected)
@@ -0,0 +1,48 @@
+from jpfreq.main import get_exporter
+from jpfreq.exporters.json import JsonExporter
+from jpfreq.exporters.ndjson import NdjsonExporter
+from jpfreq.exporters.csv import CsvExporter, TsvExporter
+
+from os.path import abspath, dirname, join
+import os
+import subprocess
+import sys
+
+import pytest
+
+test_get_exporter_data = [
+    ("json", JsonExporter),
+    ("ndjson", NdjsonExporter),
+    ("jsonl", NdjsonExporter),
+    ("csv", CsvExporter),
+    (" TSV ", TsvExporter),
+]
+
+
+@pytest.mark.parametrize("exporter_name, exporter_type", test_get_exporter_data)
+def test_get_exporter(exporter_name, exporter_type):
+    assert type(get_exporter(exporter_name)) is exporter_type
+
+
+def test_get_exporter_unknown():
+    with pytest.raises(ValueError):
+        get_exporter("xml")
+
+
+def test_import_is_lazy():
+    source_path = join(dirname(dirname(abspath(__file__))), "src")
+    code = (
+        "import sys, jpfreq.main; from jpfreq.jp_frequency_list import JapaneseFrequencyList; "
+        "JapaneseFrequencyList(); "
+        "print(*sorted(m for m in sys.modules if m.split('.')[0] in "
+        "('fugashi', 'asyncio', 'concurrent') or m.startswith('jpfreq.exporters')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "PYTHONPATH": source_path},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
@@ -0,0 +1,137 @@
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from jpfreq.mapped_frequency_list import MappedFrequencyList
+from jpfreq.snapshot import read_sections, _HEADER, _SECTION
+from jpfreq.word import Word
+from os.path import dirname, abspath, join
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def big_list():
+    freq_list = JapaneseFrequencyList(compare_surface=True)
+    file_path = dirname(abspath(__file__))
+    freq_list.process_files(
+        [join(file_path, "bigtext1.txt"), join(file_path, "bigtext2.txt")]
+    )
+
+    return freq_list
+
+
+@pytest.fixture()
+def mapped_list(big_list, tmp_path):
+    file_path = tmp_path / "list.jpfq"
+    big_list.save(file_path)
+
+    with MappedFrequencyList(file_path, compare_surface=True) as mapped_list:
+        yield mapped_list
+
+
+def test_counts(big_list, mapped_list):
+    assert len(mapped_list) == len(big_list)
+    assert mapped_list.word_count == big_list.word_count
+    assert mapped_list.unique_words == big_list.unique_words
+    assert mapped_list.unique_kanji == big_list.unique_kanji
+
+
+def test_getitem(big_list, mapped_list):
+    for representation, word_slot in big_list._unique_words.items():
+        assert representation in mapped_list
+        assert mapped_list[representation] == word_slot
+
+
+def test_surface_lookup(big_list, mapped_list):
+    for surface in big_list._surface_index:
+        assert surface in mapped_list
+        assert mapped_list[surface] == big_list[surface]
+
+    mapped_list.compare_surface = False
+    surfaces_only = set(big_list._surface_index) - set(big_list._unique_words)
+
+    assert surfaces_only
+    assert not any(surface in mapped_list for surface in surfaces_only)
+
+
+@pytest.mark.parametrize(
+    "word",
+    ["存在しない単語", "", "\udc80", 1, None],
+    ids=["unknown", "empty", "surrogate", "int", "none"],
+)
+def test_missing(mapped_list, word):
+    assert word not in mapped_list
+
+    with pytest.raises(KeyError):
+        mapped_list[word]
+
+    with pytest.raises(KeyError):
+        mapped_list.rank(word)
+
+
+def test_rank(big_list, mapped_list):
+    for rank, word_slot in enumerate(big_list.get_most_frequent(limit=-1), 1):
+        assert mapped_list.rank(word_slot.words[0].representation) == rank
+
+
+get_most_frequent_data = [
+    (100, -1, -1),
+    (-1, -1, -1),
+    (0, -1, -1),
+    (10, 2, -1),
+    (-1, -1, 3),
+    (50, 2, 10),
+    (-1, 5, 5),
+    (-1, 10, 2),
+    (10, 10**9, -1),
+]
+
+
+@pytest.mark.parametrize("limit,minimum,maximum", get_most_frequent_data)
+def test_get_most_frequent(big_list, mapped_list, limit, minimum, maximum):
+    assert mapped_list.get_most_frequent(
+        limit, minimum, maximum
+    ) == big_list.get_most_frequent(limit, minimum, maximum)
+
+
+def test_empty(tmp_path):
+    file_path = tmp_path / "empty.jpfq"
+    JapaneseFrequencyList().save(file_path)
+
+    with MappedFrequencyList(file_path) as mapped_list:
+        assert len(mapped_list) == 0
+        assert "猫" not in mapped_list
+        assert mapped_list.get_most_frequent(limit=-1) == []
+
+
+def test_close(big_list, tmp_path):
+    file_path = tmp_path / "list.jpfq"
+    big_list.save(file_path)
+
+    mapped_list = MappedFrequencyList(file_path)
+    mapped_list.close()
+    mapped_list.close()
+
+    with pytest.raises(ValueError):
+        "警報" in mapped_list
+
+
+def test_missing_index(tmp_path):
+    freq_list = JapaneseFrequencyList()
+    freq_list.add_word(Word("猫", "猫", []))
+    file_path = tmp_path / "list.jpfq"
+    freq_list.save(file_path)
+
+    data = bytearray(file_path.read_bytes())
+    sections = read_sections(bytes(data))
+    index = list(sections).index(b"RANK")
+    data[
+        _HEADER.size + _SECTION.size * index : _HEADER.size + _SECTION.size * index + 4
+    ] = b"XXXX"
+    file_path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        MappedFrequencyList(file_path)
+
+
+def test_not_found():
+    with pytest.raises(FileExistsError):
+        MappedFrequencyList("not_found.jpfq")
@@ -0,0 +1,60 @@
+from jpfreq.reader import SentenceChunker, iter_text_chunks, iter_file_chunks
+from io import StringIO
+
+import pytest
+
+iter_text_chunks_data = [
+    ("", 10, []),
+    ("日本", 10, ["日本"]),
+    ("日本\n学校", 10, ["日本", "学校"]),
+    ("日本\n\n学校\n", 10, ["日本", "学校"]),
+    ("はい。そうです。", 4, ["はい。", "そうです", "。"]),
+    ("はい。そうですね。", 6, ["はい。", "そうですね。"]),
+    ("はい、そうですね", 5, ["はい、", "そうですね"]),
+    ("あいうえおかきくけこ", 4, ["あいうえ", "おかきく", "けこ"]),
+    ("はい！本当？うん", 3, ["はい！", "本当？", "うん"]),
+]
+
+
+@pytest.mark.parametrize("text,max_chunk_size,expected", iter_text_chunks_data)
+def test_iter_text_chunks(text, max_chunk_size, expected):
+    assert list(iter_text_chunks(text, max_chunk_size)) == expected
+
+
+@pytest.mark.parametrize("text,max_chunk_size,expected", iter_text_chunks_data)
+def test_iter_file_chunks(text, max_chunk_size, expected):
+    assert (
+        list(iter_file_chunks(StringIO(text), max_chunk_size, read_size=3)) == expected
+    )
+
+
+@pytest.mark.parametrize("text,max_chunk_size,expected", iter_text_chunks_data)
+def test_chunker_feed_by_character(text, max_chunk_size, expected):
+    chunker = SentenceChunker(max_chunk_size)
+    chunks = []
+
+    for character in text:
+        chunks.extend(chunker.feed(character))
+        assert len(chunker._buffer) <= max_chunk_size
+
+    chunks.extend(chunker.flush())
+
+    assert chunks == expected
+
+
+def test_chunks_never_exceed_max_size():
+    text = "これは長い文です。" * 1000 + "あ" * 5000
+
+    chunks = list(iter_text_chunks(text, 100))
+
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert "".join(chunks) == text
+
+
+@pytest.mark.parametrize("max_chunk_size", [0, -1])
+def test_invalid_max_chunk_size(max_chunk_size):
+    with pytest.raises(ValueError):
+        SentenceChunker(max_chunk_size)
+
+    with pytest.raises(ValueError):
+        list(iter_text_chunks("日本", max_chunk_size))
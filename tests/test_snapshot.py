@@ -0,0 +1,121 @@
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from jpfreq.snapshot import read_snapshot, write_snapshot, MAGIC
+from jpfreq.word import Word, WordType
+from os.path import dirname, abspath, join
+from io import BytesIO
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def big_list():
+    freq_list = JapaneseFrequencyList()
+    file_path = dirname(abspath(__file__))
+    freq_list.process_files(
+        [join(file_path, "bigtext1.txt"), join(file_path, "bigtext2.txt")]
+    )
+
+    return freq_list
+
+
+def test_save_load_round_trip(big_list, tmp_path):
+    file_path = tmp_path / "list.jpfq"
+    big_list.save(file_path)
+
+    loaded = JapaneseFrequencyList.load(file_path)
+
+    assert loaded.word_count == big_list.word_count
+    assert list(loaded._unique_words) == list(big_list._unique_words)
+    assert loaded.wordslots == big_list.wordslots
+    assert loaded._unique_kanji == big_list._unique_kanji
+    assert list(loaded._unique_kanji) == list(big_list._unique_kanji)
+    assert loaded.generate_text_info() == big_list.generate_text_info()
+    assert loaded.get_most_frequent(limit=-1) == big_list.get_most_frequent(limit=-1)
+    assert loaded.get_most_frequent(
+        limit=50, minimum=2, maximum=20
+    ) == big_list.get_most_frequent(limit=50, minimum=2, maximum=20)
+
+
+def test_load_keeps_counting(big_list, tmp_path):
+    file_path = tmp_path / "list.jpfq"
+    big_list.save(file_path)
+
+    loaded = JapaneseFrequencyList.load(file_path, compare_surface=True)
+    frequency = loaded["警報"].frequency
+    loaded.process_text("警報")
+
+    assert loaded["警報"].frequency == frequency + 1
+    assert loaded.compare_surface
+
+
+def test_round_trip_empty():
+    buffer = BytesIO()
+    write_snapshot(buffer, {}, {}, 0)
+
+    assert read_snapshot(buffer.getvalue()) == ({}, {}, 0)
+
+
+def test_round_trip_plain_types():
+    freq_list = JapaneseFrequencyList()
+    freq_list.add_word(Word("猫", "猫", [WordType.NOUN, WordType.GENERAL]))
+    freq_list.add_word(Word("猫", "ねこ", []))
+
+    buffer = BytesIO()
+    write_snapshot(
+        buffer, freq_list._unique_words, freq_list._unique_kanji, freq_list.word_count
+    )
+    unique_words, _, word_count = read_snapshot(buffer.getvalue())
+
+    assert word_count == 2
+    assert [word.surface for word in unique_words["猫"].words] == ["猫", "ねこ"]
+    assert unique_words["猫"].words[0].types == (WordType.NOUN, WordType.GENERAL)
+    assert unique_words["猫"].words[1].types == ()
+
+
+def test_null_character_rejected():
+    freq_list = JapaneseFrequencyList()
+    freq_list.add_word(Word("猫\0", "猫", []))
+
+    with pytest.raises(ValueError):
+        write_snapshot(BytesIO(), freq_list._unique_words, {}, 1)
+
+
+invalid_snapshot_data = [
+    b"",
+    b"JPFQ",
+    b"NOPE" + bytes(100),
+    MAGIC + (2**16 - 1).to_bytes(2, "little") + bytes(100),
+]
+
+
+@pytest.mark.parametrize(
+    "data", invalid_snapshot_data, ids=["empty", "header", "magic", "version"]
+)
+def test_read_invalid(data):
+    with pytest.raises(ValueError):
+        read_snapshot(data)
+
+
+def test_read_truncated(big_list):
+    buffer = BytesIO()
+    write_snapshot(
+        buffer, big_list._unique_words, big_list._unique_kanji, big_list.word_count
+    )
+
+    with pytest.raises(ValueError):
+        read_snapshot(buffer.getvalue()[:-100])
+
+
+def test_load_not_found():
+    with pytest.raises(FileExistsError):
+        JapaneseFrequencyList.load("not_found.jpfq")
+
+
+def test_save_load_list_types(tmp_path):
+    file_path = tmp_path / "list.jpfq"
+    word = Word("猫", "猫", [WordType.NOUN, WordType.GENERAL])
+    freq_list = JapaneseFrequencyList()
+    freq_list.add_word(word)
+    freq_list.save(file_path)
+
+    assert JapaneseFrequencyList.load(file_path)["猫"].words == [word]
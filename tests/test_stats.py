@@ -0,0 +1,93 @@
+from jpfreq.stats import LATENCY_BOUNDS, LatencyHistogram, ProcessingStats, Stage
+from math import inf
+import json
+
+import pytest
+
+
+latency_data = [
+    (0, 0),
+    (1e-6, 0),
+    (1.5e-6, 1),
+    (1e-3, 10),
+    (0.5, 19),
+    (2, len(LATENCY_BOUNDS)),
+]
+
+
+@pytest.mark.parametrize("seconds,bucket", latency_data)
+def test_histogram_bucket(seconds, bucket):
+    histogram = LatencyHistogram()
+    histogram.add(seconds)
+
+    assert histogram.counts[bucket] == 1
+    assert len(histogram) == 1
+
+
+percentile_data = [
+    (0, 0),
+    (0.5, LATENCY_BOUNDS[0]),
+    (0.9, LATENCY_BOUNDS[10]),
+    (1, inf),
+]
+
+
+@pytest.mark.parametrize("fraction,expected", percentile_data)
+def test_histogram_percentile(fraction, expected):
+    histogram = LatencyHistogram()
+    histogram.add(1e-6, 8)
+    histogram.add(1e-3)
+    histogram.add(10)
+
+    assert histogram.percentile(fraction) == expected
+
+
+@pytest.mark.parametrize("fraction", [-0.1, 1.1])
+def test_histogram_invalid_percentile(fraction):
+    with pytest.raises(ValueError):
+        LatencyHistogram().percentile(fraction)
+
+
+def test_histogram_empty():
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(0.99) == 0
+    assert len(histogram.bounds) == len(histogram.counts)
+
+    histogram.add(1)
+    histogram.clear()
+
+    assert len(histogram) == 0
+
+
+def test_stats_record_and_reset():
+    stats = ProcessingStats()
+    stats.record(Stage.TAG, 0.5)
+    stats.record(Stage.TAG, 0.25, 3)
+    stats.lines = 10
+    stats.tokens = 40
+    stats.time = 2
+
+    assert stats.stages[Stage.TAG].time == 0.75
+    assert stats.stages[Stage.TAG].calls == 4
+    assert stats.tokens_per_second == 20
+    assert stats.lines_per_second == 5
+
+    stats.reset()
+
+    assert stats.stages[Stage.TAG].calls == 0
+    assert stats.tokens_per_second == 0
+    assert stats.lines_per_second == 0
+
+
+def test_stats_to_dict():
+    stats = ProcessingStats()
+    stats.record(Stage.PARSE, 1, 2)
+    stats.latency.add(100)
+
+    stats_dict = json.loads(json.dumps(stats.to_dict()))
+
+    assert set(stats_dict["stages"]) == {stage.value for stage in Stage}
+    assert stats_dict["stages"]["parse"] == {"time": 1, "calls": 2}
+    assert stats_dict["latency"]["bounds"][-1] is None
+    assert stats_dict["latency"]["counts"][-1] == 1
@@ -0,0 +1,53 @@
+from array import array
+from jpfreq.string_pool import StringPool
+
+import pytest
+
+
+def test_add_and_get():
+    pool = StringPool()
+    strings = [f"語{i}" for i in range(1000)] + ["", "a", "\udc80"]
+
+    ids = [pool.add(string) for string in strings]
+
+    assert ids == list(range(len(strings)))
+    assert len(pool) == len(strings)
+    assert [pool.add(string) for string in strings] == ids
+    assert [pool.get(string) for string in strings] == ids
+    assert [pool[string_id] for string_id in ids] == strings
+    assert all(string in pool for string in strings)
+
+
+@pytest.mark.parametrize("missing", ["猫", "語1000", None, 1])
+def test_get_missing(missing):
+    pool = StringPool()
+    pool.add("語1")
+
+    assert pool.get(missing) == -1
+    assert missing not in pool
+
+
+@pytest.mark.parametrize("string_id", [-1, 1, 100])
+def test_getitem_out_of_range(string_id):
+    pool = StringPool()
+    pool.add("猫")
+
+    with pytest.raises(IndexError):
+        pool[string_id]
+
+
+def test_from_encoded():
+    strings = [f"語{i}" for i in range(100)] + ["", "a"]
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = array("q", [0])
+    [offsets.append(offsets[-1] + len(string)) for string in encoded]
+
+    pool = StringPool._from_encoded(b"".join(encoded), offsets)
+
+    assert len(pool) == len(strings)
+    assert [pool[string_id] for string_id in range(len(strings))] == strings
+    assert [pool.get(string) for string in strings] == list(range(len(strings)))
+    assert pool.get("猫") == -1
+    assert pool.add("猫") == len(strings)
+    assert pool.add("語1") == 1
+    assert pool[len(strings)] == "猫"
@@ -0,0 +1,128 @@
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from jpfreq.tagger_pool import (
+    DEFAULT_TAGGER_POOL,
+    TaggerPool,
+    TaggerPoolInfo,
+    get_tagger,
+)
+from concurrent.futures import ThreadPoolExecutor
+from fugashi import Tagger
+from os.path import dirname, abspath, join
+from threading import Thread
+
+import pytest
+
+
+def tagger_in_thread(pool: TaggerPool, arguments: str = "-Owakati") -> Tagger:
+    taggers = []
+    thread = Thread(target=lambda: taggers.append(pool.get(arguments)))
+    thread.start()
+    thread.join()
+
+    return taggers[0]
+
+
+def test_same_thread_reuses_tagger():
+    pool = TaggerPool()
+    tagger = pool.get()
+
+    assert isinstance(tagger, Tagger)
+    assert pool.get() is tagger
+    assert pool.get("-Owakati") is tagger
+    assert pool.pool_info() == TaggerPoolInfo(1, 2)
+
+
+def test_arguments_get_own_tagger():
+    pool = TaggerPool()
+
+    assert pool.get("-Owakati") is not pool.get("")
+    assert pool.pool_info().created == 2
+
+
+def test_threads_get_own_tagger():
+    pool = TaggerPool()
+    tagger = pool.get()
+
+    assert tagger_in_thread(pool) is not tagger
+    assert pool.pool_info() == TaggerPoolInfo(2, 0)
+
+
+def test_clear():
+    pool = TaggerPool()
+    tagger = pool.get()
+    pool.clear()
+
+    assert pool.pool_info() == TaggerPoolInfo(0, 0)
+    assert pool.get() is not tagger
+
+
+reuse_rate_data = [
+    (TaggerPoolInfo(0, 0), 0),
+    (TaggerPoolInfo(1, 0), 0),
+    (TaggerPoolInfo(1, 3), 0.75),
+]
+
+
+@pytest.mark.parametrize("pool_info,expected", reuse_rate_data)
+def test_reuse_rate(pool_info, expected):
+    assert pool_info.reuse_rate == expected
+
+
+def test_lists_share_default_pool():
+    first_list = JapaneseFrequencyList()
+    second_list = JapaneseFrequencyList()
+    created = DEFAULT_TAGGER_POOL.pool_info().created
+
+    first_list.process_line("日本")
+    second_list.process_line("日本")
+
+    assert first_list.tagger is second_list.tagger is get_tagger()
+    assert DEFAULT_TAGGER_POOL.pool_info().created <= created + 1
+
+
+def test_list_uses_tagger_of_current_thread():
+    freq_list = JapaneseFrequencyList()
+    tagger = freq_list.tagger
+    taggers = []
+
+    thread = Thread(target=lambda: taggers.append(freq_list.tagger))
+    thread.start()
+    thread.join()
+
+    assert taggers[0] is not tagger
+    assert freq_list.tagger is tagger
+
+
+def test_shared_list_tagger_per_thread():
+    freq_list = JapaneseFrequencyList()
+
+    def same_tagger(_) -> bool:
+        return all(freq_list.tagger is get_tagger() for _ in range(1000))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert all(executor.map(same_tagger, range(8)))
+
+
+def test_provided_tagger_not_pooled():
+    tagger = Tagger("-Owakati")
+    freq_list = JapaneseFrequencyList(tagger_instance=tagger)
+
+    assert freq_list.tagger is tagger
+    assert freq_list.copy().tagger is tagger
+
+
+def test_lists_in_threads():
+    file_path = dirname(abspath(__file__))
+    files = [join(file_path, "bigtext1.txt"), join(file_path, "bigtext2.txt")] * 2
+
+    def process(file: str) -> JapaneseFrequencyList:
+        freq_list = JapaneseFrequencyList()
+        freq_list.process_file(file)
+
+        return freq_list
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        thread_lists = list(executor.map(process, files))
+
+    for file, thread_list in zip(files, thread_lists):
+        assert thread_list.wordslots == process(file).wordslots
@@ -0,0 +1,155 @@
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from jpfreq.text_info import TextInfo
+from jpfreq.windowed_frequency_list import WindowedJapaneseFrequencyList
+from jpfreq.word import WordType
+from fugashi import Tagger
+from os.path import dirname, abspath, join
+
+import pytest
+
+file_path = dirname(abspath(__file__))
+
+
+@pytest.fixture(scope="module")
+def messages():
+    with open(join(file_path, "bigtext2.txt"), "r", encoding="utf-8") as fs:
+        return [line for line in fs.read().split("\n") if line][:300]
+
+
+def expected_list(documents: list[str]) -> JapaneseFrequencyList:
+    freq_list = JapaneseFrequencyList(compare_surface=True)
+    [freq_list.process_text(document) for document in documents]
+
+    return freq_list
+
+
+@pytest.mark.parametrize("max_documents", [1, 10, 100])
+def test_max_documents(messages, max_documents, counts):
+    freq_list = WindowedJapaneseFrequencyList(
+        max_documents=max_documents, compare_surface=True
+    )
+
+    for end, message in enumerate(messages, 1):
+        freq_list.add_document(message)
+
+        if end % 37 == 0 or end == len(messages):
+            expected = expected_list(messages[max(end - max_documents, 0) : end])
+
+            assert freq_list.documents == min(end, max_documents)
+            assert counts(freq_list) == counts(expected)
+            assert freq_list.generate_text_info() == expected.generate_text_info()
+            assert freq_list._surface_index.keys() == expected._surface_index.keys()
+            assert [
+                word_slot.frequency for word_slot in freq_list.get_most_frequent(20)
+            ] == [word_slot.frequency for word_slot in expected.get_most_frequent(20)]
+
+
+def test_max_age(messages, counts):
+    freq_list = WindowedJapaneseFrequencyList(max_age=60)
+
+    for second, message in enumerate(messages):
+        freq_list.add_document(message, timestamp=second)
+
+    assert freq_list.documents == 60
+    assert counts(freq_list) == counts(expected_list(messages[-60:]))
+
+    assert freq_list.expire(now=len(messages) + 29) == 30
+    assert counts(freq_list) == counts(expected_list(messages[-30:]))
+
+    assert freq_list.expire(now=10**6) == 30
+    assert freq_list.documents == 0
+    assert len(freq_list) == 0
+    assert freq_list.generate_text_info() == TextInfo()
+    assert freq_list._frequency_buckets == {}
+
+
+def test_unbounded_window(messages, counts):
+    freq_list = WindowedJapaneseFrequencyList()
+    [freq_list.add_document(message) for message in messages]
+
+    assert freq_list.expire() == 0
+    assert freq_list.documents == len(messages)
+    assert counts(freq_list) == counts(expected_list(messages))
+
+
+most_frequent_data = [(10, -1, -1), (0, -1, -1), (-1, -1, -1), (5, 2, -1), (50, 1, 3)]
+
+
+@pytest.mark.parametrize("limit,minimum,maximum", most_frequent_data)
+def test_get_most_frequent(messages, limit, minimum, maximum):
+    freq_list = WindowedJapaneseFrequencyList(max_documents=50)
+    [freq_list.add_document(message) for message in messages]
+    plain_list = JapaneseFrequencyList()
+    plain_list._absorb(*freq_list._counts(), copy=True)
+
+    assert [
+        word_slot.words
+        for word_slot in freq_list.get_most_frequent(limit, minimum, maximum)
+    ] == [
+        word_slot.words
+        for word_slot in plain_list.get_most_frequent(limit, minimum, maximum)
+    ]
+
+
+def test_permanent_counts_never_expire():
+    freq_list = WindowedJapaneseFrequencyList(max_documents=1)
+    freq_list.process_text("猫")
+    freq_list.add_document("猫と犬")
+    freq_list.add_document("鳥")
+
+    assert freq_list["猫"].frequency == 1
+    assert "犬" not in freq_list
+    assert freq_list.word_count == 2
+
+
+def test_excluded_word_types_change():
+    freq_list = WindowedJapaneseFrequencyList(max_documents=2)
+    freq_list.add_document("猫と犬")
+    freq_list.excluded_word_types = [WordType.NOUN]
+    freq_list.add_document("猫と犬")
+
+    assert freq_list["猫"].frequency == 1
+    assert freq_list["と"].frequency == 1
+
+    freq_list.add_document("")
+
+    assert "猫" not in freq_list
+    assert freq_list["と"].frequency == 1
+
+
+def test_documents_use_tagger_instance():
+    tagger = Tagger()
+    freq_list = WindowedJapaneseFrequencyList(tagger_instance=tagger, max_documents=1)
+    freq_list.add_document("猫と犬")
+
+    assert freq_list._document_list.tagger is tagger
+    assert freq_list["猫"].frequency == 1
+
+
+def test_copy_and_clear():
+    freq_list = WindowedJapaneseFrequencyList(max_documents=2, max_age=100)
+    freq_list.add_document("猫", timestamp=0)
+    freq_list.add_document("犬", timestamp=1)
+    copied = freq_list.copy()
+
+    assert (copied.max_documents, copied.max_age, copied.documents) == (2, 100, 2)
+
+    copied.add_document("鳥", timestamp=2)
+
+    assert "猫" not in copied
+    assert "猫" in freq_list
+
+    freq_list.clear()
+
+    assert freq_list.documents == 0
+    assert len(freq_list) == 0
+    assert copied.documents == 2
+
+
+init_error_data = [{"max_documents": -1}, {"max_age": -1}]
+
+
+@pytest.mark.parametrize("kwargs", init_error_data)
+def test_init_errors(kwargs):
+    with pytest.raises(ValueError):
+        WindowedJapaneseFrequencyList(**kwargs)
@@ -1,4 +1,15 @@
-from jpfreq.word import Word, WordType
+import pickle
+from jpfreq.jp_frequency_list import JapaneseFrequencyList
+from jpfreq.word import (
+    Word,
+    WordType,
+    WordTypes,
+    intern_word_types,
+    word_types_from_pos,
+    word_types_mask,
+)
+from jpfreq.cache import LRUCache
+from fugashi import Tagger
 
 import pytest
 
@@ -26,3 +37,117 @@ to_dict_data = [
 @pytest.mark.parametrize("word, expected_dict", to_dict_data)
 def test_to_dict(word, expected_dict):
     assert word.to_dict() == expected_dict
+
+
+@pytest.mark.parametrize("text", ["これは日本語です", "行かれる", "クール"])
+def test_from_node_cached_matches_uncached(text):
+    tagger = Tagger("-Owakati")
+    cache = LRUCache(16)
+
+    for node in tagger(text):
+        expected = Word.from_node(node)
+
+        assert Word.from_node(node, cache) == expected
+        assert Word.from_node(node, cache) == expected
+
+    assert cache.cache_info().hits == cache.cache_info().misses
+
+
+def test_from_node_cache_evicts():
+    tagger = Tagger("-Owakati")
+    cache = LRUCache(1)
+
+    [Word.from_node(node, cache) for node in tagger("これは日本語です")]
+
+    assert len(cache) == 1
+
+
+def test_intern_word_types():
+    word_types = intern_word_types([WordType.NOUN, WordType.GENERAL])
+
+    assert isinstance(word_types, WordTypes)
+    assert word_types is intern_word_types((WordType.NOUN, WordType.GENERAL))
+    assert word_types is not intern_word_types([WordType.GENERAL, WordType.NOUN])
+    assert word_types == (WordType.NOUN, WordType.GENERAL)
+
+
+word_types_from_pos_data = [
+    ("名詞,普通名詞,一般,*", (WordType.NOUN, WordType.COMMON_NOUN, WordType.GENERAL)),
+    ("名詞,普通名詞,一般", (WordType.NOUN, WordType.COMMON_NOUN, WordType.GENERAL)),
+    ("助詞,係助詞,*,*", (WordType.PARTICLE, WordType.BINDING_PARTICLE)),
+    ("", ()),
+]
+
+
+@pytest.mark.parametrize("pos,expected", word_types_from_pos_data)
+def test_word_types_from_pos(pos, expected):
+    word_types = word_types_from_pos(pos)
+
+    assert word_types == expected
+    assert word_types is word_types_from_pos(pos)
+    assert word_types is intern_word_types(expected)
+
+
+word_types_mask_data = [
+    ([], []),
+    ([WordType.NOUN], [WordType.NOUN]),
+    ([WordType.NOUN, WordType.VERB], [WordType.VERB, WordType.NOUN]),
+]
+
+
+@pytest.mark.parametrize("word_types,same_types", word_types_mask_data)
+def test_word_types_mask(word_types, same_types):
+    assert word_types_mask(word_types) == word_types_mask(same_types)
+    assert intern_word_types(word_types).mask == word_types_mask(word_types)
+
+
+def test_word_types_mask_distinct():
+    masks = [word_types_mask([word_type]) for word_type in WordType]
+
+    assert len(set(masks)) == len(masks)
+    assert all(mask.bit_count() == 1 for mask in masks)
+
+
+def test_word_types_pickle_interned():
+    word_types = intern_word_types([WordType.VERB, WordType.GENERAL])
+
+    assert pickle.loads(pickle.dumps(word_types)) is word_types
+
+
+def test_from_node_shares_types():
+    tagger = Tagger("-Owakati")
+    first, second = [Word.from_node(node) for node in tagger("猫猫")]
+
+    assert first.types is second.types
+    assert isinstance(first.types, WordTypes)
+
+
+@pytest.mark.parametrize(
+    "types", [[], [WordType.NOUN], (WordType.NOUN, WordType.GENERAL)]
+)
+def test_types_interned(types):
+    word = Word("test", "test", types)
+
+    assert isinstance(word.types, WordTypes)
+    assert word.types is intern_word_types(types)
+    assert word == Word("test", "test", list(types))
+    assert word == Word("test", "test", tuple(types))
+
+
+def test_word_with_list_types_in_slot():
+    freq_list = JapaneseFrequencyList()
+    freq_list.process_line("日本")
+
+    assert (
+        Word(
+            "日本",
+            "日本",
+            [
+                WordType.NOUN,
+                WordType.PROPER_NOUN,
+                WordType.PLACE_NAME,
+                WordType.COUNTRY,
+            ],
+        )
+        in freq_list["日本"]
+    )
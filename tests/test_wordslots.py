@@ -266,3 +266,125 @@ def test_wordslot_add_word(
     assert len(word_slot.words) == expected_len
 
     assert word_slot == WordSlot(starting_words + added_words)
+
+
+def test_wordslot_merge():
+    word_slot = WordSlot([Word("test", "test", [], 1)])
+    other = WordSlot([Word("test", "test", [], 2), Word("test", "test2", [], 1)])
+
+    word_slot.merge(other)
+
+    assert word_slot.frequency == 4
+    assert len(word_slot.words) == 2
+    assert other.frequency == 3
+
+    assert word_slot.words[1] == other.words[1]
+    assert word_slot.words[1] is not other.words[1]
+
+
+def test_wordslot_copy():
+    word_slot = WordSlot([Word("test", "test", [], 1)])
+    copied = word_slot.copy()
+
+    assert copied == word_slot
+
+    copied.add_word(Word("test", "test", [], 1))
+
+    assert word_slot.frequency == 1
+    assert copied.frequency == 2
+
+
+def test_wordslot_to_dict_combine_leaves_words_unchanged():
+    word_slot = WordSlot([Word("test", "test", [], 1), Word("test", "test2", [], 2)])
+
+    assert word_slot.to_dict(combine=True)["frequency"] == 3
+    assert word_slot.to_dict(combine=True)["frequency"] == 3
+    assert [word.frequency for word in word_slot.words] == [1, 2]
+
+
+def test_wordslot_frequency_tracks_added_words():
+    word_slot = WordSlot([])
+
+    for frequency in range(1, 5):
+        word_slot.add_word(Word("test", f"test{frequency % 2}", [], frequency))
+
+    assert word_slot.frequency == 10
+    assert len(word_slot) == 10
+    assert sum(word.frequency for word in word_slot.words) == 10
+
+
+def test_wordslot_eq_other_type():
+    assert WordSlot([]) != []
+
+
+def test_wordslot_repr():
+    word_slot = WordSlot([Word("test", "test", [], 1)])
+
+    assert repr(word_slot) == f"WordSlot(words={[Word('test', 'test', [], 1)]!r})"
+
+
+wordslot_remove_word_data = [
+    ([Word("test", "test", [], 3)], Word("test", "test", [], 1), 2, 1),
+    ([Word("test", "test", [], 3)], Word("test", "test", [], 3), 0, 0),
+    (
+        [Word("test", "test", [], 1), Word("test", "test2", [], 2)],
+        Word("test", "test", [], 1),
+        2,
+        1,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "starting_words, removed_word, expected_frequency, expected_len",
+    wordslot_remove_word_data,
+    ids=wordslot_add_word_idfn,
+)
+def test_wordslot_remove_word(
+    starting_words, removed_word, expected_frequency, expected_len
+):
+    word_slot = WordSlot(starting_words)
+    word_slot.remove_word(removed_word)
+
+    assert word_slot.frequency == expected_frequency
+    assert len(word_slot.words) == expected_len
+    assert sum(word.frequency for word in word_slot.words) == expected_frequency
+
+
+wordslot_remove_word_error_data = [
+    ([], Word("test", "test", [], 1)),
+    ([Word("test", "test", [], 1)], Word("test", "test", [], 2)),
+    ([Word("test", "test", [], 1)], Word("test", "other", [], 1)),
+]
+
+
+@pytest.mark.parametrize(
+    "starting_words, removed_word",
+    wordslot_remove_word_error_data,
+    ids=wordslot_add_word_idfn,
+)
+def test_wordslot_remove_word_error(starting_words, removed_word):
+    word_slot = WordSlot(starting_words)
+
+    with pytest.raises(ValueError):
+        word_slot.remove_word(removed_word)
+
+    assert word_slot.frequency == sum(word.frequency for word in starting_words)
+
+
+def test_wordslot_add_stored_word():
+    word = Word("test", "test", [], 1)
+    word_slot = WordSlot([word])
+    word_slot.add_word(word)
+
+    assert word.frequency == 2
+    assert word_slot.frequency == 2
+
+
+def test_wordslot_remove_stored_word():
+    word = Word("test", "test", [], 2)
+    word_slot = WordSlot([word])
+    word_slot.remove_word(word)
+
+    assert word_slot.frequency == 0
+    assert word_slot.words == []